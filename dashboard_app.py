@@ -1,22 +1,135 @@
 import asyncio
-import json
 import os
+import time
+from array import array
+from bisect import bisect_left
 from datetime import datetime
+from functools import lru_cache
+from itertools import groupby
 
 from textual.app import App, ComposeResult
 from textual.containers import Horizontal, Vertical
 from textual.widgets import Static
 from rich.console import Group
 from rich.panel import Panel
-from rich.table import Table
 from rich.text import Text
 
+from modules.console_wire import MAX_FRAME_BYTES, SnapshotStream, is_patch_frame, loads
+
 try:
     import websockets
 except ImportError:
     websockets = None
 
 
+FEED_QUEUE_SIZE = 32
+REFRESH_MIN_INTERVAL = 0.25
+
+# Bar strength buckets: bisect_left over these thresholds reproduces the old `> 0.8 / > 0.6 / ...` ladder.
+_BAR_THRESHOLDS = (0.2, 0.4, 0.6, 0.8)
+_BODY_CHARS = "▃▅▆▇█"
+_WICK_CHARS = "╵││┃┃"
+_BUCKET_CODES = "01234"
+_BODY_TABLE = str.maketrans(_BUCKET_CODES, _BODY_CHARS)
+_WICK_TABLE = str.maketrans(_BUCKET_CODES, _WICK_CHARS)
+
+_TABS_PREFIX = Text.assemble(
+    ("cpu", "#2bd66f"),
+    ("|", "#9aa5b1"),
+    ("mem", "#f5d90a"),
+    ("|", "#9aa5b1"),
+    ("net", "#b46cff"),
+    ("|", "#9aa5b1"),
+    ("proc", "#ff5555"),
+    ("  menu  mini  ", "#718096"),
+)
+
+# Snapshot keys each panel renders from; a patch only rebuilds panels whose keys it touched.
+_MEM_INFO_COLUMNS = (("k", "<8", "#f5d90a"), ("v", ">16", "#e2e8f0"))
+_MEM_POS_COLUMNS = (("asset", "<10", "#67e8f9"), ("side", "<6", None), ("entry", ">14", None), ("rem", ">12", None))
+_NET_PRICE_COLUMNS = (("asset", "<10", "#67e8f9"), ("px", ">14", None), ("a1", ">10", None), ("a6", ">10", None))
+_PROC_RUMOR_COLUMNS = (("asset", "<8", "#67e8f9"), ("sent", ">6", None), ("pump", "^5", None), ("headline", "<56", None))
+
+_PANEL_KEYS = {
+    "cpu": {
+        "parked",
+        "ready_to_trade",
+        "mode",
+        "focus_asset",
+        "top_histories",
+        "focus_price_history",
+        "equity",
+        "equity_raw",
+        "sim_realized_pnl",
+        "basket_size",
+        "price_count",
+        "open_trades_count",
+    },
+    "mem": {"equity", "aggr_target", "safe_target", "open_trades"},
+    "net": {"top_prices", "focus_asset", "top_histories", "focus_price_history"},
+    "proc": {
+        "last_decision",
+        "last_decision_asset",
+        "last_decision_ts",
+        "last_decision_reason_short",
+        "rumors_summary",
+        "rumor_headlines",
+    },
+}
+
+
+def _fmt_ts(ts):
+    if ts:
+        try:
+            return datetime.fromisoformat(str(ts).replace("Z", "+00:00")).strftime("%H:%M:%S")
+        except ValueError:
+            pass
+    return "--:--:--"
+
+
+_SPARK_CHARS = "▁▂▃▄▅▆▇█"
+_SPARK_MAX = len(_SPARK_CHARS) - 1
+_NUMERIC_TYPES = (int, float)
+
+
+def _grid(columns, rows, header=True):
+    # Fixed-width columns: (title, format spec, style). Cells are clipped to the
+    # column width and padded with format() so Rich never has to measure a table.
+    widths = [int(spec[1:]) for _, spec, _ in columns]
+    tokens = []
+    if header:
+        for (title, spec, _), width in zip(columns, widths):
+            tokens.append((format(title[:width], spec) + " ", "bold"))
+        tokens.append(("\n", None))
+    for row in rows:
+        for cell, (_, spec, style), width in zip(row, columns, widths):
+            tokens.append((format(cell[:width], spec) + " ", style))
+        tokens.append(("\n", None))
+    text = Text()
+    text.append_tokens(tokens)
+    text.rstrip()
+    return text
+
+
+def _ohlc(values, step):
+    # Opens and closes are strided slices, so only high/low walk the chunks.
+    # A trailing single-point chunk is dropped, matching the old per-chunk loop.
+    size = len(values)
+    opens = values[0 : size - 1 : step]
+    closes = values[step - 1 : size : step]
+    if len(closes) < len(opens):
+        closes = closes + values[-1:]
+    chunks = [values[index : index + step] for index in range(0, size - 1, step)]
+    return {"open": opens, "high": list(map(max, chunks)), "low": list(map(min, chunks)), "close": closes}
+
+
+@lru_cache(maxsize=64)
+def _spark_glyphs(points):
+    low = min(points)
+    scale = _SPARK_MAX / max(max(points) - low, 1e-9)
+    return "".join([_SPARK_CHARS[int((v - low) * scale)] for v in points])
+
+
 class TradingDashboard(App):
     TITLE = "Trading btop Console"
     BINDINGS = [
@@ -106,12 +219,14 @@ class TradingDashboard(App):
             "last_decision": "n/a",
             "last_decision_asset": None,
             "last_decision_reason": "",
+            "last_decision_reason_short": "",
             "last_decision_ts": None,
             "focus_asset": None,
             "focus_price_history": [],
         }
         self.last_error = ""
-        self.selected_asset = None
+        self._clock_str = "--:--:--"
+        self.selected_index = None
         self.ws_url = os.getenv("DASHBOARD_WS_URL", "ws://127.0.0.1:8765")
         self.park_flag = self._resolve_park_flag()
         self.shown_boxes = {"cpu", "mem", "net", "proc"}
@@ -122,6 +237,12 @@ class TradingDashboard(App):
             ("user", {"cpu", "mem", "net", "proc"}),
         ]
         self.view_mode_index = 0
+        self._snap_rev = 0
+        self._rendered_rev = -1
+        self._rendered_view = None
+        self._dirty_panels = set(_PANEL_KEYS)
+        self._refresh_pending = False
+        self._last_refresh = 0.0
 
     def _resolve_park_flag(self):
         env_override = os.getenv("PARK_FLAG")
@@ -129,8 +250,8 @@ class TradingDashboard(App):
             return env_override
         path = os.getenv("CONFIG_JSON_PATH", "config.json")
         try:
-            with open(path, "r", encoding="utf-8") as handle:
-                data = json.load(handle)
+            with open(path, "rb") as handle:
+                data = loads(handle.read())
             return str(data.get("PARK_FLAG") or "parked.flag").strip() or "parked.flag"
         except Exception:
             return "parked.flag"
@@ -150,28 +271,103 @@ class TradingDashboard(App):
                 yield Static(id="proc_panel")
 
     async def on_mount(self) -> None:
-        self.set_interval(1.0, self._refresh_ui)
+        self._request_refresh()
         self.run_worker(self._feed_loop(), exclusive=True)
 
     async def _feed_loop(self):
         if websockets is None:
             self.last_error = "Missing websockets package"
+            self._request_refresh()
             return
 
         while True:
             try:
-                async with websockets.connect(self.ws_url, ping_interval=15, ping_timeout=15) as ws:
+                async with websockets.connect(
+                    self.ws_url, ping_interval=15, ping_timeout=15, max_size=MAX_FRAME_BYTES
+                ) as ws:
                     self.last_error = ""
-                    async for message in ws:
-                        payload = json.loads(message)
-                        if isinstance(payload, dict):
-                            self.snapshot = payload
+                    stream = SnapshotStream()
+                    queue = asyncio.Queue(maxsize=FEED_QUEUE_SIZE)
+                    reader = asyncio.create_task(self._pump_frames(ws, queue))
+                    try:
+                        while True:
+                            frames = [await queue.get()]
+                            while not queue.empty():
+                                frames.append(queue.get_nowait())
+                            if frames[-1] is None:
+                                raise ConnectionError(self.last_error or "feed closed")
+                            await self._apply_frames(ws, stream, frames)
+                    finally:
+                        reader.cancel()
             except Exception as exc:
                 self.last_error = str(exc)
+                self._request_refresh()
                 await asyncio.sleep(2)
 
-    def _assets(self):
-        return [row.get("asset") for row in (self.snapshot.get("top_prices") or []) if row.get("asset")]
+    async def _pump_frames(self, ws, queue):
+        try:
+            async for message in ws:
+                await queue.put(message)
+        except Exception as exc:
+            self.last_error = str(exc)
+        finally:
+            while queue.full():
+                queue.get_nowait()
+            queue.put_nowait(None)
+
+    async def _apply_frames(self, ws, stream, frames):
+        # Latest wins: anything queued before the newest full frame is superseded,
+        # so only that frame and the patches after it get decoded.
+        start = 0
+        for index in range(len(frames) - 1, -1, -1):
+            if not is_patch_frame(frames[index]):
+                start = index
+                break
+
+        changed = set()
+        applied = False
+        for message in frames[start:]:
+            if stream.feed(message):
+                applied = True
+                changed = None if changed is None or stream.changed_keys is None else changed | stream.changed_keys
+            elif stream.request_resync:
+                stream.request_resync = False
+                await ws.send("resync")
+
+        if not applied:
+            return
+        self.snapshot = stream.snapshot
+        if changed is None or "ts" in changed:
+            self._clock_str = _fmt_ts(self.snapshot.get("ts"))
+        self._mark_dirty(changed)
+
+    def _mark_dirty(self, changed_keys):
+        self._snap_rev += 1
+        if changed_keys is None:
+            self._dirty_panels.update(_PANEL_KEYS)
+        else:
+            self._dirty_panels.update(name for name, keys in _PANEL_KEYS.items() if keys & changed_keys)
+        self._request_refresh()
+
+    def _request_refresh(self):
+        # Frames and key presses schedule a repaint; bursts collapse into one every REFRESH_MIN_INTERVAL.
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        delay = max(0.0, self._last_refresh + REFRESH_MIN_INTERVAL - time.monotonic())
+        self.set_timer(delay, self._run_refresh)
+
+    def _run_refresh(self):
+        self._refresh_pending = False
+        self._last_refresh = time.monotonic()
+        self._refresh_ui()
+
+    @property
+    def selected_asset(self):
+        prices = self.snapshot.get("top_prices") or []
+        if self.selected_index is None or not prices:
+            return None
+        return prices[self.selected_index % len(prices)].get("asset")
 
     def _set_park(self, parked):
         if parked:
@@ -180,29 +376,26 @@ class TradingDashboard(App):
         elif os.path.exists(self.park_flag):
             os.remove(self.park_flag)
         self.snapshot["parked"] = parked
+        self._mark_dirty({"parked"})
 
     def action_toggle_park(self):
         self._set_park(not bool(self.snapshot.get("parked")))
 
-    def action_prev_asset(self):
-        assets = self._assets()
-        if not assets:
-            return
-        if self.selected_asset not in assets:
-            self.selected_asset = assets[0]
+    def _step_asset(self, offset):
+        count = len(self.snapshot.get("top_prices") or [])
+        if not count:
             return
-        index = assets.index(self.selected_asset)
-        self.selected_asset = assets[(index - 1) % len(assets)]
+        if self.selected_index is None:
+            self.selected_index = 0
+        else:
+            self.selected_index = (self.selected_index + offset) % count
+        self._request_refresh()
+
+    def action_prev_asset(self):
+        self._step_asset(-1)
 
     def action_next_asset(self):
-        assets = self._assets()
-        if not assets:
-            return
-        if self.selected_asset not in assets:
-            self.selected_asset = assets[0]
-            return
-        index = assets.index(self.selected_asset)
-        self.selected_asset = assets[(index + 1) % len(assets)]
+        self._step_asset(1)
 
     def _toggle_box(self, name):
         if name in self.shown_boxes:
@@ -210,6 +403,7 @@ class TradingDashboard(App):
                 self.shown_boxes.remove(name)
         else:
             self.shown_boxes.add(name)
+        self._request_refresh()
 
     def action_toggle_cpu(self):
         self._toggle_box("cpu")
@@ -227,83 +421,53 @@ class TradingDashboard(App):
         self.view_mode_index = (self.view_mode_index + 1) % len(self.view_modes)
         _, boxes = self.view_modes[self.view_mode_index]
         self.shown_boxes = set(boxes)
+        self._request_refresh()
 
     def _sparkline(self, values, width=120):
-        points = [float(v) for v in values if isinstance(v, (int, float))]
+        points = values if type(values) is array else [v for v in values if type(v) in _NUMERIC_TYPES]
         if not points:
             return "·" * min(width, 40)
         if len(points) > width:
             step = max(1, len(points) // width)
             points = points[::step][:width]
-        chars = "▁▂▃▄▅▆▇█"
-        low = min(points)
-        high = max(points)
-        span = max(high - low, 1e-9)
-        return "".join(chars[int((v - low) / span * (len(chars) - 1))] for v in points)
+        return _spark_glyphs(tuple(points))
 
     def _aggregate_ohlc(self, history, bins=64):
-        values = [float(v) for v in history if isinstance(v, (int, float))]
+        values = history if type(history) is array else [v for v in history if type(v) in _NUMERIC_TYPES]
         if len(values) < 6:
-            return []
-        step = max(2, len(values) // bins)
-        out = []
-        for index in range(0, len(values), step):
-            chunk = values[index : index + step]
-            if len(chunk) < 2:
-                continue
-            out.append({"open": chunk[0], "high": max(chunk), "low": min(chunk), "close": chunk[-1]})
-        return out
-
-    def _icicle_rows(self, ohlc_rows):
-        if not ohlc_rows:
+            return {"open": [], "high": [], "low": [], "close": []}
+        return _ohlc(values, max(2, len(values) // bins))
+
+    def _icicle_rows(self, ohlc):
+        if not ohlc["open"]:
             return Text("insufficient history", style="#f5d90a"), Text()
 
-        spreads = [row["high"] - row["low"] for row in ohlc_rows]
+        spreads = [high - low for high, low in zip(ohlc["high"], ohlc["low"])]
         scale = max(max(spreads), 1e-9)
 
+        codes = "".join([_BUCKET_CODES[bisect_left(_BAR_THRESHOLDS, spread / scale)] for spread in spreads])
+        wicks = codes.translate(_WICK_TABLE)
+        bodies = codes.translate(_BODY_TABLE)
+        rising = [close_price >= open_price for open_price, close_price in zip(ohlc["open"], ohlc["close"])]
+
         wick_row = Text()
         body_row = Text()
-        for row in ohlc_rows:
-            spread = row["high"] - row["low"]
-            strength = spread / scale
-            if strength > 0.8:
-                body, wick = "█", "┃"
-            elif strength > 0.6:
-                body, wick = "▇", "┃"
-            elif strength > 0.4:
-                body, wick = "▆", "│"
-            elif strength > 0.2:
-                body, wick = "▅", "│"
-            else:
-                body, wick = "▃", "╵"
-            style = "#36ff87" if row["close"] >= row["open"] else "#ff5f6d"
-            wick_row.append(wick, style=style)
-            body_row.append(body, style=style)
+        start = 0
+        for up, run in groupby(rising):
+            end = start + sum(1 for _ in run)
+            style = "#36ff87" if up else "#ff5f6d"
+            wick_row.append(wicks[start:end], style=style)
+            body_row.append(bodies[start:end], style=style)
+            start = end
         return wick_row, body_row
 
     def _tabs_panel(self):
-        ts = self.snapshot.get("ts")
-        clock = "--:--:--"
-        if ts:
-            try:
-                clock = datetime.fromisoformat(str(ts).replace("Z", "+00:00")).strftime("%H:%M:%S")
-            except ValueError:
-                pass
-
         mode_name, _ = self.view_modes[self.view_mode_index]
         shown = " ".join([name for name in ["cpu", "mem", "net", "proc"] if name in self.shown_boxes])
         focus = self.selected_asset or self.snapshot.get("focus_asset") or "-"
 
-        text = Text()
-        text.append("cpu", style="#2bd66f")
-        text.append("|", style="#9aa5b1")
-        text.append("mem", style="#f5d90a")
-        text.append("|", style="#9aa5b1")
-        text.append("net", style="#b46cff")
-        text.append("|", style="#9aa5b1")
-        text.append("proc", style="#ff5555")
-        text.append("  menu  mini  ", style="#718096")
-        text.append(f"view:{mode_name}  boxes:{shown}  focus:{focus}  {clock}", style="#d7dce2")
+        text = _TABS_PREFIX.copy()
+        text.append(f"view:{mode_name}  boxes:{shown}  focus:{focus}  {self._clock_str}", style="#d7dce2")
         if self.last_error:
             text.append(f"  feed:{self.last_error}", style="#ff6b6b")
         return Panel(text, border_style="#2bd66f")
@@ -341,29 +505,23 @@ class TradingDashboard(App):
         aggr = float(snap.get("aggr_target") or 0)
         safe = float(snap.get("safe_target") or 0)
 
-        info = Table(show_header=False, expand=True)
-        info.add_column("k", style="#f5d90a")
-        info.add_column("v", justify="right", style="#e2e8f0")
-        info.add_row("Total", f"${eq:,.2f}")
-        info.add_row("Agg", f"${aggr:,.2f}")
-        info.add_row("Safe", f"${safe:,.2f}")
-
-        pos = Table(show_header=True, expand=True)
-        pos.add_column("asset", style="#67e8f9")
-        pos.add_column("side")
-        pos.add_column("entry", justify="right")
-        pos.add_column("rem", justify="right")
+        info = _grid(
+            _MEM_INFO_COLUMNS,
+            [("Total", f"${eq:,.2f}"), ("Agg", f"${aggr:,.2f}"), ("Safe", f"${safe:,.2f}")],
+            header=False,
+        )
 
         open_trades = snap.get("open_trades") or []
-        for trade in open_trades[:8]:
-            pos.add_row(
+        rows = [
+            (
                 str(trade.get("asset") or "-"),
                 str(trade.get("side") or "-"),
                 f"{float(trade.get('entry') or 0):.5f}",
                 f"{float(trade.get('remaining_size') or 0):.4f}",
             )
-        if not open_trades:
-            pos.add_row("-", "-", "-", "-")
+            for trade in open_trades[:8]
+        ]
+        pos = _grid(_MEM_POS_COLUMNS, rows or [("-", "-", "-", "-")])
 
         return Panel(Group(info, pos), title="mem", border_style="#f5d90a")
 
@@ -371,8 +529,8 @@ class TradingDashboard(App):
         prices = self.snapshot.get("top_prices") or []
         focus = self.selected_asset or self.snapshot.get("focus_asset")
         history = (self.snapshot.get("top_histories") or {}).get(focus) or self.snapshot.get("focus_price_history") or []
-        ohlc_rows = self._aggregate_ohlc(history)
-        wick_row, body_row = self._icicle_rows(ohlc_rows)
+        ohlc = self._aggregate_ohlc(history)
+        wick_row, body_row = self._icicle_rows(ohlc)
 
         chart = Text()
         chart.append(f"focus:{focus or '-'}\n", style="#d7dce2")
@@ -380,20 +538,16 @@ class TradingDashboard(App):
         chart.append("\n")
         chart.append_text(body_row)
 
-        table = Table(show_header=True, expand=True)
-        table.add_column("asset", style="#67e8f9")
-        table.add_column("px", justify="right")
-        table.add_column("a1", justify="right")
-        table.add_column("a6", justify="right")
-        for row in prices[:8]:
-            table.add_row(
+        rows = [
+            (
                 str(row.get("asset") or ""),
                 f"{float(row.get('price') or 0):.5f}",
                 f"{float(row.get('atr_1h') or 0):.4f}" if row.get("atr_1h") is not None else "-",
                 f"{float(row.get('atr_6h') or 0):.4f}" if row.get("atr_6h") is not None else "-",
             )
-        if not prices:
-            table.add_row("-", "-", "-", "-")
+            for row in prices[:8]
+        ]
+        table = _grid(_NET_PRICE_COLUMNS, rows or [("-", "-", "-", "-")])
 
         return Panel(Group(chart, table), title="net", border_style="#b46cff")
 
@@ -402,32 +556,24 @@ class TradingDashboard(App):
         decision = str(snap.get("last_decision") or "n/a")
         decision_asset = str(snap.get("last_decision_asset") or "-")
         decision_ts = str(snap.get("last_decision_ts") or "n/a")
-        reason = str(snap.get("last_decision_reason") or "")
-        if len(reason) > 120:
-            reason = reason[:117] + "..."
+        reason = snap.get("last_decision_reason_short")
 
         info = Text()
         info.append(f"decision:{decision}  asset:{decision_asset}  ts:{decision_ts}\n", style="#67e8f9")
         info.append(f"reason:{reason or '-'}\n", style="#d7dce2")
         info.append(f"rumors:{str(snap.get('rumors_summary') or 'none')[:140]}\n", style="#f5d90a")
 
-        table = Table(show_header=True, expand=True)
-        table.add_column("asset", style="#67e8f9")
-        table.add_column("sent", justify="right")
-        table.add_column("pump", justify="center")
-        table.add_column("headline")
+        rows = []
         for item in (snap.get("rumor_headlines") or [])[:14]:
-            headline = str(item.get("rumor") or "").replace("\n", " ").strip()
-            if len(headline) > 56:
-                headline = headline[:53] + "..."
-            table.add_row(
-                str(item.get("asset") or "?"),
-                f"{float(item.get('sent') or 0):+.1f}",
-                "Y" if int(item.get("pump") or 0) else "N",
-                headline,
+            rows.append(
+                (
+                    str(item.get("asset") or "?"),
+                    f"{float(item.get('sent') or 0):+.1f}",
+                    "Y" if int(item.get("pump") or 0) else "N",
+                    item.get("rumor_short") or "",
+                )
             )
-        if not (snap.get("rumor_headlines") or []):
-            table.add_row("-", "-", "-", "no rumor rows")
+        table = _grid(_PROC_RUMOR_COLUMNS, rows or [("-", "-", "-", "no rumor rows")])
 
         footer = Text("keys: q quit | m cycle-view | 1/2/3/4 toggle boxes | ←/→ focus | p park", style="#94a3b8")
 
@@ -446,16 +592,20 @@ class TradingDashboard(App):
         self.query_one("#net_row", Vertical).styles.display = "block" if "net" in self.shown_boxes else "none"
 
     def _refresh_ui(self):
-        self._apply_visibility()
+        view = (frozenset(self.shown_boxes), self.selected_asset, self.view_mode_index, self.last_error)
+        if view != self._rendered_view:
+            self._rendered_view = view
+            self._dirty_panels.update(_PANEL_KEYS)
+            self._apply_visibility()
+        elif self._snap_rev == self._rendered_rev:
+            return
+        self._rendered_rev = self._snap_rev
+
         self.query_one("#tabs", Static).update(self._tabs_panel())
-        if "cpu" in self.shown_boxes:
-            self.query_one("#cpu_panel", Static).update(self._cpu_panel())
-        if "mem" in self.shown_boxes:
-            self.query_one("#mem_panel", Static).update(self._mem_panel())
-        if "net" in self.shown_boxes:
-            self.query_one("#net_panel", Static).update(self._net_panel())
-        if "proc" in self.shown_boxes:
-            self.query_one("#proc_panel", Static).update(self._proc_panel())
+        # Hidden panels stay dirty so they are rebuilt when they are shown again.
+        for name in self._dirty_panels & self.shown_boxes:
+            self.query_one(f"#{name}_panel", Static).update(getattr(self, f"_{name}_panel")())
+        self._dirty_panels -= self.shown_boxes
 
 
 if __name__ == "__main__":
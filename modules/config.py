@@ -1,8 +1,12 @@
 import os
 import logging
 import json
+import stat
+import sys
 import time
+from dataclasses import dataclass, fields
 from datetime import datetime
+from functools import lru_cache
 from threading import Lock
 try:
     from dotenv import load_dotenv
@@ -11,47 +15,127 @@ except ImportError:
         return False
 
 try:
-    from coinbase_advanced_py import AdvancedTradeClient
+    import orjson
 except ImportError:
+    orjson = None
+
+# importlib.reload() keeps the module dict, so a reload sees the flag and skips re-reading .env.
+_DOTENV_LOADED = globals().get("_DOTENV_LOADED", False)
+
+
+def _maybe_load_dotenv():
+    global _DOTENV_LOADED
+    if _DOTENV_LOADED:
+        return
+    _DOTENV_LOADED = True
+    load_dotenv()
+
+
+_maybe_load_dotenv()
+
+
+# The exchange and LLM SDKs pull in large dependency trees; import them only when a client is built.
+_SENTINEL = object()
+_ADV_CLIENT_CLS = _SENTINEL
+_ASYNC_OPENAI_CLS = _SENTINEL
+
+
+def get_advanced_trade_client_cls():
+    global _ADV_CLIENT_CLS
+    if _ADV_CLIENT_CLS is _SENTINEL:
+        try:
+            from coinbase_advanced_py import AdvancedTradeClient
+        except ImportError:
+            try:
+                from coinbase.rest import RESTClient as AdvancedTradeClient
+            except ImportError:
+                AdvancedTradeClient = None
+        _ADV_CLIENT_CLS = AdvancedTradeClient
+    return _ADV_CLIENT_CLS
+
+
+def get_async_openai_cls():
+    global _ASYNC_OPENAI_CLS
+    if _ASYNC_OPENAI_CLS is _SENTINEL:
+        try:
+            from openai import AsyncOpenAI
+        except ImportError:
+            AsyncOpenAI = None
+        _ASYNC_OPENAI_CLS = AsyncOpenAI
+    return _ASYNC_OPENAI_CLS
+
+
+def _grok_http_client():
+    # HTTP/2 (needs the h2 package) lets the proposal and critique calls share one pooled
+    # connection to the API; without h2 this is the SDK's default client with a sized pool.
+    try:
+        from openai import DefaultAsyncHttpxClient
+        import httpx
+    except ImportError:
+        return None
     try:
-        from coinbase.rest import RESTClient as AdvancedTradeClient
+        import h2  # noqa: F401
     except ImportError:
-        AdvancedTradeClient = None
+        http2 = False
+    else:
+        http2 = True
+    return DefaultAsyncHttpxClient(http2=http2, limits=httpx.Limits(max_connections=32, max_keepalive_connections=32))
 
-try:
-    from openai import AsyncOpenAI
-except ImportError:
-    AsyncOpenAI = None
 
-load_dotenv()
+_JSON_STAT_CACHE = None
+_JSON_CACHED = {}
 
 
 def _load_json_config():
+    global _JSON_STAT_CACHE, _JSON_CACHED
     path = os.getenv("CONFIG_JSON_PATH", "config.json")
-    if not os.path.exists(path):
-        return {}
     try:
-        with open(path, "r", encoding="utf-8") as handle:
-            data = json.load(handle)
-            return data if isinstance(data, dict) else {}
-    except (OSError, json.JSONDecodeError):
-        return {}
+        st = os.stat(path)
+        stat_key = (path, st.st_mtime_ns, st.st_size)
+    except OSError:
+        stat_key = (path, None, None)
+    if stat_key == _JSON_STAT_CACHE:
+        return _JSON_CACHED
+
+    data = {}
+    if stat_key[1] is not None:
+        try:
+            # The stat above already gave the size, so read straight into one sized buffer.
+            raw = bytearray(stat_key[2])
+            with open(path, "rb") as handle:
+                count = handle.readinto(raw)
+            if count != len(raw):
+                del raw[count:]
+            parsed = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            if isinstance(parsed, dict):
+                data = parsed
+        except (OSError, ValueError):
+            pass
+    _JSON_STAT_CACHE = stat_key
+    _JSON_CACHED = data
+    return data
 
 
 _JSON_CONFIG = _load_json_config()
 _HOT_RELOAD_LOCK = Lock()
+_HOT_RELOAD_SOURCE = None
+_HOT_RELOAD_RESULT = None
+_HOT_RELOAD_ENV = None
+# Bumped whenever reload_hot_config applies a new set of values; callers key caches on it.
+CONFIG_REV = 0
+
+
+_TZ_ALIASES = {
+    **{key: "America/New_York" for key in ("us-east", "useast", "us/east", "eastern", "est", "edt", "america-new-york")},
+    **{key: "UTC" for key in ("utc", "gmt", "z")},
+}
 
 
 def _normalize_tz_name(value: str) -> str:
     text = str(value or "").strip()
     if not text:
         return ""
-    key = text.strip().lower().replace("_", "-")
-    if key in {"us-east", "useast", "us/east", "eastern", "est", "edt", "america-new-york"}:
-        return "America/New_York"
-    if key in {"utc", "gmt", "z"}:
-        return "UTC"
-    return text
+    return _TZ_ALIASES.get(text.lower().replace("_", "-"), text)
 
 
 _LOG_TIMEZONE = _normalize_tz_name(os.getenv("LOG_TIMEZONE") or _JSON_CONFIG.get("LOG_TIMEZONE") or "")
@@ -66,18 +150,33 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s: %(mes
 logger = logging.getLogger(__name__)
 
 
+def _s(value):
+    # Env vars and JSON strings are already str; only coerce the odd number/bool/null.
+    return value if type(value) is str else str(value)
+
+
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
+
+def _parse_bool(value):
+    if isinstance(value, bool):
+        return value
+    return _s(value).strip().lower() in _TRUTHY
+
+
+# Env overrides are read on every rebuild, but only trigger one when this is set.
+_WATCH_ENV = _parse_bool(os.environ.get("PITRADER_WATCH_ENV", ""))
+
+
 def _cfg(name, default=None):
-    env_value = os.getenv(name)
-    if env_value is not None and env_value != "":
+    env_value = os.environ.get(name)
+    if env_value:
         return env_value
     return _JSON_CONFIG.get(name, default)
 
 
 def _cfg_bool(name, default=False):
-    value = _cfg(name, default)
-    if isinstance(value, bool):
-        return value
-    return str(value).strip().lower() in {"1", "true", "yes", "on"}
+    return _parse_bool(_cfg(name, default))
 
 
 def _cfg_int(name, default):
@@ -96,6 +195,9 @@ def _cfg_float(name, default):
         return float(default)
 
 
+_MONEY_STRIP = str.maketrans("", "", "$,")
+
+
 def _cfg_optional_money(name):
     value = _cfg(name, "")
     if value is None:
@@ -103,139 +205,71 @@ def _cfg_optional_money(name):
     if isinstance(value, (int, float)):
         return float(value) if float(value) > 0 else None
 
-    text = str(value).strip()
+    text = _s(value).strip()
     if not text:
         return None
-    normalized = text.replace("$", "").replace(",", "").strip()
+    normalized = text.translate(_MONEY_STRIP).strip()
     try:
         parsed = float(normalized)
         return parsed if parsed > 0 else None
     except ValueError:
         return None
 
+
+@lru_cache(maxsize=8)
+def _read_pem(path, mtime_ns):
+    with open(path, "r", encoding="utf-8") as pem_file:
+        return pem_file.read().replace("\\n", "\n").strip()
+
+
+def _resolve_secret(value):
+    # The secret is either a PEM file path or the key itself (with literal \n escapes).
+    secret_candidate = value.strip()
+    try:
+        st = os.stat(secret_candidate)
+    except (OSError, ValueError):
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
+        return secret_candidate.replace("\\n", "\n").strip()
+    try:
+        return _read_pem(secret_candidate, st.st_mtime_ns)
+    except OSError:
+        return secret_candidate
+
 # ────────────────────────────────────────────────
 # CONFIG
 # ────────────────────────────────────────────────
-API_KEY = _cfg("COINBASE_API_KEY")
-API_SECRET = _cfg("COINBASE_API_SECRET")
-GROK_KEY = _cfg("GROK_API_KEY")
-GROK_MODEL = _cfg("GROK_MODEL", "grok-beta")
-GROK_SELF_CRITIQUE_ENABLED = _cfg_bool("GROK_SELF_CRITIQUE_ENABLED", True)
-GROK_MIN_CRITIQUE_CONVICTION = max(0, min(100, _cfg_int("GROK_MIN_CRITIQUE_CONVICTION", 78)))
-GROK_CONTEXT_RECENT_TRADES = max(3, _cfg_int("GROK_CONTEXT_RECENT_TRADES", 12))
-GROK_FREE_SIGNALS_TIMEOUT_SEC = max(2, _cfg_int("GROK_FREE_SIGNALS_TIMEOUT_SEC", 6))
-GROK_FUNDING_FILTER_ENABLED = _cfg_bool("GROK_FUNDING_FILTER_ENABLED", True)
-GROK_FUNDING_BLOCK_LONG_PCT = _cfg_float("GROK_FUNDING_BLOCK_LONG_PCT", 0.08)
-GROK_FUNDING_BLOCK_SHORT_PCT = _cfg_float("GROK_FUNDING_BLOCK_SHORT_PCT", -0.08)
-
-if isinstance(API_SECRET, str):
-    secret_candidate = API_SECRET.strip()
-    if os.path.isfile(secret_candidate):
-        try:
-            with open(secret_candidate, "r", encoding="utf-8") as pem_file:
-                API_SECRET = pem_file.read().replace("\\n", "\n").strip()
-        except OSError:
-            API_SECRET = secret_candidate
-    else:
-        API_SECRET = secret_candidate.replace("\\n", "\n").strip()
-
-RISK_NUCLEAR = _cfg_float("RISK_NUCLEAR", 0.12)
-RISK_SAFE = _cfg_float("RISK_SAFE", 0.015)
-SPLIT_THRESHOLD = _cfg_float("SPLIT_THRESHOLD", 10000)
-AGGR_PCT = _cfg_float("AGGR_PCT", 0.10)
-MIN_AGGR = _cfg_float("MIN_AGGR", 1000)
-REBALANCE_DAY = _cfg_int("REBALANCE_DAY", 6)  # Sunday
-REBALANCE_HOUR = _cfg_int("REBALANCE_HOUR", 0)
-
-MAX_LEV = _cfg_int("MAX_LEV", 10)
-PORT = _cfg_int("PORT", 8765)
-PARK_FLAG = _cfg("PARK_FLAG", "parked.flag")
-SYSTEM_PROMPT_PATH = _cfg("SYSTEM_PROMPT_PATH", "system.prompt")
-DATA_ONLY_MODE = _cfg_bool("DATA_ONLY_MODE", False)
-DRY_RUN_ORDERS = _cfg_bool("DRY_RUN_ORDERS", True)
-SIMULATION_MODE = _cfg_bool("SIMULATION_MODE", False)
-if SIMULATION_MODE:
-    DRY_RUN_ORDERS = True
-TRADE_BALANCE = _cfg_optional_money("TRADE_BALANCE")
-RUMOR_POLL_SEC = _cfg_int("RUMOR_POLL_SEC", 900)
-RUMOR_MAX_POSTS = _cfg_int("RUMOR_MAX_POSTS", 30)
-RUMOR_LOOKBACK_HOURS = _cfg_int("RUMOR_LOOKBACK_HOURS", 12)
-DECISION_INTERVAL_SEC = max(30, _cfg_int("DECISION_INTERVAL_SEC", 300))
-PARKED_DECISION_INTERVAL_SEC = max(10, _cfg_int("PARKED_DECISION_INTERVAL_SEC", 60))
-PRICE_POLL_SEC = max(1, _cfg_int("PRICE_POLL_SEC", 5))
-ATR_REFRESH_SEC = max(10, _cfg_int("ATR_REFRESH_SEC", 60))
-BASKET_REFRESH_SEC = max(30, _cfg_int("BASKET_REFRESH_SEC", 600))
-RUMOR_SOURCE = str(_cfg("RUMOR_SOURCE", "auto")).strip().lower()
-PRODUCT_UNIVERSE = str(_cfg("PRODUCT_UNIVERSE", "all")).strip().lower()
-SPOT_QUOTES = [q.strip().upper() for q in str(_cfg("SPOT_QUOTES", "USD,USDC")).split(",") if q.strip()]
-
-# Spot universe discovery/scanning (used when PRODUCT_UNIVERSE includes spot)
-SPOT_DISCOVERY_MODE = str(_cfg("SPOT_DISCOVERY_MODE", "native")).strip().lower()  # native|ccxt
-SPOT_DISCOVERY_REFRESH_SEC = max(600, _cfg_int("SPOT_DISCOVERY_REFRESH_SEC", 14400))
-SPOT_PRIORITY_SIZE = max(20, _cfg_int("SPOT_PRIORITY_SIZE", 200))
-SPOT_ACTIVE_SCAN_SIZE = max(10, _cfg_int("SPOT_ACTIVE_SCAN_SIZE", 80))
-READINESS_HOURS = _cfg_float("READINESS_HOURS", 12.0)
-HEALTH_DEGRADED_FAILURES = max(1, _cfg_int("HEALTH_DEGRADED_FAILURES", 2))
-HEALTH_OUTAGE_FAILURES = max(HEALTH_DEGRADED_FAILURES + 1, _cfg_int("HEALTH_OUTAGE_FAILURES", 5))
-HEALTH_RECOVER_SUCCESS_STREAK = max(1, _cfg_int("HEALTH_RECOVER_SUCCESS_STREAK", 2))
-HEALTH_OUTAGE_FLATTEN_SEC = max(30, _cfg_int("HEALTH_OUTAGE_FLATTEN_SEC", 300))
-HEALTH_BLOCK_RECOVERING = _cfg_bool("HEALTH_BLOCK_RECOVERING", True)
-DATAQ_MAX_PRICE_AGE_SEC = max(5, _cfg_int("DATAQ_MAX_PRICE_AGE_SEC", 20))
-DATAQ_MIN_BASKET_SIZE = max(1, _cfg_int("DATAQ_MIN_BASKET_SIZE", 10))
-DATAQ_MIN_FRESH_PRICE_RATIO = max(0.0, min(1.0, _cfg_float("DATAQ_MIN_FRESH_PRICE_RATIO", 0.60)))
-DATAQ_MIN_ATR_COVERAGE_RATIO = max(0.0, min(1.0, _cfg_float("DATAQ_MIN_ATR_COVERAGE_RATIO", 0.50)))
-DD_DAILY_LIMIT_PCT = max(0.1, _cfg_float("DD_DAILY_LIMIT_PCT", 5.0))
-DD_WEEKLY_LIMIT_PCT = max(0.1, _cfg_float("DD_WEEKLY_LIMIT_PCT", 17.5))
-DD_ATH_TRAILING_LIMIT_PCT = max(0.1, _cfg_float("DD_ATH_TRAILING_LIMIT_PCT", 30.0))
-DD_CHECK_SEC = max(10, _cfg_int("DD_CHECK_SEC", 60))
-DD_AUTO_FLATTEN = _cfg_bool("DD_AUTO_FLATTEN", True)
-DD_AUTO_PARK = _cfg_bool("DD_AUTO_PARK", True)
-SIM_TAKER_FEE_RATE = max(0.0, _cfg_float("SIM_TAKER_FEE_RATE", 0.0006))
-SIM_FUNDING_RATE_PER_8H = max(0.0, _cfg_float("SIM_FUNDING_RATE_PER_8H", 0.0003))
-SIM_SLIPPAGE_MIN_PCT = max(0.0, _cfg_float("SIM_SLIPPAGE_MIN_PCT", 0.10))
-SIM_SLIPPAGE_MAX_PCT = max(SIM_SLIPPAGE_MIN_PCT, _cfg_float("SIM_SLIPPAGE_MAX_PCT", 0.50))
-SIM_SLIPPAGE_ATR_MULT = max(0.0, _cfg_float("SIM_SLIPPAGE_ATR_MULT", 0.50))
-REGIME_CLASSIFIER_ASSET = str(_cfg("REGIME_CLASSIFIER_ASSET", "BTC-PERP-INTX")).strip() or "BTC-PERP-INTX"
-REGIME_LOOKBACK_POINTS = max(20, _cfg_int("REGIME_LOOKBACK_POINTS", 60))
-REGIME_TREND_RET_PCT = max(0.05, _cfg_float("REGIME_TREND_RET_PCT", 0.8))
-REGIME_HIGH_VOL_ATR_PCT = max(0.05, _cfg_float("REGIME_HIGH_VOL_ATR_PCT", 2.5))
-REGIME_TREND_NOISE_RATIO = max(0.5, _cfg_float("REGIME_TREND_NOISE_RATIO", 1.5))
-REGIME_RISK_MULT_TREND = max(0.1, _cfg_float("REGIME_RISK_MULT_TREND", 1.0))
-REGIME_RISK_MULT_CHOP = max(0.1, _cfg_float("REGIME_RISK_MULT_CHOP", 0.7))
-REGIME_RISK_MULT_HIGH_VOL = max(0.1, _cfg_float("REGIME_RISK_MULT_HIGH_VOL", 0.5))
-REGIME_LEV_CAP_TREND = max(1, _cfg_int("REGIME_LEV_CAP_TREND", 8))
-REGIME_LEV_CAP_CHOP = max(1, _cfg_int("REGIME_LEV_CAP_CHOP", 5))
-REGIME_LEV_CAP_HIGH_VOL = max(1, _cfg_int("REGIME_LEV_CAP_HIGH_VOL", 3))
-REGIME_MIN_RR_ADD_TREND = max(0.0, _cfg_float("REGIME_MIN_RR_ADD_TREND", 0.0))
-REGIME_MIN_RR_ADD_CHOP = max(0.0, _cfg_float("REGIME_MIN_RR_ADD_CHOP", 0.2))
-REGIME_MIN_RR_ADD_HIGH_VOL = max(0.0, _cfg_float("REGIME_MIN_RR_ADD_HIGH_VOL", 0.3))
-DECISION_MIN_PUMP_SCORE = max(0, _cfg_int("DECISION_MIN_PUMP_SCORE", 15))
-DECISION_MIN_VOL_SPIKE = max(0.0, _cfg_float("DECISION_MIN_VOL_SPIKE", 1.0))
-DECISION_MIN_RR_AGGRESSIVE = max(0.1, _cfg_float("DECISION_MIN_RR_AGGRESSIVE", 1.5))
-DECISION_MIN_RR_SAFE = max(0.1, _cfg_float("DECISION_MIN_RR_SAFE", 2.0))
-EXEC_POST_ONLY_ENABLED = _cfg_bool("EXEC_POST_ONLY_ENABLED", True)
-EXEC_POST_ONLY_OFFSET_PCT = max(0.0, _cfg_float("EXEC_POST_ONLY_OFFSET_PCT", 0.02))
-EXEC_IOC_FALLBACK_ENABLED = _cfg_bool("EXEC_IOC_FALLBACK_ENABLED", True)
-EXEC_IOC_SLIPPAGE_PCT = max(0.0, _cfg_float("EXEC_IOC_SLIPPAGE_PCT", 0.05))
-EXEC_MARKET_FALLBACK_ENABLED = _cfg_bool("EXEC_MARKET_FALLBACK_ENABLED", True)
-EXEC_MARKET_GUARD_MAX_SPREAD_PCT = max(0.01, _cfg_float("EXEC_MARKET_GUARD_MAX_SPREAD_PCT", 0.35))
-EXEC_MARKET_GUARD_MAX_SIZE_TO_VOL1M_PCT = max(0.01, _cfg_float("EXEC_MARKET_GUARD_MAX_SIZE_TO_VOL1M_PCT", 0.5))
-EXEC_MARKET_GUARD_LIMIT_RETRY_ENABLED = _cfg_bool("EXEC_MARKET_GUARD_LIMIT_RETRY_ENABLED", True)
-EXEC_MARKET_GUARD_RETRY_IOC_SLIPPAGE_PCT = max(0.0, _cfg_float("EXEC_MARKET_GUARD_RETRY_IOC_SLIPPAGE_PCT", 0.08))
-PYRAMID_ENABLED = _cfg_bool("PYRAMID_ENABLED", True)
-PYRAMID_RR_TRIGGER = max(0.5, _cfg_float("PYRAMID_RR_TRIGGER", 1.5))
-PYRAMID_ADD_FRACTION = max(0.01, min(1.0, _cfg_float("PYRAMID_ADD_FRACTION", 0.30)))
-PYRAMID_MAX_ADDS = max(0, _cfg_int("PYRAMID_MAX_ADDS", 2))
-PYRAMID_MIN_CONVICTION = max(0, min(100, _cfg_int("PYRAMID_MIN_CONVICTION", 80)))
-PYRAMID_MAX_EXPOSURE_PCT = max(0.01, min(1.0, _cfg_float("PYRAMID_MAX_EXPOSURE_PCT", 0.18)))
-DAILY_SCORE_ENABLED = _cfg_bool("DAILY_SCORE_ENABLED", True)
-DAILY_SCORE_CSV_PATH = str(_cfg("DAILY_SCORE_CSV_PATH", "daily_score.csv")).strip() or "daily_score.csv"
-DAILY_SCORE_CHECK_SEC = max(10, _cfg_int("DAILY_SCORE_CHECK_SEC", 30))
-
-HOT_RELOAD_SAFE_KEYS = [
+_CONFIG_READY = False
+_INIT_LOCK = Lock()
+
+# Names _init_module_config publishes as module globals. Everything else it assigns is scratch.
+_CONFIG_NAMES = (
+    "API_KEY",
+    "API_SECRET",
+    "GROK_KEY",
+    "GROK_MODEL",
+    "GROK_SELF_CRITIQUE_ENABLED",
+    "GROK_MIN_CRITIQUE_CONVICTION",
+    "GROK_CONTEXT_RECENT_TRADES",
+    "GROK_FREE_SIGNALS_TIMEOUT_SEC",
+    "GROK_FUNDING_FILTER_ENABLED",
+    "GROK_FUNDING_BLOCK_LONG_PCT",
+    "GROK_FUNDING_BLOCK_SHORT_PCT",
+    "RISK_NUCLEAR",
+    "RISK_SAFE",
+    "SPLIT_THRESHOLD",
+    "AGGR_PCT",
+    "MIN_AGGR",
+    "REBALANCE_DAY",
+    "REBALANCE_HOUR",
+    "MAX_LEV",
+    "PORT",
     "PARK_FLAG",
-    "READINESS_HOURS",
-    "RUMOR_SOURCE",
+    "SYSTEM_PROMPT_PATH",
+    "DATA_ONLY_MODE",
+    "DRY_RUN_ORDERS",
+    "SIMULATION_MODE",
+    "TRADE_BALANCE",
     "RUMOR_POLL_SEC",
     "RUMOR_MAX_POSTS",
     "RUMOR_LOOKBACK_HOURS",
@@ -244,12 +278,14 @@ HOT_RELOAD_SAFE_KEYS = [
     "PRICE_POLL_SEC",
     "ATR_REFRESH_SEC",
     "BASKET_REFRESH_SEC",
+    "RUMOR_SOURCE",
     "PRODUCT_UNIVERSE",
     "SPOT_QUOTES",
     "SPOT_DISCOVERY_MODE",
     "SPOT_DISCOVERY_REFRESH_SEC",
     "SPOT_PRIORITY_SIZE",
     "SPOT_ACTIVE_SCAN_SIZE",
+    "READINESS_HOURS",
     "HEALTH_DEGRADED_FAILURES",
     "HEALTH_OUTAGE_FAILURES",
     "HEALTH_RECOVER_SUCCESS_STREAK",
@@ -306,636 +342,502 @@ HOT_RELOAD_SAFE_KEYS = [
     "DAILY_SCORE_ENABLED",
     "DAILY_SCORE_CSV_PATH",
     "DAILY_SCORE_CHECK_SEC",
-    "GROK_SELF_CRITIQUE_ENABLED",
-    "GROK_MIN_CRITIQUE_CONVICTION",
-    "GROK_CONTEXT_RECENT_TRADES",
-    "GROK_FREE_SIGNALS_TIMEOUT_SEC",
-    "GROK_FUNDING_FILTER_ENABLED",
-    "GROK_FUNDING_BLOCK_LONG_PCT",
-    "GROK_FUNDING_BLOCK_SHORT_PCT",
-]
+    "client",
+    "grok",
+    "started_at_dt",
+    "state",
+)
+
+
+def _init_module_config():
+    # Settings, SDK clients and runtime state are built on first use (see __getattr__),
+    # so importing this module for the logger or a helper stays cheap.
+    global _CONFIG_READY, CFG
+    if _CONFIG_READY:
+        return
+    with _INIT_LOCK:
+        if _CONFIG_READY:
+            return
+        API_KEY = _cfg("COINBASE_API_KEY")
+        API_SECRET = _cfg("COINBASE_API_SECRET")
+        GROK_KEY = _cfg("GROK_API_KEY")
+        GROK_MODEL = _cfg("GROK_MODEL", "grok-beta")
+        GROK_SELF_CRITIQUE_ENABLED = _cfg_bool("GROK_SELF_CRITIQUE_ENABLED", True)
+        GROK_MIN_CRITIQUE_CONVICTION = max(0, min(100, _cfg_int("GROK_MIN_CRITIQUE_CONVICTION", 78)))
+        GROK_CONTEXT_RECENT_TRADES = max(3, _cfg_int("GROK_CONTEXT_RECENT_TRADES", 12))
+        GROK_FREE_SIGNALS_TIMEOUT_SEC = max(2, _cfg_int("GROK_FREE_SIGNALS_TIMEOUT_SEC", 6))
+        GROK_FUNDING_FILTER_ENABLED = _cfg_bool("GROK_FUNDING_FILTER_ENABLED", True)
+        GROK_FUNDING_BLOCK_LONG_PCT = _cfg_float("GROK_FUNDING_BLOCK_LONG_PCT", 0.08)
+        GROK_FUNDING_BLOCK_SHORT_PCT = _cfg_float("GROK_FUNDING_BLOCK_SHORT_PCT", -0.08)
+
+        if isinstance(API_SECRET, str):
+            API_SECRET = _resolve_secret(API_SECRET)
+
+        RISK_NUCLEAR = _cfg_float("RISK_NUCLEAR", 0.12)
+        RISK_SAFE = _cfg_float("RISK_SAFE", 0.015)
+        SPLIT_THRESHOLD = _cfg_float("SPLIT_THRESHOLD", 10000)
+        AGGR_PCT = _cfg_float("AGGR_PCT", 0.10)
+        MIN_AGGR = _cfg_float("MIN_AGGR", 1000)
+        REBALANCE_DAY = _cfg_int("REBALANCE_DAY", 6)  # Sunday
+        REBALANCE_HOUR = _cfg_int("REBALANCE_HOUR", 0)
+
+        MAX_LEV = _cfg_int("MAX_LEV", 10)
+        PORT = _cfg_int("PORT", 8765)
+        PARK_FLAG = _cfg("PARK_FLAG", "parked.flag")
+        SYSTEM_PROMPT_PATH = _cfg("SYSTEM_PROMPT_PATH", "system.prompt")
+        DATA_ONLY_MODE = _cfg_bool("DATA_ONLY_MODE", False)
+        DRY_RUN_ORDERS = _cfg_bool("DRY_RUN_ORDERS", True)
+        SIMULATION_MODE = _cfg_bool("SIMULATION_MODE", False)
+        if SIMULATION_MODE:
+            DRY_RUN_ORDERS = True
+        TRADE_BALANCE = _cfg_optional_money("TRADE_BALANCE")
+        RUMOR_POLL_SEC = _cfg_int("RUMOR_POLL_SEC", 900)
+        RUMOR_MAX_POSTS = _cfg_int("RUMOR_MAX_POSTS", 30)
+        RUMOR_LOOKBACK_HOURS = _cfg_int("RUMOR_LOOKBACK_HOURS", 12)
+        DECISION_INTERVAL_SEC = max(30, _cfg_int("DECISION_INTERVAL_SEC", 300))
+        PARKED_DECISION_INTERVAL_SEC = max(10, _cfg_int("PARKED_DECISION_INTERVAL_SEC", 60))
+        PRICE_POLL_SEC = max(1, _cfg_int("PRICE_POLL_SEC", 5))
+        ATR_REFRESH_SEC = max(10, _cfg_int("ATR_REFRESH_SEC", 60))
+        BASKET_REFRESH_SEC = max(30, _cfg_int("BASKET_REFRESH_SEC", 600))
+        RUMOR_SOURCE = _s(_cfg("RUMOR_SOURCE", "auto")).strip().lower()
+        PRODUCT_UNIVERSE = _s(_cfg("PRODUCT_UNIVERSE", "all")).strip().lower()
+        SPOT_QUOTES = [q.strip().upper() for q in _s(_cfg("SPOT_QUOTES", "USD,USDC")).split(",") if q.strip()]
+
+        # Spot universe discovery/scanning (used when PRODUCT_UNIVERSE includes spot)
+        SPOT_DISCOVERY_MODE = _s(_cfg("SPOT_DISCOVERY_MODE", "native")).strip().lower()  # native|ccxt
+        SPOT_DISCOVERY_REFRESH_SEC = max(600, _cfg_int("SPOT_DISCOVERY_REFRESH_SEC", 14400))
+        SPOT_PRIORITY_SIZE = max(20, _cfg_int("SPOT_PRIORITY_SIZE", 200))
+        SPOT_ACTIVE_SCAN_SIZE = max(10, _cfg_int("SPOT_ACTIVE_SCAN_SIZE", 80))
+        READINESS_HOURS = _cfg_float("READINESS_HOURS", 12.0)
+        HEALTH_DEGRADED_FAILURES = max(1, _cfg_int("HEALTH_DEGRADED_FAILURES", 2))
+        HEALTH_OUTAGE_FAILURES = max(HEALTH_DEGRADED_FAILURES + 1, _cfg_int("HEALTH_OUTAGE_FAILURES", 5))
+        HEALTH_RECOVER_SUCCESS_STREAK = max(1, _cfg_int("HEALTH_RECOVER_SUCCESS_STREAK", 2))
+        HEALTH_OUTAGE_FLATTEN_SEC = max(30, _cfg_int("HEALTH_OUTAGE_FLATTEN_SEC", 300))
+        HEALTH_BLOCK_RECOVERING = _cfg_bool("HEALTH_BLOCK_RECOVERING", True)
+        DATAQ_MAX_PRICE_AGE_SEC = max(5, _cfg_int("DATAQ_MAX_PRICE_AGE_SEC", 20))
+        DATAQ_MIN_BASKET_SIZE = max(1, _cfg_int("DATAQ_MIN_BASKET_SIZE", 10))
+        DATAQ_MIN_FRESH_PRICE_RATIO = max(0.0, min(1.0, _cfg_float("DATAQ_MIN_FRESH_PRICE_RATIO", 0.60)))
+        DATAQ_MIN_ATR_COVERAGE_RATIO = max(0.0, min(1.0, _cfg_float("DATAQ_MIN_ATR_COVERAGE_RATIO", 0.50)))
+        DD_DAILY_LIMIT_PCT = max(0.1, _cfg_float("DD_DAILY_LIMIT_PCT", 5.0))
+        DD_WEEKLY_LIMIT_PCT = max(0.1, _cfg_float("DD_WEEKLY_LIMIT_PCT", 17.5))
+        DD_ATH_TRAILING_LIMIT_PCT = max(0.1, _cfg_float("DD_ATH_TRAILING_LIMIT_PCT", 30.0))
+        DD_CHECK_SEC = max(10, _cfg_int("DD_CHECK_SEC", 60))
+        DD_AUTO_FLATTEN = _cfg_bool("DD_AUTO_FLATTEN", True)
+        DD_AUTO_PARK = _cfg_bool("DD_AUTO_PARK", True)
+        SIM_TAKER_FEE_RATE = max(0.0, _cfg_float("SIM_TAKER_FEE_RATE", 0.0006))
+        SIM_FUNDING_RATE_PER_8H = max(0.0, _cfg_float("SIM_FUNDING_RATE_PER_8H", 0.0003))
+        SIM_SLIPPAGE_MIN_PCT = max(0.0, _cfg_float("SIM_SLIPPAGE_MIN_PCT", 0.10))
+        SIM_SLIPPAGE_MAX_PCT = max(SIM_SLIPPAGE_MIN_PCT, _cfg_float("SIM_SLIPPAGE_MAX_PCT", 0.50))
+        SIM_SLIPPAGE_ATR_MULT = max(0.0, _cfg_float("SIM_SLIPPAGE_ATR_MULT", 0.50))
+        REGIME_CLASSIFIER_ASSET = _s(_cfg("REGIME_CLASSIFIER_ASSET", "BTC-PERP-INTX")).strip() or "BTC-PERP-INTX"
+        REGIME_LOOKBACK_POINTS = max(20, _cfg_int("REGIME_LOOKBACK_POINTS", 60))
+        REGIME_TREND_RET_PCT = max(0.05, _cfg_float("REGIME_TREND_RET_PCT", 0.8))
+        REGIME_HIGH_VOL_ATR_PCT = max(0.05, _cfg_float("REGIME_HIGH_VOL_ATR_PCT", 2.5))
+        REGIME_TREND_NOISE_RATIO = max(0.5, _cfg_float("REGIME_TREND_NOISE_RATIO", 1.5))
+        REGIME_RISK_MULT_TREND = max(0.1, _cfg_float("REGIME_RISK_MULT_TREND", 1.0))
+        REGIME_RISK_MULT_CHOP = max(0.1, _cfg_float("REGIME_RISK_MULT_CHOP", 0.7))
+        REGIME_RISK_MULT_HIGH_VOL = max(0.1, _cfg_float("REGIME_RISK_MULT_HIGH_VOL", 0.5))
+        REGIME_LEV_CAP_TREND = max(1, _cfg_int("REGIME_LEV_CAP_TREND", 8))
+        REGIME_LEV_CAP_CHOP = max(1, _cfg_int("REGIME_LEV_CAP_CHOP", 5))
+        REGIME_LEV_CAP_HIGH_VOL = max(1, _cfg_int("REGIME_LEV_CAP_HIGH_VOL", 3))
+        REGIME_MIN_RR_ADD_TREND = max(0.0, _cfg_float("REGIME_MIN_RR_ADD_TREND", 0.0))
+        REGIME_MIN_RR_ADD_CHOP = max(0.0, _cfg_float("REGIME_MIN_RR_ADD_CHOP", 0.2))
+        REGIME_MIN_RR_ADD_HIGH_VOL = max(0.0, _cfg_float("REGIME_MIN_RR_ADD_HIGH_VOL", 0.3))
+        DECISION_MIN_PUMP_SCORE = max(0, _cfg_int("DECISION_MIN_PUMP_SCORE", 15))
+        DECISION_MIN_VOL_SPIKE = max(0.0, _cfg_float("DECISION_MIN_VOL_SPIKE", 1.0))
+        DECISION_MIN_RR_AGGRESSIVE = max(0.1, _cfg_float("DECISION_MIN_RR_AGGRESSIVE", 1.5))
+        DECISION_MIN_RR_SAFE = max(0.1, _cfg_float("DECISION_MIN_RR_SAFE", 2.0))
+        EXEC_POST_ONLY_ENABLED = _cfg_bool("EXEC_POST_ONLY_ENABLED", True)
+        EXEC_POST_ONLY_OFFSET_PCT = max(0.0, _cfg_float("EXEC_POST_ONLY_OFFSET_PCT", 0.02))
+        EXEC_IOC_FALLBACK_ENABLED = _cfg_bool("EXEC_IOC_FALLBACK_ENABLED", True)
+        EXEC_IOC_SLIPPAGE_PCT = max(0.0, _cfg_float("EXEC_IOC_SLIPPAGE_PCT", 0.05))
+        EXEC_MARKET_FALLBACK_ENABLED = _cfg_bool("EXEC_MARKET_FALLBACK_ENABLED", True)
+        EXEC_MARKET_GUARD_MAX_SPREAD_PCT = max(0.01, _cfg_float("EXEC_MARKET_GUARD_MAX_SPREAD_PCT", 0.35))
+        EXEC_MARKET_GUARD_MAX_SIZE_TO_VOL1M_PCT = max(0.01, _cfg_float("EXEC_MARKET_GUARD_MAX_SIZE_TO_VOL1M_PCT", 0.5))
+        EXEC_MARKET_GUARD_LIMIT_RETRY_ENABLED = _cfg_bool("EXEC_MARKET_GUARD_LIMIT_RETRY_ENABLED", True)
+        EXEC_MARKET_GUARD_RETRY_IOC_SLIPPAGE_PCT = max(0.0, _cfg_float("EXEC_MARKET_GUARD_RETRY_IOC_SLIPPAGE_PCT", 0.08))
+        PYRAMID_ENABLED = _cfg_bool("PYRAMID_ENABLED", True)
+        PYRAMID_RR_TRIGGER = max(0.5, _cfg_float("PYRAMID_RR_TRIGGER", 1.5))
+        PYRAMID_ADD_FRACTION = max(0.01, min(1.0, _cfg_float("PYRAMID_ADD_FRACTION", 0.30)))
+        PYRAMID_MAX_ADDS = max(0, _cfg_int("PYRAMID_MAX_ADDS", 2))
+        PYRAMID_MIN_CONVICTION = max(0, min(100, _cfg_int("PYRAMID_MIN_CONVICTION", 80)))
+        PYRAMID_MAX_EXPOSURE_PCT = max(0.01, min(1.0, _cfg_float("PYRAMID_MAX_EXPOSURE_PCT", 0.18)))
+        DAILY_SCORE_ENABLED = _cfg_bool("DAILY_SCORE_ENABLED", True)
+        DAILY_SCORE_CSV_PATH = _s(_cfg("DAILY_SCORE_CSV_PATH", "daily_score.csv")).strip() or "daily_score.csv"
+        DAILY_SCORE_CHECK_SEC = max(10, _cfg_int("DAILY_SCORE_CHECK_SEC", 30))
+
+        client = None
+        if API_KEY and API_SECRET:
+            AdvancedTradeClient = get_advanced_trade_client_cls()
+            if AdvancedTradeClient is not None:
+                client = AdvancedTradeClient(API_KEY, API_SECRET)
+
+        grok = None
+        if GROK_KEY:
+            AsyncOpenAI = get_async_openai_cls()
+            if AsyncOpenAI is not None:
+                grok = AsyncOpenAI(api_key=GROK_KEY, base_url="https://api.x.ai/v1", http_client=_grok_http_client())
+
+        # started_at never changes after boot, so readers use the parsed value instead of the ISO text.
+        started_at_dt = datetime.utcnow()
+        # Every key the bot writes is declared here, so the dict is sized once at boot and
+        # later ticks only overwrite values.
+        state = {
+            "started_at": started_at_dt.isoformat(),
+            "equity": float(TRADE_BALANCE) if TRADE_BALANCE is not None else 250.0,
+            "equity_raw": None,
+            "sim_base_equity": float(TRADE_BALANCE) if TRADE_BALANCE is not None else 250.0,
+            "sim_realized_pnl": 0.0,
+            "positions": {},
+            "price": {},
+            "price_ts": {},
+            "price_history": {},
+            "vol_cache": {},
+            "mtf_cache": {},
+            "micro_cache": {},
+            "exec_liq_cache": {},
+            "unsupported_products": {},
+            "spot_universe": [],
+            "spot_universe_count": 0,
+            "spot_priority": [],
+            "spot_scan_cursor": 0,
+            "spot_discovery_last_ts": None,
+            "new_alts": [],
+            "rumor_items": [],
+            "rumors_summary": "none",
+            "whale_summary": "none",
+            "x_cooldown_until": None,
+            "x_cooldown_reason": "",
+            "whale_flow": {},
+            "spike_list": [],
+            "basket": list(map(sys.intern, ["BTC-PERP-INTX", "ETH-PERP-INTX", "SOL-PERP-INTX", "DOGE-PERP-INTX", "PEPE-PERP-INTX"])),
+            "basket_ver": 0,
+            "parked": os.path.exists(PARK_FLAG),
+            "mode": "nuclear",
+            "aggr_target": float(TRADE_BALANCE) if TRADE_BALANCE is not None else 250.0,
+            "safe_target": 0.0,
+            "last_rebal": None,
+            "trades": {},  # order_id → info
+            "timers": {},
+            "ready_to_trade": False,
+            "last_decision": "n/a",
+            "last_decision_asset": None,
+            "last_decision_reason": "",
+            "last_decision_ts": None,
+            "health_state": "healthy",
+            "health_last_transition_ts": datetime.utcnow().isoformat(),
+            "health_consecutive_failures": 0,
+            "health_consecutive_successes": 0,
+            "health_last_success_ts": None,
+            "health_last_failure_ts": None,
+            "health_last_failure_reason": "",
+            "health_outage_since_ts": None,
+            "health_recovering_since_ts": None,
+            "health_outage_flattened": False,
+            "data_quality_last_ok": True,
+            "data_quality_last_reason": "",
+            "data_quality_last_check_ts": None,
+            "equity_history": [],
+            "drawdown_paused": False,
+            "drawdown_pause_reason": "",
+            "drawdown_pause_ts": None,
+            "drawdown_daily_date": None,
+            "drawdown_daily_peak": 0.0,
+            "drawdown_weekly_peak": 0.0,
+            "drawdown_ath_peak": 0.0,
+            "drawdown_daily_dd_pct": 0.0,
+            "drawdown_weekly_dd_pct": 0.0,
+            "drawdown_ath_dd_pct": 0.0,
+            "regime": "chop",
+            "regime_asset": "BTC-PERP-INTX",
+            "regime_last_ts": None,
+            "regime_metrics": {},
+            "decision_gate_last_ok": True,
+            "decision_gate_last_reason": "",
+            "decision_gate_last_ts": None,
+            "decision_gate_last_metrics": {},
+            "execution_last_ok": True,
+            "execution_last_path": "",
+            "execution_last_reason": "",
+            "execution_last_ts": None,
+            "execution_gate_last_ok": True,
+            "execution_gate_last_reason": "",
+            "execution_gate_last_ts": None,
+            "execution_gate_last_metrics": {},
+            "daily_score_last_seen_day": None,
+            "daily_score_last_written_day": None,
+            "last_regime_signals": {},
+            "last_critique": {},
+            "recent_returns": [],
+            "equity_momentum_7d_return_pct": 0.0,
+        }
+        values = locals()
+        globals().update({name: values[name] for name in _CONFIG_NAMES})
+        CFG = _build_cfg(globals())
+        _CONFIG_READY = True
+
+
+# Hot-reloadable settings: (name, kind, (min, max), fallback). A callable bound is
+# evaluated against the already reloaded values, so dependent keys follow the ones they
+# depend on. Text kinds use the fallback when the value is empty (None keeps the current one).
+_HOT_SPEC = (
+    ("PARK_FLAG", "str", None, "parked.flag"),
+    ("READINESS_HOURS", "float", None, None),
+    ("RUMOR_SOURCE", "lower", None, ""),
+    ("RUMOR_POLL_SEC", "int", (60, None), None),
+    ("RUMOR_MAX_POSTS", "int", (1, None), None),
+    ("RUMOR_LOOKBACK_HOURS", "int", (1, None), None),
+    ("DECISION_INTERVAL_SEC", "int", (30, None), None),
+    ("PARKED_DECISION_INTERVAL_SEC", "int", (10, None), None),
+    ("PRICE_POLL_SEC", "int", (1, None), None),
+    ("ATR_REFRESH_SEC", "int", (10, None), None),
+    ("BASKET_REFRESH_SEC", "int", (30, None), None),
+    ("PRODUCT_UNIVERSE", "lower", None, "all"),
+    ("SPOT_QUOTES", "list", None, None),
+    ("SPOT_DISCOVERY_MODE", "lower", None, None),
+    ("SPOT_DISCOVERY_REFRESH_SEC", "int", (600, None), None),
+    ("SPOT_PRIORITY_SIZE", "int", (20, None), None),
+    ("SPOT_ACTIVE_SCAN_SIZE", "int", (10, None), None),
+    ("HEALTH_DEGRADED_FAILURES", "int", (1, None), None),
+    ("HEALTH_OUTAGE_FAILURES", "int", (lambda g: g["HEALTH_DEGRADED_FAILURES"] + 1, None), None),
+    ("HEALTH_RECOVER_SUCCESS_STREAK", "int", (1, None), None),
+    ("HEALTH_OUTAGE_FLATTEN_SEC", "int", (30, None), None),
+    ("HEALTH_BLOCK_RECOVERING", "bool", None, None),
+    ("DATAQ_MAX_PRICE_AGE_SEC", "int", (5, None), None),
+    ("DATAQ_MIN_BASKET_SIZE", "int", (1, None), None),
+    ("DATAQ_MIN_FRESH_PRICE_RATIO", "float", (0.0, 1.0), None),
+    ("DATAQ_MIN_ATR_COVERAGE_RATIO", "float", (0.0, 1.0), None),
+    ("DD_DAILY_LIMIT_PCT", "float", (0.1, None), None),
+    ("DD_WEEKLY_LIMIT_PCT", "float", (0.1, None), None),
+    ("DD_ATH_TRAILING_LIMIT_PCT", "float", (0.1, None), None),
+    ("DD_CHECK_SEC", "int", (10, None), None),
+    ("DD_AUTO_FLATTEN", "bool", None, None),
+    ("DD_AUTO_PARK", "bool", None, None),
+    ("SIM_TAKER_FEE_RATE", "float", (0.0, None), None),
+    ("SIM_FUNDING_RATE_PER_8H", "float", (0.0, None), None),
+    ("SIM_SLIPPAGE_MIN_PCT", "float", (0.0, None), None),
+    ("SIM_SLIPPAGE_MAX_PCT", "float", (lambda g: g["SIM_SLIPPAGE_MIN_PCT"], None), None),
+    ("SIM_SLIPPAGE_ATR_MULT", "float", (0.0, None), None),
+    ("REGIME_CLASSIFIER_ASSET", "str", None, "BTC-PERP-INTX"),
+    ("REGIME_LOOKBACK_POINTS", "int", (20, None), None),
+    ("REGIME_TREND_RET_PCT", "float", (0.05, None), None),
+    ("REGIME_HIGH_VOL_ATR_PCT", "float", (0.05, None), None),
+    ("REGIME_TREND_NOISE_RATIO", "float", (0.5, None), None),
+    ("REGIME_RISK_MULT_TREND", "float", (0.1, None), None),
+    ("REGIME_RISK_MULT_CHOP", "float", (0.1, None), None),
+    ("REGIME_RISK_MULT_HIGH_VOL", "float", (0.1, None), None),
+    ("REGIME_LEV_CAP_TREND", "int", (1, None), None),
+    ("REGIME_LEV_CAP_CHOP", "int", (1, None), None),
+    ("REGIME_LEV_CAP_HIGH_VOL", "int", (1, None), None),
+    ("REGIME_MIN_RR_ADD_TREND", "float", (0.0, None), None),
+    ("REGIME_MIN_RR_ADD_CHOP", "float", (0.0, None), None),
+    ("REGIME_MIN_RR_ADD_HIGH_VOL", "float", (0.0, None), None),
+    ("DECISION_MIN_PUMP_SCORE", "int", (0, None), None),
+    ("DECISION_MIN_VOL_SPIKE", "float", (0.0, None), None),
+    ("DECISION_MIN_RR_AGGRESSIVE", "float", (0.1, None), None),
+    ("DECISION_MIN_RR_SAFE", "float", (0.1, None), None),
+    ("EXEC_POST_ONLY_ENABLED", "bool", None, None),
+    ("EXEC_POST_ONLY_OFFSET_PCT", "float", (0.0, None), None),
+    ("EXEC_IOC_FALLBACK_ENABLED", "bool", None, None),
+    ("EXEC_IOC_SLIPPAGE_PCT", "float", (0.0, None), None),
+    ("EXEC_MARKET_FALLBACK_ENABLED", "bool", None, None),
+    ("EXEC_MARKET_GUARD_MAX_SPREAD_PCT", "float", (0.01, None), None),
+    ("EXEC_MARKET_GUARD_MAX_SIZE_TO_VOL1M_PCT", "float", (0.01, None), None),
+    ("EXEC_MARKET_GUARD_LIMIT_RETRY_ENABLED", "bool", None, None),
+    ("EXEC_MARKET_GUARD_RETRY_IOC_SLIPPAGE_PCT", "float", (0.0, None), None),
+    ("PYRAMID_ENABLED", "bool", None, None),
+    ("PYRAMID_RR_TRIGGER", "float", (0.5, None), None),
+    ("PYRAMID_ADD_FRACTION", "float", (0.01, 1.0), None),
+    ("PYRAMID_MAX_ADDS", "int", (0, None), None),
+    ("PYRAMID_MIN_CONVICTION", "int", (0, 100), None),
+    ("PYRAMID_MAX_EXPOSURE_PCT", "float", (0.01, 1.0), None),
+    ("DAILY_SCORE_ENABLED", "bool", None, None),
+    ("DAILY_SCORE_CSV_PATH", "str", None, "daily_score.csv"),
+    ("DAILY_SCORE_CHECK_SEC", "int", (10, None), None),
+    ("GROK_SELF_CRITIQUE_ENABLED", "bool", None, None),
+    ("GROK_MIN_CRITIQUE_CONVICTION", "int", (0, 100), None),
+    ("GROK_CONTEXT_RECENT_TRADES", "int", (3, None), None),
+    ("GROK_FREE_SIGNALS_TIMEOUT_SEC", "int", (2, None), None),
+    ("GROK_FUNDING_FILTER_ENABLED", "bool", None, None),
+    ("GROK_FUNDING_BLOCK_LONG_PCT", "float", None, None),
+    ("GROK_FUNDING_BLOCK_SHORT_PCT", "float", None, None),
+)
+
+HOT_RELOAD_SAFE_KEYS_ORDERED = tuple(spec[0] for spec in _HOT_SPEC)
+HOT_RELOAD_SAFE_KEYS = frozenset(HOT_RELOAD_SAFE_KEYS_ORDERED)
+
+
+# Grouped, immutable views of the hot settings. Field names are the setting names with the
+# group prefix dropped (CFG.regime.lookback_points == REGIME_LOOKBACK_POINTS); hot loops can bind
+# one group locally instead of looking up many module globals. CFG is rebuilt on every reload.
+@dataclass(frozen=True, slots=True)
+class GrokCfg:
+    self_critique_enabled: bool
+    min_critique_conviction: int
+    context_recent_trades: int
+    free_signals_timeout_sec: int
+    funding_filter_enabled: bool
+    funding_block_long_pct: float
+    funding_block_short_pct: float
+
+
+@dataclass(frozen=True, slots=True)
+class RegimeCfg:
+    classifier_asset: str
+    lookback_points: int
+    trend_ret_pct: float
+    high_vol_atr_pct: float
+    trend_noise_ratio: float
+    risk_mult_trend: float
+    risk_mult_chop: float
+    risk_mult_high_vol: float
+    lev_cap_trend: int
+    lev_cap_chop: int
+    lev_cap_high_vol: int
+    min_rr_add_trend: float
+    min_rr_add_chop: float
+    min_rr_add_high_vol: float
+
+
+@dataclass(frozen=True, slots=True)
+class ExecCfg:
+    post_only_enabled: bool
+    post_only_offset_pct: float
+    ioc_fallback_enabled: bool
+    ioc_slippage_pct: float
+    market_fallback_enabled: bool
+    market_guard_max_spread_pct: float
+    market_guard_max_size_to_vol1m_pct: float
+    market_guard_limit_retry_enabled: bool
+    market_guard_retry_ioc_slippage_pct: float
+
+
+@dataclass(frozen=True, slots=True)
+class DDCfg:
+    daily_limit_pct: float
+    weekly_limit_pct: float
+    ath_trailing_limit_pct: float
+    check_sec: int
+    auto_flatten: bool
+    auto_park: bool
+
+
+@dataclass(frozen=True, slots=True)
+class SimCfg:
+    taker_fee_rate: float
+    funding_rate_per_8h: float
+    slippage_min_pct: float
+    slippage_max_pct: float
+    slippage_atr_mult: float
+
+
+@dataclass(frozen=True, slots=True)
+class ConfigGroups:
+    grok: GrokCfg
+    regime: RegimeCfg
+    exec: ExecCfg
+    dd: DDCfg
+    sim: SimCfg
+
+
+_CFG_GROUPS = (
+    ("grok", GrokCfg, "GROK_"),
+    ("regime", RegimeCfg, "REGIME_"),
+    ("exec", ExecCfg, "EXEC_"),
+    ("dd", DDCfg, "DD_"),
+    ("sim", SimCfg, "SIM_"),
+)
+
+
+def _build_cfg(values):
+    return ConfigGroups(
+        **{
+            group: cls(**{field.name: values[prefix + field.name.upper()] for field in fields(cls)})
+            for group, cls, prefix in _CFG_GROUPS
+        }
+    )
+
+
+def _env_or_cfg(env, cfg_data, name, default):
+    env_value = env.get(name)
+    if env_value:
+        return env_value
+    return cfg_data.get(name, default)
 
 
-def _parse_int(value, default):
+def _clamp(value, low, high, default, caster):
     try:
-        return int(value)
+        parsed = caster(value)
     except (TypeError, ValueError):
-        return int(default)
+        parsed = caster(default)
+    if high is not None and parsed > high:
+        parsed = high
+    if low is not None and parsed < low:
+        parsed = low
+    return parsed
+
+
+def _coerce(kind, value, current, bounds, fallback, values):
+    if kind == "bool":
+        return _parse_bool(value)
+    if kind == "list":
+        return [q.strip().upper() for q in _s(value).split(",") if q.strip()]
+    if kind in ("str", "lower"):
+        text = _s(value).strip()
+        if kind == "lower":
+            text = text.lower()
+        return text or (current if fallback is None else fallback)
+
+    low, high = bounds or (None, None)
+    if callable(low):
+        low = low(values)
+    return _clamp(value, low, high, current, int if kind == "int" else float)
 
 
-def _parse_float(value, default):
-    try:
-        return float(value)
-    except (TypeError, ValueError):
-        return float(default)
+def reload_hot_config():
+    global _HOT_RELOAD_SOURCE
+    global _HOT_RELOAD_RESULT
+    global _HOT_RELOAD_ENV
+    global CFG
+    global CONFIG_REV
+
+    if not _CONFIG_READY:
+        _init_module_config()
+    # _load_json_config only re-reads when the file's mtime/size changed and otherwise
+    # hands back the same dict, so an unchanged file costs one stat here.
+    cfg_data = _load_json_config()
+    env_key = tuple(map(os.environ.get, HOT_RELOAD_SAFE_KEYS_ORDERED)) if _WATCH_ENV else None
+    if cfg_data is _HOT_RELOAD_SOURCE and env_key == _HOT_RELOAD_ENV and _HOT_RELOAD_RESULT is not None:
+        return dict(_HOT_RELOAD_RESULT)
+
+    # Build the new values without the lock; dependent bounds only read keys earlier in
+    # _HOT_SPEC, which are already in `updated`. The lock then covers just the swap.
+    current_values = globals()
+    env = os.environ
+    updated = {}
+    for name, kind, bounds, fallback in _HOT_SPEC:
+        current = current_values[name]
+        default = ",".join(current) if kind == "list" else current
+        updated[name] = _coerce(kind, _env_or_cfg(env, cfg_data, name, default), current, bounds, fallback, updated)
+    new_cfg = _build_cfg(updated)
 
+    with _HOT_RELOAD_LOCK:
+        current_values.update(updated)
+        CFG = new_cfg
+        CONFIG_REV += 1
 
-def _env_or_cfg(name, cfg_data, default):
-    env_value = os.getenv(name)
-    if env_value is not None and env_value != "":
-        return env_value
-    return cfg_data.get(name, default)
+    _HOT_RELOAD_RESULT = {name: updated[name] for name in HOT_RELOAD_SAFE_KEYS_ORDERED}
+    _HOT_RELOAD_SOURCE = cfg_data
+    _HOT_RELOAD_ENV = env_key
+    return dict(_HOT_RELOAD_RESULT)
 
 
-def reload_hot_config():
-    cfg_data = _load_json_config()
+SAFE_ASSETS = set(map(sys.intern, ("BTC-PERP-INTX", "ETH-PERP-INTX", "SOL-PERP-INTX")))
 
-    global PARK_FLAG
-    global READINESS_HOURS
-    global RUMOR_SOURCE
-    global RUMOR_POLL_SEC
-    global RUMOR_MAX_POSTS
-    global RUMOR_LOOKBACK_HOURS
-    global DECISION_INTERVAL_SEC
-    global PARKED_DECISION_INTERVAL_SEC
-    global PRICE_POLL_SEC
-    global ATR_REFRESH_SEC
-    global BASKET_REFRESH_SEC
-    global PRODUCT_UNIVERSE
-    global SPOT_QUOTES
-    global SPOT_DISCOVERY_MODE
-    global SPOT_DISCOVERY_REFRESH_SEC
-    global SPOT_PRIORITY_SIZE
-    global SPOT_ACTIVE_SCAN_SIZE
-    global HEALTH_DEGRADED_FAILURES
-    global HEALTH_OUTAGE_FAILURES
-    global HEALTH_RECOVER_SUCCESS_STREAK
-    global HEALTH_OUTAGE_FLATTEN_SEC
-    global HEALTH_BLOCK_RECOVERING
-    global DATAQ_MAX_PRICE_AGE_SEC
-    global DATAQ_MIN_BASKET_SIZE
-    global DATAQ_MIN_FRESH_PRICE_RATIO
-    global DATAQ_MIN_ATR_COVERAGE_RATIO
-    global DD_DAILY_LIMIT_PCT
-    global DD_WEEKLY_LIMIT_PCT
-    global DD_ATH_TRAILING_LIMIT_PCT
-    global DD_CHECK_SEC
-    global DD_AUTO_FLATTEN
-    global DD_AUTO_PARK
-    global SIM_TAKER_FEE_RATE
-    global SIM_FUNDING_RATE_PER_8H
-    global SIM_SLIPPAGE_MIN_PCT
-    global SIM_SLIPPAGE_MAX_PCT
-    global SIM_SLIPPAGE_ATR_MULT
-    global REGIME_CLASSIFIER_ASSET
-    global REGIME_LOOKBACK_POINTS
-    global REGIME_TREND_RET_PCT
-    global REGIME_HIGH_VOL_ATR_PCT
-    global REGIME_TREND_NOISE_RATIO
-    global REGIME_RISK_MULT_TREND
-    global REGIME_RISK_MULT_CHOP
-    global REGIME_RISK_MULT_HIGH_VOL
-    global REGIME_LEV_CAP_TREND
-    global REGIME_LEV_CAP_CHOP
-    global REGIME_LEV_CAP_HIGH_VOL
-    global REGIME_MIN_RR_ADD_TREND
-    global REGIME_MIN_RR_ADD_CHOP
-    global REGIME_MIN_RR_ADD_HIGH_VOL
-    global DECISION_MIN_PUMP_SCORE
-    global DECISION_MIN_VOL_SPIKE
-    global DECISION_MIN_RR_AGGRESSIVE
-    global DECISION_MIN_RR_SAFE
-    global EXEC_POST_ONLY_ENABLED
-    global EXEC_POST_ONLY_OFFSET_PCT
-    global EXEC_IOC_FALLBACK_ENABLED
-    global EXEC_IOC_SLIPPAGE_PCT
-    global EXEC_MARKET_FALLBACK_ENABLED
-    global EXEC_MARKET_GUARD_MAX_SPREAD_PCT
-    global EXEC_MARKET_GUARD_MAX_SIZE_TO_VOL1M_PCT
-    global EXEC_MARKET_GUARD_LIMIT_RETRY_ENABLED
-    global EXEC_MARKET_GUARD_RETRY_IOC_SLIPPAGE_PCT
-    global PYRAMID_ENABLED
-    global PYRAMID_RR_TRIGGER
-    global PYRAMID_ADD_FRACTION
-    global PYRAMID_MAX_ADDS
-    global PYRAMID_MIN_CONVICTION
-    global PYRAMID_MAX_EXPOSURE_PCT
-    global DAILY_SCORE_ENABLED
-    global DAILY_SCORE_CSV_PATH
-    global DAILY_SCORE_CHECK_SEC
-    global GROK_SELF_CRITIQUE_ENABLED
-    global GROK_MIN_CRITIQUE_CONVICTION
-    global GROK_CONTEXT_RECENT_TRADES
-    global GROK_FREE_SIGNALS_TIMEOUT_SEC
-    global GROK_FUNDING_FILTER_ENABLED
-    global GROK_FUNDING_BLOCK_LONG_PCT
-    global GROK_FUNDING_BLOCK_SHORT_PCT
 
-    with _HOT_RELOAD_LOCK:
-        PARK_FLAG = str(_env_or_cfg("PARK_FLAG", cfg_data, PARK_FLAG)).strip() or "parked.flag"
-        READINESS_HOURS = _parse_float(_env_or_cfg("READINESS_HOURS", cfg_data, READINESS_HOURS), READINESS_HOURS)
-
-        RUMOR_SOURCE = str(_env_or_cfg("RUMOR_SOURCE", cfg_data, RUMOR_SOURCE)).strip().lower()
-        RUMOR_POLL_SEC = max(60, _parse_int(_env_or_cfg("RUMOR_POLL_SEC", cfg_data, RUMOR_POLL_SEC), RUMOR_POLL_SEC))
-        RUMOR_MAX_POSTS = max(1, _parse_int(_env_or_cfg("RUMOR_MAX_POSTS", cfg_data, RUMOR_MAX_POSTS), RUMOR_MAX_POSTS))
-        RUMOR_LOOKBACK_HOURS = max(1, _parse_int(_env_or_cfg("RUMOR_LOOKBACK_HOURS", cfg_data, RUMOR_LOOKBACK_HOURS), RUMOR_LOOKBACK_HOURS))
-
-        DECISION_INTERVAL_SEC = max(30, _parse_int(_env_or_cfg("DECISION_INTERVAL_SEC", cfg_data, DECISION_INTERVAL_SEC), DECISION_INTERVAL_SEC))
-        PARKED_DECISION_INTERVAL_SEC = max(10, _parse_int(_env_or_cfg("PARKED_DECISION_INTERVAL_SEC", cfg_data, PARKED_DECISION_INTERVAL_SEC), PARKED_DECISION_INTERVAL_SEC))
-        PRICE_POLL_SEC = max(1, _parse_int(_env_or_cfg("PRICE_POLL_SEC", cfg_data, PRICE_POLL_SEC), PRICE_POLL_SEC))
-        ATR_REFRESH_SEC = max(10, _parse_int(_env_or_cfg("ATR_REFRESH_SEC", cfg_data, ATR_REFRESH_SEC), ATR_REFRESH_SEC))
-        BASKET_REFRESH_SEC = max(30, _parse_int(_env_or_cfg("BASKET_REFRESH_SEC", cfg_data, BASKET_REFRESH_SEC), BASKET_REFRESH_SEC))
-
-        PRODUCT_UNIVERSE = str(_env_or_cfg("PRODUCT_UNIVERSE", cfg_data, PRODUCT_UNIVERSE)).strip().lower() or "all"
-        spot_quotes_raw = str(_env_or_cfg("SPOT_QUOTES", cfg_data, ",".join(SPOT_QUOTES)))
-        SPOT_QUOTES = [q.strip().upper() for q in spot_quotes_raw.split(",") if q.strip()]
-
-        SPOT_DISCOVERY_MODE = str(_env_or_cfg("SPOT_DISCOVERY_MODE", cfg_data, SPOT_DISCOVERY_MODE)).strip().lower() or SPOT_DISCOVERY_MODE
-        SPOT_DISCOVERY_REFRESH_SEC = max(
-            600,
-            _parse_int(
-                _env_or_cfg("SPOT_DISCOVERY_REFRESH_SEC", cfg_data, SPOT_DISCOVERY_REFRESH_SEC),
-                SPOT_DISCOVERY_REFRESH_SEC,
-            ),
-        )
-        SPOT_PRIORITY_SIZE = max(
-            20,
-            _parse_int(_env_or_cfg("SPOT_PRIORITY_SIZE", cfg_data, SPOT_PRIORITY_SIZE), SPOT_PRIORITY_SIZE),
-        )
-        SPOT_ACTIVE_SCAN_SIZE = max(
-            10,
-            _parse_int(_env_or_cfg("SPOT_ACTIVE_SCAN_SIZE", cfg_data, SPOT_ACTIVE_SCAN_SIZE), SPOT_ACTIVE_SCAN_SIZE),
-        )
-        HEALTH_DEGRADED_FAILURES = max(1, _parse_int(_env_or_cfg("HEALTH_DEGRADED_FAILURES", cfg_data, HEALTH_DEGRADED_FAILURES), HEALTH_DEGRADED_FAILURES))
-        HEALTH_OUTAGE_FAILURES = max(
-            HEALTH_DEGRADED_FAILURES + 1,
-            _parse_int(_env_or_cfg("HEALTH_OUTAGE_FAILURES", cfg_data, HEALTH_OUTAGE_FAILURES), HEALTH_OUTAGE_FAILURES),
-        )
-        HEALTH_RECOVER_SUCCESS_STREAK = max(
-            1,
-            _parse_int(
-                _env_or_cfg("HEALTH_RECOVER_SUCCESS_STREAK", cfg_data, HEALTH_RECOVER_SUCCESS_STREAK),
-                HEALTH_RECOVER_SUCCESS_STREAK,
-            ),
-        )
-        HEALTH_OUTAGE_FLATTEN_SEC = max(
-            30,
-            _parse_int(_env_or_cfg("HEALTH_OUTAGE_FLATTEN_SEC", cfg_data, HEALTH_OUTAGE_FLATTEN_SEC), HEALTH_OUTAGE_FLATTEN_SEC),
-        )
-        HEALTH_BLOCK_RECOVERING = str(
-            _env_or_cfg("HEALTH_BLOCK_RECOVERING", cfg_data, "1" if HEALTH_BLOCK_RECOVERING else "0")
-        ).strip().lower() in {"1", "true", "yes", "on"}
-        DATAQ_MAX_PRICE_AGE_SEC = max(
-            5,
-            _parse_int(_env_or_cfg("DATAQ_MAX_PRICE_AGE_SEC", cfg_data, DATAQ_MAX_PRICE_AGE_SEC), DATAQ_MAX_PRICE_AGE_SEC),
-        )
-        DATAQ_MIN_BASKET_SIZE = max(
-            1,
-            _parse_int(_env_or_cfg("DATAQ_MIN_BASKET_SIZE", cfg_data, DATAQ_MIN_BASKET_SIZE), DATAQ_MIN_BASKET_SIZE),
-        )
-        DATAQ_MIN_FRESH_PRICE_RATIO = max(
-            0.0,
-            min(
-                1.0,
-                _parse_float(
-                    _env_or_cfg("DATAQ_MIN_FRESH_PRICE_RATIO", cfg_data, DATAQ_MIN_FRESH_PRICE_RATIO),
-                    DATAQ_MIN_FRESH_PRICE_RATIO,
-                ),
-            ),
-        )
-        DATAQ_MIN_ATR_COVERAGE_RATIO = max(
-            0.0,
-            min(
-                1.0,
-                _parse_float(
-                    _env_or_cfg("DATAQ_MIN_ATR_COVERAGE_RATIO", cfg_data, DATAQ_MIN_ATR_COVERAGE_RATIO),
-                    DATAQ_MIN_ATR_COVERAGE_RATIO,
-                ),
-            ),
-        )
-        DD_DAILY_LIMIT_PCT = max(
-            0.1,
-            _parse_float(_env_or_cfg("DD_DAILY_LIMIT_PCT", cfg_data, DD_DAILY_LIMIT_PCT), DD_DAILY_LIMIT_PCT),
-        )
-        DD_WEEKLY_LIMIT_PCT = max(
-            0.1,
-            _parse_float(_env_or_cfg("DD_WEEKLY_LIMIT_PCT", cfg_data, DD_WEEKLY_LIMIT_PCT), DD_WEEKLY_LIMIT_PCT),
-        )
-        DD_ATH_TRAILING_LIMIT_PCT = max(
-            0.1,
-            _parse_float(
-                _env_or_cfg("DD_ATH_TRAILING_LIMIT_PCT", cfg_data, DD_ATH_TRAILING_LIMIT_PCT),
-                DD_ATH_TRAILING_LIMIT_PCT,
-            ),
-        )
-        DD_CHECK_SEC = max(
-            10,
-            _parse_int(_env_or_cfg("DD_CHECK_SEC", cfg_data, DD_CHECK_SEC), DD_CHECK_SEC),
-        )
-        DD_AUTO_FLATTEN = str(
-            _env_or_cfg("DD_AUTO_FLATTEN", cfg_data, "1" if DD_AUTO_FLATTEN else "0")
-        ).strip().lower() in {"1", "true", "yes", "on"}
-        DD_AUTO_PARK = str(
-            _env_or_cfg("DD_AUTO_PARK", cfg_data, "1" if DD_AUTO_PARK else "0")
-        ).strip().lower() in {"1", "true", "yes", "on"}
-        SIM_TAKER_FEE_RATE = max(
-            0.0,
-            _parse_float(_env_or_cfg("SIM_TAKER_FEE_RATE", cfg_data, SIM_TAKER_FEE_RATE), SIM_TAKER_FEE_RATE),
-        )
-        SIM_FUNDING_RATE_PER_8H = max(
-            0.0,
-            _parse_float(
-                _env_or_cfg("SIM_FUNDING_RATE_PER_8H", cfg_data, SIM_FUNDING_RATE_PER_8H),
-                SIM_FUNDING_RATE_PER_8H,
-            ),
-        )
-        SIM_SLIPPAGE_MIN_PCT = max(
-            0.0,
-            _parse_float(_env_or_cfg("SIM_SLIPPAGE_MIN_PCT", cfg_data, SIM_SLIPPAGE_MIN_PCT), SIM_SLIPPAGE_MIN_PCT),
-        )
-        SIM_SLIPPAGE_MAX_PCT = max(
-            SIM_SLIPPAGE_MIN_PCT,
-            _parse_float(_env_or_cfg("SIM_SLIPPAGE_MAX_PCT", cfg_data, SIM_SLIPPAGE_MAX_PCT), SIM_SLIPPAGE_MAX_PCT),
-        )
-        SIM_SLIPPAGE_ATR_MULT = max(
-            0.0,
-            _parse_float(_env_or_cfg("SIM_SLIPPAGE_ATR_MULT", cfg_data, SIM_SLIPPAGE_ATR_MULT), SIM_SLIPPAGE_ATR_MULT),
-        )
-        REGIME_CLASSIFIER_ASSET = str(_env_or_cfg("REGIME_CLASSIFIER_ASSET", cfg_data, REGIME_CLASSIFIER_ASSET)).strip() or "BTC-PERP-INTX"
-        REGIME_LOOKBACK_POINTS = max(
-            20,
-            _parse_int(_env_or_cfg("REGIME_LOOKBACK_POINTS", cfg_data, REGIME_LOOKBACK_POINTS), REGIME_LOOKBACK_POINTS),
-        )
-        REGIME_TREND_RET_PCT = max(
-            0.05,
-            _parse_float(_env_or_cfg("REGIME_TREND_RET_PCT", cfg_data, REGIME_TREND_RET_PCT), REGIME_TREND_RET_PCT),
-        )
-        REGIME_HIGH_VOL_ATR_PCT = max(
-            0.05,
-            _parse_float(_env_or_cfg("REGIME_HIGH_VOL_ATR_PCT", cfg_data, REGIME_HIGH_VOL_ATR_PCT), REGIME_HIGH_VOL_ATR_PCT),
-        )
-        REGIME_TREND_NOISE_RATIO = max(
-            0.5,
-            _parse_float(_env_or_cfg("REGIME_TREND_NOISE_RATIO", cfg_data, REGIME_TREND_NOISE_RATIO), REGIME_TREND_NOISE_RATIO),
-        )
-        REGIME_RISK_MULT_TREND = max(
-            0.1,
-            _parse_float(_env_or_cfg("REGIME_RISK_MULT_TREND", cfg_data, REGIME_RISK_MULT_TREND), REGIME_RISK_MULT_TREND),
-        )
-        REGIME_RISK_MULT_CHOP = max(
-            0.1,
-            _parse_float(_env_or_cfg("REGIME_RISK_MULT_CHOP", cfg_data, REGIME_RISK_MULT_CHOP), REGIME_RISK_MULT_CHOP),
-        )
-        REGIME_RISK_MULT_HIGH_VOL = max(
-            0.1,
-            _parse_float(_env_or_cfg("REGIME_RISK_MULT_HIGH_VOL", cfg_data, REGIME_RISK_MULT_HIGH_VOL), REGIME_RISK_MULT_HIGH_VOL),
-        )
-        REGIME_LEV_CAP_TREND = max(
-            1,
-            _parse_int(_env_or_cfg("REGIME_LEV_CAP_TREND", cfg_data, REGIME_LEV_CAP_TREND), REGIME_LEV_CAP_TREND),
-        )
-        REGIME_LEV_CAP_CHOP = max(
-            1,
-            _parse_int(_env_or_cfg("REGIME_LEV_CAP_CHOP", cfg_data, REGIME_LEV_CAP_CHOP), REGIME_LEV_CAP_CHOP),
-        )
-        REGIME_LEV_CAP_HIGH_VOL = max(
-            1,
-            _parse_int(_env_or_cfg("REGIME_LEV_CAP_HIGH_VOL", cfg_data, REGIME_LEV_CAP_HIGH_VOL), REGIME_LEV_CAP_HIGH_VOL),
-        )
-        REGIME_MIN_RR_ADD_TREND = max(
-            0.0,
-            _parse_float(_env_or_cfg("REGIME_MIN_RR_ADD_TREND", cfg_data, REGIME_MIN_RR_ADD_TREND), REGIME_MIN_RR_ADD_TREND),
-        )
-        REGIME_MIN_RR_ADD_CHOP = max(
-            0.0,
-            _parse_float(_env_or_cfg("REGIME_MIN_RR_ADD_CHOP", cfg_data, REGIME_MIN_RR_ADD_CHOP), REGIME_MIN_RR_ADD_CHOP),
-        )
-        REGIME_MIN_RR_ADD_HIGH_VOL = max(
-            0.0,
-            _parse_float(_env_or_cfg("REGIME_MIN_RR_ADD_HIGH_VOL", cfg_data, REGIME_MIN_RR_ADD_HIGH_VOL), REGIME_MIN_RR_ADD_HIGH_VOL),
-        )
-        DECISION_MIN_PUMP_SCORE = max(
-            0,
-            _parse_int(_env_or_cfg("DECISION_MIN_PUMP_SCORE", cfg_data, DECISION_MIN_PUMP_SCORE), DECISION_MIN_PUMP_SCORE),
-        )
-        DECISION_MIN_VOL_SPIKE = max(
-            0.0,
-            _parse_float(_env_or_cfg("DECISION_MIN_VOL_SPIKE", cfg_data, DECISION_MIN_VOL_SPIKE), DECISION_MIN_VOL_SPIKE),
-        )
-        DECISION_MIN_RR_AGGRESSIVE = max(
-            0.1,
-            _parse_float(
-                _env_or_cfg("DECISION_MIN_RR_AGGRESSIVE", cfg_data, DECISION_MIN_RR_AGGRESSIVE),
-                DECISION_MIN_RR_AGGRESSIVE,
-            ),
-        )
-        DECISION_MIN_RR_SAFE = max(
-            0.1,
-            _parse_float(_env_or_cfg("DECISION_MIN_RR_SAFE", cfg_data, DECISION_MIN_RR_SAFE), DECISION_MIN_RR_SAFE),
-        )
-        EXEC_POST_ONLY_ENABLED = str(
-            _env_or_cfg("EXEC_POST_ONLY_ENABLED", cfg_data, "1" if EXEC_POST_ONLY_ENABLED else "0")
-        ).strip().lower() in {"1", "true", "yes", "on"}
-        EXEC_POST_ONLY_OFFSET_PCT = max(
-            0.0,
-            _parse_float(
-                _env_or_cfg("EXEC_POST_ONLY_OFFSET_PCT", cfg_data, EXEC_POST_ONLY_OFFSET_PCT),
-                EXEC_POST_ONLY_OFFSET_PCT,
-            ),
-        )
-        EXEC_IOC_FALLBACK_ENABLED = str(
-            _env_or_cfg("EXEC_IOC_FALLBACK_ENABLED", cfg_data, "1" if EXEC_IOC_FALLBACK_ENABLED else "0")
-        ).strip().lower() in {"1", "true", "yes", "on"}
-        EXEC_IOC_SLIPPAGE_PCT = max(
-            0.0,
-            _parse_float(_env_or_cfg("EXEC_IOC_SLIPPAGE_PCT", cfg_data, EXEC_IOC_SLIPPAGE_PCT), EXEC_IOC_SLIPPAGE_PCT),
-        )
-        EXEC_MARKET_FALLBACK_ENABLED = str(
-            _env_or_cfg("EXEC_MARKET_FALLBACK_ENABLED", cfg_data, "1" if EXEC_MARKET_FALLBACK_ENABLED else "0")
-        ).strip().lower() in {"1", "true", "yes", "on"}
-        EXEC_MARKET_GUARD_MAX_SPREAD_PCT = max(
-            0.01,
-            _parse_float(
-                _env_or_cfg("EXEC_MARKET_GUARD_MAX_SPREAD_PCT", cfg_data, EXEC_MARKET_GUARD_MAX_SPREAD_PCT),
-                EXEC_MARKET_GUARD_MAX_SPREAD_PCT,
-            ),
-        )
-        EXEC_MARKET_GUARD_MAX_SIZE_TO_VOL1M_PCT = max(
-            0.01,
-            _parse_float(
-                _env_or_cfg(
-                    "EXEC_MARKET_GUARD_MAX_SIZE_TO_VOL1M_PCT",
-                    cfg_data,
-                    EXEC_MARKET_GUARD_MAX_SIZE_TO_VOL1M_PCT,
-                ),
-                EXEC_MARKET_GUARD_MAX_SIZE_TO_VOL1M_PCT,
-            ),
-        )
-        EXEC_MARKET_GUARD_LIMIT_RETRY_ENABLED = str(
-            _env_or_cfg(
-                "EXEC_MARKET_GUARD_LIMIT_RETRY_ENABLED",
-                cfg_data,
-                "1" if EXEC_MARKET_GUARD_LIMIT_RETRY_ENABLED else "0",
-            )
-        ).strip().lower() in {"1", "true", "yes", "on"}
-        EXEC_MARKET_GUARD_RETRY_IOC_SLIPPAGE_PCT = max(
-            0.0,
-            _parse_float(
-                _env_or_cfg(
-                    "EXEC_MARKET_GUARD_RETRY_IOC_SLIPPAGE_PCT",
-                    cfg_data,
-                    EXEC_MARKET_GUARD_RETRY_IOC_SLIPPAGE_PCT,
-                ),
-                EXEC_MARKET_GUARD_RETRY_IOC_SLIPPAGE_PCT,
-            ),
-        )
-        PYRAMID_ENABLED = str(
-            _env_or_cfg("PYRAMID_ENABLED", cfg_data, "1" if PYRAMID_ENABLED else "0")
-        ).strip().lower() in {"1", "true", "yes", "on"}
-        PYRAMID_RR_TRIGGER = max(
-            0.5,
-            _parse_float(_env_or_cfg("PYRAMID_RR_TRIGGER", cfg_data, PYRAMID_RR_TRIGGER), PYRAMID_RR_TRIGGER),
-        )
-        PYRAMID_ADD_FRACTION = max(
-            0.01,
-            min(
-                1.0,
-                _parse_float(_env_or_cfg("PYRAMID_ADD_FRACTION", cfg_data, PYRAMID_ADD_FRACTION), PYRAMID_ADD_FRACTION),
-            ),
-        )
-        PYRAMID_MAX_ADDS = max(
-            0,
-            _parse_int(_env_or_cfg("PYRAMID_MAX_ADDS", cfg_data, PYRAMID_MAX_ADDS), PYRAMID_MAX_ADDS),
-        )
-        PYRAMID_MIN_CONVICTION = max(
-            0,
-            min(
-                100,
-                _parse_int(
-                    _env_or_cfg("PYRAMID_MIN_CONVICTION", cfg_data, PYRAMID_MIN_CONVICTION),
-                    PYRAMID_MIN_CONVICTION,
-                ),
-            ),
-        )
-        PYRAMID_MAX_EXPOSURE_PCT = max(
-            0.01,
-            min(
-                1.0,
-                _parse_float(
-                    _env_or_cfg("PYRAMID_MAX_EXPOSURE_PCT", cfg_data, PYRAMID_MAX_EXPOSURE_PCT),
-                    PYRAMID_MAX_EXPOSURE_PCT,
-                ),
-            ),
-        )
-        DAILY_SCORE_ENABLED = str(
-            _env_or_cfg("DAILY_SCORE_ENABLED", cfg_data, "1" if DAILY_SCORE_ENABLED else "0")
-        ).strip().lower() in {"1", "true", "yes", "on"}
-        DAILY_SCORE_CSV_PATH = str(
-            _env_or_cfg("DAILY_SCORE_CSV_PATH", cfg_data, DAILY_SCORE_CSV_PATH)
-        ).strip() or "daily_score.csv"
-        DAILY_SCORE_CHECK_SEC = max(
-            10,
-            _parse_int(_env_or_cfg("DAILY_SCORE_CHECK_SEC", cfg_data, DAILY_SCORE_CHECK_SEC), DAILY_SCORE_CHECK_SEC),
-        )
-        GROK_SELF_CRITIQUE_ENABLED = str(
-            _env_or_cfg("GROK_SELF_CRITIQUE_ENABLED", cfg_data, "1" if GROK_SELF_CRITIQUE_ENABLED else "0")
-        ).strip().lower() in {"1", "true", "yes", "on"}
-        GROK_MIN_CRITIQUE_CONVICTION = max(
-            0,
-            min(
-                100,
-                _parse_int(
-                    _env_or_cfg("GROK_MIN_CRITIQUE_CONVICTION", cfg_data, GROK_MIN_CRITIQUE_CONVICTION),
-                    GROK_MIN_CRITIQUE_CONVICTION,
-                ),
-            ),
-        )
-        GROK_CONTEXT_RECENT_TRADES = max(
-            3,
-            _parse_int(_env_or_cfg("GROK_CONTEXT_RECENT_TRADES", cfg_data, GROK_CONTEXT_RECENT_TRADES), GROK_CONTEXT_RECENT_TRADES),
-        )
-        GROK_FREE_SIGNALS_TIMEOUT_SEC = max(
-            2,
-            _parse_int(
-                _env_or_cfg("GROK_FREE_SIGNALS_TIMEOUT_SEC", cfg_data, GROK_FREE_SIGNALS_TIMEOUT_SEC),
-                GROK_FREE_SIGNALS_TIMEOUT_SEC,
-            ),
-        )
-        GROK_FUNDING_FILTER_ENABLED = str(
-            _env_or_cfg("GROK_FUNDING_FILTER_ENABLED", cfg_data, "1" if GROK_FUNDING_FILTER_ENABLED else "0")
-        ).strip().lower() in {"1", "true", "yes", "on"}
-        GROK_FUNDING_BLOCK_LONG_PCT = _parse_float(
-            _env_or_cfg("GROK_FUNDING_BLOCK_LONG_PCT", cfg_data, GROK_FUNDING_BLOCK_LONG_PCT),
-            GROK_FUNDING_BLOCK_LONG_PCT,
-        )
-        GROK_FUNDING_BLOCK_SHORT_PCT = _parse_float(
-            _env_or_cfg("GROK_FUNDING_BLOCK_SHORT_PCT", cfg_data, GROK_FUNDING_BLOCK_SHORT_PCT),
-            GROK_FUNDING_BLOCK_SHORT_PCT,
-        )
-
-    return {
-        "PARK_FLAG": PARK_FLAG,
-        "READINESS_HOURS": READINESS_HOURS,
-        "RUMOR_SOURCE": RUMOR_SOURCE,
-        "RUMOR_POLL_SEC": RUMOR_POLL_SEC,
-        "RUMOR_MAX_POSTS": RUMOR_MAX_POSTS,
-        "RUMOR_LOOKBACK_HOURS": RUMOR_LOOKBACK_HOURS,
-        "DECISION_INTERVAL_SEC": DECISION_INTERVAL_SEC,
-        "PARKED_DECISION_INTERVAL_SEC": PARKED_DECISION_INTERVAL_SEC,
-        "PRICE_POLL_SEC": PRICE_POLL_SEC,
-        "ATR_REFRESH_SEC": ATR_REFRESH_SEC,
-        "BASKET_REFRESH_SEC": BASKET_REFRESH_SEC,
-        "PRODUCT_UNIVERSE": PRODUCT_UNIVERSE,
-        "SPOT_QUOTES": SPOT_QUOTES,
-        "SPOT_DISCOVERY_MODE": SPOT_DISCOVERY_MODE,
-        "SPOT_DISCOVERY_REFRESH_SEC": SPOT_DISCOVERY_REFRESH_SEC,
-        "SPOT_PRIORITY_SIZE": SPOT_PRIORITY_SIZE,
-        "SPOT_ACTIVE_SCAN_SIZE": SPOT_ACTIVE_SCAN_SIZE,
-        "HEALTH_DEGRADED_FAILURES": HEALTH_DEGRADED_FAILURES,
-        "HEALTH_OUTAGE_FAILURES": HEALTH_OUTAGE_FAILURES,
-        "HEALTH_RECOVER_SUCCESS_STREAK": HEALTH_RECOVER_SUCCESS_STREAK,
-        "HEALTH_OUTAGE_FLATTEN_SEC": HEALTH_OUTAGE_FLATTEN_SEC,
-        "HEALTH_BLOCK_RECOVERING": HEALTH_BLOCK_RECOVERING,
-        "DATAQ_MAX_PRICE_AGE_SEC": DATAQ_MAX_PRICE_AGE_SEC,
-        "DATAQ_MIN_BASKET_SIZE": DATAQ_MIN_BASKET_SIZE,
-        "DATAQ_MIN_FRESH_PRICE_RATIO": DATAQ_MIN_FRESH_PRICE_RATIO,
-        "DATAQ_MIN_ATR_COVERAGE_RATIO": DATAQ_MIN_ATR_COVERAGE_RATIO,
-        "DD_DAILY_LIMIT_PCT": DD_DAILY_LIMIT_PCT,
-        "DD_WEEKLY_LIMIT_PCT": DD_WEEKLY_LIMIT_PCT,
-        "DD_ATH_TRAILING_LIMIT_PCT": DD_ATH_TRAILING_LIMIT_PCT,
-        "DD_CHECK_SEC": DD_CHECK_SEC,
-        "DD_AUTO_FLATTEN": DD_AUTO_FLATTEN,
-        "DD_AUTO_PARK": DD_AUTO_PARK,
-        "SIM_TAKER_FEE_RATE": SIM_TAKER_FEE_RATE,
-        "SIM_FUNDING_RATE_PER_8H": SIM_FUNDING_RATE_PER_8H,
-        "SIM_SLIPPAGE_MIN_PCT": SIM_SLIPPAGE_MIN_PCT,
-        "SIM_SLIPPAGE_MAX_PCT": SIM_SLIPPAGE_MAX_PCT,
-        "SIM_SLIPPAGE_ATR_MULT": SIM_SLIPPAGE_ATR_MULT,
-        "REGIME_CLASSIFIER_ASSET": REGIME_CLASSIFIER_ASSET,
-        "REGIME_LOOKBACK_POINTS": REGIME_LOOKBACK_POINTS,
-        "REGIME_TREND_RET_PCT": REGIME_TREND_RET_PCT,
-        "REGIME_HIGH_VOL_ATR_PCT": REGIME_HIGH_VOL_ATR_PCT,
-        "REGIME_TREND_NOISE_RATIO": REGIME_TREND_NOISE_RATIO,
-        "REGIME_RISK_MULT_TREND": REGIME_RISK_MULT_TREND,
-        "REGIME_RISK_MULT_CHOP": REGIME_RISK_MULT_CHOP,
-        "REGIME_RISK_MULT_HIGH_VOL": REGIME_RISK_MULT_HIGH_VOL,
-        "REGIME_LEV_CAP_TREND": REGIME_LEV_CAP_TREND,
-        "REGIME_LEV_CAP_CHOP": REGIME_LEV_CAP_CHOP,
-        "REGIME_LEV_CAP_HIGH_VOL": REGIME_LEV_CAP_HIGH_VOL,
-        "REGIME_MIN_RR_ADD_TREND": REGIME_MIN_RR_ADD_TREND,
-        "REGIME_MIN_RR_ADD_CHOP": REGIME_MIN_RR_ADD_CHOP,
-        "REGIME_MIN_RR_ADD_HIGH_VOL": REGIME_MIN_RR_ADD_HIGH_VOL,
-        "DECISION_MIN_PUMP_SCORE": DECISION_MIN_PUMP_SCORE,
-        "DECISION_MIN_VOL_SPIKE": DECISION_MIN_VOL_SPIKE,
-        "DECISION_MIN_RR_AGGRESSIVE": DECISION_MIN_RR_AGGRESSIVE,
-        "DECISION_MIN_RR_SAFE": DECISION_MIN_RR_SAFE,
-        "EXEC_POST_ONLY_ENABLED": EXEC_POST_ONLY_ENABLED,
-        "EXEC_POST_ONLY_OFFSET_PCT": EXEC_POST_ONLY_OFFSET_PCT,
-        "EXEC_IOC_FALLBACK_ENABLED": EXEC_IOC_FALLBACK_ENABLED,
-        "EXEC_IOC_SLIPPAGE_PCT": EXEC_IOC_SLIPPAGE_PCT,
-        "EXEC_MARKET_FALLBACK_ENABLED": EXEC_MARKET_FALLBACK_ENABLED,
-        "EXEC_MARKET_GUARD_MAX_SPREAD_PCT": EXEC_MARKET_GUARD_MAX_SPREAD_PCT,
-        "EXEC_MARKET_GUARD_MAX_SIZE_TO_VOL1M_PCT": EXEC_MARKET_GUARD_MAX_SIZE_TO_VOL1M_PCT,
-        "EXEC_MARKET_GUARD_LIMIT_RETRY_ENABLED": EXEC_MARKET_GUARD_LIMIT_RETRY_ENABLED,
-        "EXEC_MARKET_GUARD_RETRY_IOC_SLIPPAGE_PCT": EXEC_MARKET_GUARD_RETRY_IOC_SLIPPAGE_PCT,
-        "PYRAMID_ENABLED": PYRAMID_ENABLED,
-        "PYRAMID_RR_TRIGGER": PYRAMID_RR_TRIGGER,
-        "PYRAMID_ADD_FRACTION": PYRAMID_ADD_FRACTION,
-        "PYRAMID_MAX_ADDS": PYRAMID_MAX_ADDS,
-        "PYRAMID_MIN_CONVICTION": PYRAMID_MIN_CONVICTION,
-        "PYRAMID_MAX_EXPOSURE_PCT": PYRAMID_MAX_EXPOSURE_PCT,
-        "DAILY_SCORE_ENABLED": DAILY_SCORE_ENABLED,
-        "DAILY_SCORE_CSV_PATH": DAILY_SCORE_CSV_PATH,
-        "DAILY_SCORE_CHECK_SEC": DAILY_SCORE_CHECK_SEC,
-        "GROK_SELF_CRITIQUE_ENABLED": GROK_SELF_CRITIQUE_ENABLED,
-        "GROK_MIN_CRITIQUE_CONVICTION": GROK_MIN_CRITIQUE_CONVICTION,
-        "GROK_CONTEXT_RECENT_TRADES": GROK_CONTEXT_RECENT_TRADES,
-        "GROK_FREE_SIGNALS_TIMEOUT_SEC": GROK_FREE_SIGNALS_TIMEOUT_SEC,
-        "GROK_FUNDING_FILTER_ENABLED": GROK_FUNDING_FILTER_ENABLED,
-        "GROK_FUNDING_BLOCK_LONG_PCT": GROK_FUNDING_BLOCK_LONG_PCT,
-        "GROK_FUNDING_BLOCK_SHORT_PCT": GROK_FUNDING_BLOCK_SHORT_PCT,
-    }
-
-SAFE_ASSETS = {"BTC-PERP-INTX", "ETH-PERP-INTX", "SOL-PERP-INTX"}
-
-if AdvancedTradeClient is not None and API_KEY and API_SECRET:
-    client = AdvancedTradeClient(API_KEY, API_SECRET)
-else:
-    client = None
-
-if AsyncOpenAI is not None and GROK_KEY:
-    grok = AsyncOpenAI(api_key=GROK_KEY, base_url="https://api.x.ai/v1")
-else:
-    grok = None
-
-state = {
-    "started_at": datetime.utcnow().isoformat(),
-    "equity": float(TRADE_BALANCE) if TRADE_BALANCE is not None else 250.0,
-    "sim_base_equity": float(TRADE_BALANCE) if TRADE_BALANCE is not None else 250.0,
-    "sim_realized_pnl": 0.0,
-    "positions": {},
-    "price": {},
-    "price_ts": {},
-    "price_history": {},
-    "vol_cache": {},
-    "mtf_cache": {},
-    "micro_cache": {},
-    "exec_liq_cache": {},
-    "spot_universe": [],
-    "spot_universe_count": 0,
-    "spot_priority": [],
-    "spot_scan_cursor": 0,
-    "spot_discovery_last_ts": None,
-    "new_alts": [],
-    "rumor_items": [],
-    "rumors_summary": "none",
-    "whale_summary": "none",
-    "whale_flow": {},
-    "spike_list": [],
-    "basket": ["BTC-PERP-INTX", "ETH-PERP-INTX", "SOL-PERP-INTX", "DOGE-PERP-INTX", "PEPE-PERP-INTX"],
-    "basket_ver": 0,
-    "parked": os.path.exists(PARK_FLAG),
-    "mode": "nuclear",
-    "aggr_target": float(TRADE_BALANCE) if TRADE_BALANCE is not None else 250.0,
-    "safe_target": 0.0,
-    "last_rebal": None,
-    "trades": {},  # order_id → info
-    "timers": {},
-    "ready_to_trade": False,
-    "last_decision": "n/a",
-    "last_decision_asset": None,
-    "last_decision_reason": "",
-    "last_decision_ts": None,
-    "health_state": "healthy",
-    "health_last_transition_ts": datetime.utcnow().isoformat(),
-    "health_consecutive_failures": 0,
-    "health_consecutive_successes": 0,
-    "health_last_success_ts": None,
-    "health_last_failure_ts": None,
-    "health_last_failure_reason": "",
-    "health_outage_since_ts": None,
-    "health_recovering_since_ts": None,
-    "health_outage_flattened": False,
-    "data_quality_last_ok": True,
-    "data_quality_last_reason": "",
-    "data_quality_last_check_ts": None,
-    "equity_history": [],
-    "drawdown_paused": False,
-    "drawdown_pause_reason": "",
-    "drawdown_pause_ts": None,
-    "drawdown_daily_date": None,
-    "drawdown_daily_peak": 0.0,
-    "drawdown_weekly_peak": 0.0,
-    "drawdown_ath_peak": 0.0,
-    "drawdown_daily_dd_pct": 0.0,
-    "drawdown_weekly_dd_pct": 0.0,
-    "drawdown_ath_dd_pct": 0.0,
-    "regime": "chop",
-    "regime_asset": "BTC-PERP-INTX",
-    "regime_last_ts": None,
-    "regime_metrics": {},
-    "decision_gate_last_ok": True,
-    "decision_gate_last_reason": "",
-    "decision_gate_last_ts": None,
-    "decision_gate_last_metrics": {},
-    "execution_last_ok": True,
-    "execution_last_path": "",
-    "execution_last_reason": "",
-    "execution_last_ts": None,
-    "daily_score_last_seen_day": None,
-    "daily_score_last_written_day": None,
-    "last_regime_signals": {},
-    "last_critique": {},
-    "recent_returns": [],
-    "equity_momentum_7d_return_pct": 0.0,
-}
\ No newline at end of file
+def __getattr__(name):
+    if not _CONFIG_READY:
+        _init_module_config()
+        if name in globals():
+            return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,182 @@
+import json
+import struct
+import sys
+from array import array
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+loads = orjson.loads if orjson is not None else json.loads
+
+
+def dumps(obj):
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(",", ":"), default=str).encode("utf-8")
+
+
+# Frame layout: [4B little-endian header length][JSON header][float32 history bytes].
+# The header carries `shapes`: [[path, count], ...] describing how the float tail
+# maps back into the decoded message, so numeric histories never go through JSON.
+_HEADER_LEN = struct.Struct("<I")
+_SWAP = sys.byteorder != "little"
+# Upper bound for one frame on the client side; a full snapshot is a few tens of KB.
+MAX_FRAME_BYTES = 2**20
+
+
+def _set_path(root, path, value):
+    node = root
+    for step in path[:-1]:
+        if isinstance(node, list):
+            node = node[step]
+        else:
+            node = node.setdefault(step, {})
+    node[path[-1]] = value
+
+
+def encode_frame(header, arrays=()):
+    blob = array("f")
+    shapes = []
+    for path, values in arrays:
+        points = [v for v in values if isinstance(v, (int, float))]
+        blob.extend(points)
+        shapes.append([list(path), len(points)])
+    if _SWAP:
+        blob.byteswap()
+
+    header = dict(header)
+    header["shapes"] = shapes
+    header_bytes = dumps(header)
+    return _HEADER_LEN.pack(len(header_bytes)) + header_bytes + blob.tobytes()
+
+
+def decode_frame(message):
+    if isinstance(message, str):
+        return loads(message)
+
+    view = memoryview(message)
+    (header_len,) = _HEADER_LEN.unpack_from(view, 0)
+    offset = _HEADER_LEN.size + header_len
+    header_view = view[_HEADER_LEN.size : offset]
+    # orjson reads the memoryview in place; the stdlib parser needs a bytes copy.
+    header = loads(header_view if orjson is not None else bytes(header_view))
+    if not isinstance(header, dict):
+        return header
+
+    for path, count in header.pop("shapes", None) or []:
+        values = array("f")
+        end = offset + int(count) * values.itemsize
+        values.frombytes(view[offset:end])
+        if _SWAP:
+            values.byteswap()
+        offset = end
+        # Histories stay as float32 arrays; consumers iterate them like lists.
+        _set_path(header, path, values)
+    return header
+
+
+def is_patch_frame(message):
+    # The header always leads with {"seq":N,"patch":..., so the kind is visible
+    # in the first few bytes without decoding the frame.
+    if isinstance(message, str):
+        return '"patch":' in message[:48]
+    return b'"patch":' in bytes(message[_HEADER_LEN.size : _HEADER_LEN.size + 48])
+
+
+# Longest run of new points a "push" op will carry; bigger changes go out as a plain "set".
+MAX_PUSH_POINTS = 16
+
+
+def _appended_tail(old, new):
+    # Histories are sliding windows: `new` is usually the tail of `old` plus a few fresh points.
+    # Returns those points when old + points, trimmed to len(new), rebuilds `new`.
+    for count in range(1, min(MAX_PUSH_POINTS, len(new) - 1) + 1):
+        kept = len(new) - count
+        if kept <= len(old) and new[:kept] == old[len(old) - kept :]:
+            return new[kept:]
+    return None
+
+
+def diff_snapshot(prev, cur, path=()):
+    ops = []
+    for key, value in cur.items():
+        if key in prev:
+            old = prev[key]
+            if old == value:
+                continue
+            if isinstance(old, dict) and isinstance(value, dict):
+                ops.extend(diff_snapshot(old, value, path + (key,)))
+                continue
+            if isinstance(old, list) and isinstance(value, list):
+                points = _appended_tail(old, value)
+                if points is not None:
+                    ops.append({"op": "push", "path": [*path, key], "value": points, "keep": len(value)})
+                    continue
+        ops.append({"op": "set", "path": [*path, key], "value": value})
+    for key in prev:
+        if key not in cur:
+            ops.append({"op": "del", "path": [*path, key]})
+    return ops
+
+
+def apply_patch(snapshot, ops):
+    for op in ops or []:
+        path = op.get("path") or []
+        if not path:
+            continue
+        kind = op.get("op")
+        if kind == "del":
+            node = snapshot
+            for step in path[:-1]:
+                node = node.get(step) if isinstance(node, dict) else None
+            if isinstance(node, dict):
+                node.pop(path[-1], None)
+        elif kind == "push":
+            node = snapshot
+            for step in path:
+                node = node.get(step) if isinstance(node, dict) else None
+            if isinstance(node, (list, array)):
+                node.extend(op.get("value") or [])
+                del node[: -int(op.get("keep") or 0) or len(node)]
+            else:
+                _set_path(snapshot, path, op.get("value"))
+        else:
+            _set_path(snapshot, path, op.get("value"))
+    return snapshot
+
+
+class SnapshotStream:
+    def __init__(self):
+        self.snapshot = None
+        self.expected_seq = None
+        self.request_resync = False
+        # Top-level keys touched by the last applied frame; None means "everything".
+        self.changed_keys = None
+
+    def feed(self, message):
+        frame = decode_frame(message)
+        if not isinstance(frame, dict):
+            return False
+
+        seq = frame.get("seq")
+        if "full" in frame:
+            if not isinstance(frame["full"], dict):
+                return False
+            self.snapshot = frame["full"]
+            self.changed_keys = None
+        elif "patch" in frame:
+            if self.snapshot is None or seq != self.expected_seq:
+                # Ask once per gap; patches are dropped until the next full frame lands.
+                self.request_resync = self.expected_seq is not None
+                self.expected_seq = None
+                return False
+            apply_patch(self.snapshot, frame["patch"])
+            self.changed_keys = {op["path"][0] for op in frame["patch"] if op.get("path")}
+        else:
+            self.snapshot = frame
+            self.changed_keys = None
+
+        self.expected_seq = seq + 1 if isinstance(seq, int) else None
+        return True
@@ -1,8 +1,16 @@
 import asyncio
-import json
+import time
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 
 from . import config as cfg
+from .console_wire import diff_snapshot, encode_frame
+
+FULL_SNAPSHOT_SEC = 30.0
+SNAPSHOT_TICK_SEC = 1.0
+# The dashboard never draws more than this many points per history, so the tail is all that ships.
+HISTORY_POINTS = 120
 
 try:
     import websockets
@@ -10,10 +18,29 @@ except ImportError:
     websockets = None
 
 
+@lru_cache(maxsize=256)
+def _shorten(text, limit):
+    text = text.replace("\n", " ").strip()
+    if len(text) > limit:
+        return text[: limit - 3] + "..."
+    return text
+
+
+# top_prices rows from the previous snapshot, keyed by asset. A row whose values did not
+# change is reused as-is instead of rebuilt; rows are never mutated once handed out, since
+# the previous snapshot is still needed for diffing.
+_top_price_rows = {}
+# rumors.py swaps in a new rumor_items list on each refresh, so the headlines built from the
+# previous list are reused until that happens.
+_rumor_headlines = {"source": None, "rows": []}
+
+
 def _snapshot():
+    global _top_price_rows
     cfg.reload_hot_config()
+    st = cfg.state
     open_trades = []
-    for trade_id, trade in cfg.state.get("trades", {}).items():
+    for trade_id, trade in st.get("trades", {}).items():
         if trade.get("status") != "open":
             continue
         open_trades.append(
@@ -35,113 +62,177 @@ def _snapshot():
             }
         )
 
-    basket = list(cfg.state.get("basket", []))
-    top_assets = basket[:8]
+    basket = st.get("basket", [])
+    top_assets = list(basket[:8])
+    price = st.get("price") or {}
+    vol_cache = st.get("vol_cache") or {}
+    liq_cache = st.get("exec_liq_cache") or {}
+    price_history = st.get("price_history") or {}
     top_prices = []
     top_histories = {}
+    previous_rows = _top_price_rows
+    rows = {}
     for asset in top_assets:
-        liq = (cfg.state.get("exec_liq_cache", {}) or {}).get(asset) or {}
-        top_prices.append(
-            {
+        vol = vol_cache.get(asset) or {}
+        liq = liq_cache.get(asset) or {}
+        values = (price.get(asset), vol.get("atr_1h"), vol.get("atr_6h"), liq.get("spread_pct"), liq.get("volume_1m"))
+        cached = previous_rows.get(asset)
+        if cached is not None and cached[0] == values:
+            row = cached[1]
+        else:
+            row = {
                 "asset": asset,
-                "price": cfg.state.get("price", {}).get(asset),
-                "atr_1h": (cfg.state.get("vol_cache", {}).get(asset) or {}).get("atr_1h"),
-                "atr_6h": (cfg.state.get("vol_cache", {}).get(asset) or {}).get("atr_6h"),
-                "spread_pct": liq.get("spread_pct"),
-                "volume_1m": liq.get("volume_1m"),
+                "price": values[0],
+                "atr_1h": values[1],
+                "atr_6h": values[2],
+                "spread_pct": values[3],
+                "volume_1m": values[4],
             }
-        )
-        top_histories[asset] = (cfg.state.get("price_history", {}).get(asset) or [])[-120:]
+        rows[asset] = (values, row)
+        top_prices.append(row)
+        points = price_history.get(asset) or ()
+        top_histories[asset] = list(islice(points, max(0, len(points) - HISTORY_POINTS), None))
+
+    _top_price_rows = rows
 
     focus_asset = top_assets[0] if top_assets else None
-    rumor_items = cfg.state.get("rumor_items", [])[:8]
-    rumor_headlines = []
-    for item in rumor_items:
-        rumor_headlines.append(
-            {
-                "asset": item.get("asset"),
-                "sent": item.get("sent"),
-                "pump": item.get("pump"),
-                "rumor": item.get("rumor"),
-            }
-        )
+    rumor_source = st.get("rumor_items", [])
+    if rumor_source is not _rumor_headlines["source"]:
+        rumor_headlines = []
+        for item in rumor_source[:8]:
+            rumor_headlines.append(
+                {
+                    "asset": item.get("asset"),
+                    "sent": item.get("sent"),
+                    "pump": item.get("pump"),
+                    "rumor": item.get("rumor"),
+                    "rumor_short": _shorten(str(item.get("rumor") or ""), 56),
+                }
+            )
+        _rumor_headlines.update(source=rumor_source, rows=rumor_headlines)
+    rumor_headlines = _rumor_headlines["rows"]
 
-    started_at_raw = cfg.state.get("started_at")
-    ready_to_trade = bool(cfg.state.get("ready_to_trade", False))
-    if started_at_raw:
-        try:
-            started = datetime.fromisoformat(str(started_at_raw).replace("Z", "+00:00")).replace(tzinfo=None)
-            elapsed_h = max(0.0, (datetime.utcnow() - started).total_seconds() / 3600.0)
-            ready_to_trade = elapsed_h >= float(cfg.READINESS_HOURS or 0)
-        except ValueError:
-            pass
+    elapsed_h = max(0.0, (datetime.utcnow() - cfg.started_at_dt).total_seconds() / 3600.0)
+    ready_to_trade = elapsed_h >= float(cfg.READINESS_HOURS or 0)
 
     return {
         "ts": datetime.utcnow().isoformat(),
-        "started_at": cfg.state.get("started_at"),
+        "started_at": st.get("started_at"),
         "readiness_hours": cfg.READINESS_HOURS,
         "ready_to_trade": ready_to_trade,
-        "health_state": cfg.state.get("health_state", "healthy"),
-        "health_last_transition_ts": cfg.state.get("health_last_transition_ts"),
-        "health_last_success_ts": cfg.state.get("health_last_success_ts"),
-        "health_last_failure_ts": cfg.state.get("health_last_failure_ts"),
-        "health_last_failure_reason": cfg.state.get("health_last_failure_reason", ""),
-        "health_outage_since_ts": cfg.state.get("health_outage_since_ts"),
-        "health_outage_flattened": cfg.state.get("health_outage_flattened", False),
-        "data_quality_last_ok": cfg.state.get("data_quality_last_ok", True),
-        "data_quality_last_reason": cfg.state.get("data_quality_last_reason", ""),
-        "data_quality_last_check_ts": cfg.state.get("data_quality_last_check_ts"),
-        "drawdown_paused": cfg.state.get("drawdown_paused", False),
-        "drawdown_pause_reason": cfg.state.get("drawdown_pause_reason", ""),
-        "drawdown_pause_ts": cfg.state.get("drawdown_pause_ts"),
-        "drawdown_daily_dd_pct": cfg.state.get("drawdown_daily_dd_pct", 0.0),
-        "drawdown_weekly_dd_pct": cfg.state.get("drawdown_weekly_dd_pct", 0.0),
-        "drawdown_ath_dd_pct": cfg.state.get("drawdown_ath_dd_pct", 0.0),
-        "drawdown_daily_peak": cfg.state.get("drawdown_daily_peak", 0.0),
-        "drawdown_weekly_peak": cfg.state.get("drawdown_weekly_peak", 0.0),
-        "drawdown_ath_peak": cfg.state.get("drawdown_ath_peak", 0.0),
-        "regime": cfg.state.get("regime", "chop"),
-        "regime_asset": cfg.state.get("regime_asset"),
-        "regime_last_ts": cfg.state.get("regime_last_ts"),
-        "regime_metrics": cfg.state.get("regime_metrics", {}),
-        "decision_gate_last_ok": cfg.state.get("decision_gate_last_ok", True),
-        "decision_gate_last_reason": cfg.state.get("decision_gate_last_reason", ""),
-        "decision_gate_last_ts": cfg.state.get("decision_gate_last_ts"),
-        "decision_gate_last_metrics": cfg.state.get("decision_gate_last_metrics", {}),
-        "execution_last_ok": cfg.state.get("execution_last_ok", True),
-        "execution_last_path": cfg.state.get("execution_last_path", ""),
-        "execution_last_reason": cfg.state.get("execution_last_reason", ""),
-        "execution_last_ts": cfg.state.get("execution_last_ts"),
-        "equity": cfg.state.get("equity"),
-        "equity_raw": cfg.state.get("equity_raw"),
-        "sim_base_equity": cfg.state.get("sim_base_equity"),
-        "sim_realized_pnl": cfg.state.get("sim_realized_pnl"),
-        "mode": cfg.state.get("mode"),
-        "aggr_target": cfg.state.get("aggr_target"),
-        "safe_target": cfg.state.get("safe_target"),
-        "parked": cfg.state.get("parked"),
-        "new_alts": cfg.state.get("new_alts", [])[:8],
-        "basket_size": len(cfg.state.get("basket", [])),
-        "price_count": len(cfg.state.get("price", {})),
+        "health_state": st.get("health_state", "healthy"),
+        "health_last_transition_ts": st.get("health_last_transition_ts"),
+        "health_last_success_ts": st.get("health_last_success_ts"),
+        "health_last_failure_ts": st.get("health_last_failure_ts"),
+        "health_last_failure_reason": st.get("health_last_failure_reason", ""),
+        "health_outage_since_ts": st.get("health_outage_since_ts"),
+        "health_outage_flattened": st.get("health_outage_flattened", False),
+        "data_quality_last_ok": st.get("data_quality_last_ok", True),
+        "data_quality_last_reason": st.get("data_quality_last_reason", ""),
+        "data_quality_last_check_ts": st.get("data_quality_last_check_ts"),
+        "drawdown_paused": st.get("drawdown_paused", False),
+        "drawdown_pause_reason": st.get("drawdown_pause_reason", ""),
+        "drawdown_pause_ts": st.get("drawdown_pause_ts"),
+        "drawdown_daily_dd_pct": st.get("drawdown_daily_dd_pct", 0.0),
+        "drawdown_weekly_dd_pct": st.get("drawdown_weekly_dd_pct", 0.0),
+        "drawdown_ath_dd_pct": st.get("drawdown_ath_dd_pct", 0.0),
+        "drawdown_daily_peak": st.get("drawdown_daily_peak", 0.0),
+        "drawdown_weekly_peak": st.get("drawdown_weekly_peak", 0.0),
+        "drawdown_ath_peak": st.get("drawdown_ath_peak", 0.0),
+        "regime": st.get("regime", "chop"),
+        "regime_asset": st.get("regime_asset"),
+        "regime_last_ts": st.get("regime_last_ts"),
+        "regime_metrics": st.get("regime_metrics", {}),
+        "decision_gate_last_ok": st.get("decision_gate_last_ok", True),
+        "decision_gate_last_reason": st.get("decision_gate_last_reason", ""),
+        "decision_gate_last_ts": st.get("decision_gate_last_ts"),
+        "decision_gate_last_metrics": st.get("decision_gate_last_metrics", {}),
+        "execution_last_ok": st.get("execution_last_ok", True),
+        "execution_last_path": st.get("execution_last_path", ""),
+        "execution_last_reason": st.get("execution_last_reason", ""),
+        "execution_last_ts": st.get("execution_last_ts"),
+        "equity": st.get("equity"),
+        "equity_raw": st.get("equity_raw"),
+        "sim_base_equity": st.get("sim_base_equity"),
+        "sim_realized_pnl": st.get("sim_realized_pnl"),
+        "mode": st.get("mode"),
+        "aggr_target": st.get("aggr_target"),
+        "safe_target": st.get("safe_target"),
+        "parked": st.get("parked"),
+        "new_alts": st.get("new_alts", [])[:8],
+        "basket_size": len(basket),
+        "price_count": len(price),
         "open_trades_count": len(open_trades),
         "top_prices": top_prices,
         "top_histories": top_histories,
         "open_trades": open_trades,
-        "rumors_summary": cfg.state.get("rumors_summary", "none"),
-        "whale_summary": cfg.state.get("whale_summary", "none"),
-        "whale_flow": cfg.state.get("whale_flow", {}),
+        "rumors_summary": st.get("rumors_summary", "none"),
+        "whale_summary": st.get("whale_summary", "none"),
+        "whale_flow": st.get("whale_flow", {}),
         "rumor_headlines": rumor_headlines,
-        "last_decision": cfg.state.get("last_decision"),
-        "last_decision_asset": cfg.state.get("last_decision_asset"),
-        "last_decision_reason": cfg.state.get("last_decision_reason"),
-        "last_decision_ts": cfg.state.get("last_decision_ts"),
-        "recent_returns": cfg.state.get("recent_returns", []),
-        "equity_momentum_7d_return_pct": cfg.state.get("equity_momentum_7d_return_pct", 0.0),
+        "last_decision": st.get("last_decision"),
+        "last_decision_asset": st.get("last_decision_asset"),
+        "last_decision_reason": st.get("last_decision_reason"),
+        "last_decision_reason_short": _shorten(str(st.get("last_decision_reason") or ""), 120),
+        "last_decision_ts": st.get("last_decision_ts"),
+        "recent_returns": st.get("recent_returns", []),
+        "equity_momentum_7d_return_pct": st.get("equity_momentum_7d_return_pct", 0.0),
         "focus_asset": focus_asset,
-        "focus_price_history": cfg.state.get("price_history", {}).get(focus_asset, [])[-120:] if focus_asset else [],
+        "focus_price_history": top_histories[focus_asset] if focus_asset else [],
     }
 
 
+def _is_history(path):
+    if len(path) == 1:
+        return path[0] == "focus_price_history"
+    return len(path) == 2 and path[0] == "top_histories"
+
+
+def _pack_histories(value, path, wire_path, arrays):
+    if _is_history(path) and isinstance(value, list):
+        arrays.append((wire_path, value))
+        return []
+    if isinstance(value, dict) and (not path or path == ["top_histories"]):
+        return {key: _pack_histories(item, path + [key], wire_path + [key], arrays) for key, item in value.items()}
+    return value
+
+
+def _encode_message(message):
+    arrays = []
+    header = {"seq": message["seq"]}
+    if "full" in message:
+        header["full"] = _pack_histories(message["full"], [], ["full"], arrays)
+    else:
+        header["patch"] = [
+            dict(op, value=_pack_histories(op["value"], op["path"], ["patch", index, "value"], arrays)) if "value" in op else op
+            for index, op in enumerate(message["patch"])
+        ]
+    return encode_frame(header, arrays)
+
+
+# One snapshot per tick is shared by every client. `seq` is the generation number, so the
+# patch from the previous generation is identical for all clients and is encoded once.
+_frames = {"seq": 0, "built_at": None, "snapshot": None, "full": None, "patch": None}
+
+
+def _latest_frames():
+    now = time.monotonic()
+    if _frames["built_at"] is None or now - _frames["built_at"] >= SNAPSHOT_TICK_SEC:
+        snapshot = _snapshot()
+        previous = _frames["snapshot"]
+        seq = _frames["seq"] + 1
+        _frames.update(seq=seq, built_at=now, snapshot=snapshot, full=None, patch=None)
+        if previous is not None:
+            _frames["patch"] = _encode_message({"seq": seq, "patch": diff_snapshot(previous, snapshot)})
+    return _frames
+
+
+def _full_frame(frames):
+    if frames["full"] is None:
+        frames["full"] = _encode_message({"seq": frames["seq"], "full": frames["snapshot"]})
+    return frames["full"]
+
+
 async def serve(host="0.0.0.0", port=None):
     if port is None:
         port = cfg.PORT
@@ -151,10 +242,29 @@ async def serve(host="0.0.0.0", port=None):
             await asyncio.sleep(3600)
 
     async def handler(websocket):
+        last_seq = None
+        last_full = 0.0
         try:
             while True:
-                await websocket.send(json.dumps(_snapshot()))
-                await asyncio.sleep(1)
+                frames = _latest_frames()
+                now = time.monotonic()
+                if frames["seq"] != last_seq:
+                    # Clients that skipped a generation (or just connected) need the full state.
+                    if last_seq != frames["seq"] - 1 or frames["patch"] is None or now - last_full >= FULL_SNAPSHOT_SEC:
+                        payload = _full_frame(frames)
+                        last_full = now
+                    else:
+                        payload = frames["patch"]
+                    last_seq = frames["seq"]
+                    await websocket.send(payload)
+
+                # Waiting on recv doubles as the 1s tick; a client that saw a seq gap asks for a resync.
+                try:
+                    request = await asyncio.wait_for(websocket.recv(), timeout=1)
+                except asyncio.TimeoutError:
+                    continue
+                if request == "resync":
+                    last_seq = None
         except websockets.exceptions.ConnectionClosed:
             return
         except Exception as exc:
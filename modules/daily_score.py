@@ -4,6 +4,9 @@ import json
 import os
 import sqlite3
 from datetime import datetime, timedelta, time, timezone
+from functools import lru_cache
+from itertools import accumulate
+from operator import itemgetter
 
 from . import config as cfg
 
@@ -21,28 +24,115 @@ HEADER = [
 ]
 
 
+RECENT_RETURNS_DAYS = 14
+TAIL_SCAN_MIN_BYTES = 64 * 1024
+TAIL_CHUNK_BYTES = 8192
+
+# Parsed CSV results keyed on (path, mtime_ns, size); appends made here update it in place.
+_csv_cache = {"key": None, "dates": None, "recent": None}
+
+
+# Read-only connections reused across ticks; the writers elsewhere keep their own.
+_read_conns = {}
+
+
+def _read_conn(db_path):
+    conn = _read_conns.get(db_path)
+    if conn is None:
+        conn = sqlite3.connect(db_path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA query_only=1")
+        _read_conns[db_path] = conn
+    return conn
+
+
+def _csv_key(csv_path):
+    try:
+        st = os.stat(csv_path)
+    except OSError:
+        return None
+    return (csv_path, st.st_mtime_ns, st.st_size)
+
+
+def _cache_for(key):
+    if _csv_cache["key"] != key:
+        _csv_cache.update(key=key, dates=None, recent=None)
+    return _csv_cache
+
+
+def _read_pct_values_full(csv_path):
+    pct_values = []
+    with open(csv_path, "r", newline="", encoding="utf-8") as handle:
+        reader = csv.DictReader(handle)
+        if not reader.fieldnames or "daily_pnl_pct" not in reader.fieldnames:
+            return None
+        for row in reader:
+            try:
+                pct_values.append(float(row.get("daily_pnl_pct", 0.0)))
+            except (TypeError, ValueError):
+                continue
+    return pct_values
+
+
+def _read_pct_values_tail(csv_path, count):
+    with open(csv_path, "rb") as handle:
+        header = next(csv.reader([handle.readline().decode("utf-8")]), [])
+        if "daily_pnl_pct" not in header:
+            return None
+        column = header.index("daily_pnl_pct")
+        body_start = handle.tell()
+
+        end = handle.seek(0, os.SEEK_END)
+        pos = end
+        tail = b""
+        pct_values = []
+        while pos > body_start:
+            step = min(TAIL_CHUNK_BYTES, pos - body_start)
+            pos -= step
+            handle.seek(pos)
+            tail = handle.read(step) + tail
+            # Keep widening until enough complete rows parse (one extra newline for the partial line).
+            if tail.count(b"\n") <= count and pos > body_start:
+                continue
+            lines = tail.decode("utf-8", errors="replace").splitlines()
+            if pos > body_start:
+                lines = lines[1:]
+            pct_values = []
+            for row in csv.reader(lines):
+                if len(row) <= column:
+                    continue
+                try:
+                    pct_values.append(float(row[column]))
+                except ValueError:
+                    continue
+            if len(pct_values) >= count:
+                break
+        return pct_values
+
+
 def _refresh_recent_returns_from_csv():
     csv_path = cfg.DAILY_SCORE_CSV_PATH
-    if not os.path.exists(csv_path):
+    key = _csv_key(csv_path)
+    if key is None:
         cfg.state["recent_returns"] = []
         cfg.state["equity_momentum_7d_return_pct"] = 0.0
         return
 
-    pct_values = []
-    try:
-        with open(csv_path, "r", newline="", encoding="utf-8") as handle:
-            reader = csv.DictReader(handle)
-            if not reader.fieldnames or "daily_pnl_pct" not in reader.fieldnames:
-                return
-            for row in reader:
-                try:
-                    pct_values.append(float(row.get("daily_pnl_pct", 0.0)))
-                except (TypeError, ValueError):
-                    continue
-    except OSError:
-        return
+    cache = _cache_for(key)
+    pct_values = cache["recent"]
+    if pct_values is None:
+        try:
+            if key[2] < TAIL_SCAN_MIN_BYTES:
+                pct_values = _read_pct_values_full(csv_path)
+            else:
+                pct_values = _read_pct_values_tail(csv_path, RECENT_RETURNS_DAYS)
+        except OSError:
+            return
+        if pct_values is None:
+            return
+        pct_values = pct_values[-RECENT_RETURNS_DAYS:]
+        cache["recent"] = pct_values
 
-    pct_values = pct_values[-14:]
     dec_values = [value / 100.0 for value in pct_values]
     cfg.state["recent_returns"] = dec_values
     cfg.state["equity_momentum_7d_return_pct"] = float(sum(pct_values[-7:])) if pct_values else 0.0
@@ -56,15 +146,17 @@ def _safe_float(value, default=0.0):
 
 
 def _today_utc_date():
-    return datetime.now().astimezone().date()
+    return datetime.now().date()
 
 
+@lru_cache(maxsize=16)
 def _utc_naive_bounds_for_local_day(day_text):
-    local_tz = datetime.now().astimezone().tzinfo
     local_day = datetime.fromisoformat(f"{day_text}T00:00:00").date()
 
-    start_local = datetime.combine(local_day, time.min, tzinfo=local_tz)
-    end_local = start_local + timedelta(days=1)
+    # Naive local midnights resolve against the process TZ for that date, so no
+    # "now" lookup is needed and DST days get their own offsets.
+    start_local = datetime.combine(local_day, time.min).astimezone()
+    end_local = datetime.combine(local_day + timedelta(days=1), time.min).astimezone()
 
     start_utc = start_local.astimezone(timezone.utc).replace(tzinfo=None)
     end_utc = end_local.astimezone(timezone.utc).replace(tzinfo=None)
@@ -78,9 +170,42 @@ def _to_date_text(value):
 
 
 def _load_written_dates(csv_path):
-    if not os.path.exists(csv_path):
+    key = _csv_key(csv_path)
+    if key is None:
         return set()
 
+    cache = _cache_for(key)
+    if cache["dates"] is None:
+        cache["dates"] = _read_written_dates(csv_path)
+    return cache["dates"]
+
+
+def _index_path(csv_path):
+    return os.path.splitext(csv_path)[0] + ".idx"
+
+
+def _read_written_dates(csv_path):
+    # The sidecar index is appended right after each CSV row, so it is current unless the
+    # CSV was edited afterwards; in that case rebuild it from a full scan.
+    index_path = _index_path(csv_path)
+    try:
+        if os.stat(index_path).st_mtime_ns >= os.stat(csv_path).st_mtime_ns:
+            with open(index_path, "r", encoding="utf-8") as handle:
+                return {line.strip() for line in handle if line.strip()}
+    except OSError:
+        pass
+
+    dates = _scan_written_dates(csv_path)
+    try:
+        with open(index_path + ".tmp", "w", encoding="utf-8") as handle:
+            handle.writelines(f"{day}\n" for day in sorted(dates))
+        os.replace(index_path + ".tmp", index_path)
+    except OSError as exc:
+        cfg.logger.debug("Daily score index rebuild failed for %s: %s", index_path, exc)
+    return dates
+
+
+def _scan_written_dates(csv_path):
     dates = set()
     try:
         with open(csv_path, "r", newline="", encoding="utf-8") as handle:
@@ -125,55 +250,48 @@ def _ensure_csv_with_header(csv_path):
 
 def _equity_stats_for_day(day_text):
     start_utc, end_utc = _utc_naive_bounds_for_local_day(day_text)
-    rows = []
-    with sqlite3.connect("portfolio.db") as conn:
-        rows = conn.execute(
-            "SELECT ts, equity FROM equity_history WHERE ts >= ? AND ts < ? ORDER BY ts ASC, id ASC",
-            (start_utc, end_utc),
-        ).fetchall()
+    # SQLite does the float coercion (CAST matches _safe_float: non-numeric text becomes 0.0),
+    # so the rows go straight into the running-max pass.
+    rows = _read_conn("portfolio.db").execute(
+        "SELECT CAST(equity AS REAL) FROM equity_history WHERE ts >= ? AND ts < ? ORDER BY ts ASC, id ASC",
+        (start_utc, end_utc),
+    ).fetchall()
 
     if not rows:
         equity_now = _safe_float(cfg.state.get("equity"), 0.0)
         return equity_now, equity_now, 0.0
 
-    points = [_safe_float(item[1], 0.0) for item in rows]
+    points = list(map(itemgetter(0), rows))
     equity_start = points[0]
     equity_end = points[-1]
 
-    peak = points[0]
-    max_dd = 0.0
-    for equity in points:
-        peak = max(peak, equity)
-        if peak > 0:
-            dd = ((peak - equity) / peak) * 100.0
-            if dd > max_dd:
-                max_dd = dd
+    worst = max(
+        ((peak - equity) / peak for peak, equity in zip(accumulate(points, max), points) if peak > 0),
+        default=0.0,
+    )
+    max_dd = max(0.0, worst * 100.0)
 
     return equity_start, equity_end, max_dd
 
 
-def _trade_stats_for_day(day_text):
-    start_utc, end_utc = _utc_naive_bounds_for_local_day(day_text)
-    with sqlite3.connect("trades.db") as conn:
-        trades_row = conn.execute(
-            """
-            SELECT
-              COUNT(*) AS trades,
-              SUM(CASE WHEN pnl > 0 THEN 1 ELSE 0 END) AS wins
-            FROM trades
-            WHERE ts >= ? AND ts < ?
-            """,
-            (start_utc, end_utc),
-        ).fetchone()
+_TRADE_STATS_SQL = """
+SELECT
+  (SELECT COUNT(*) FROM trades WHERE ts >= :start AND ts < :end) AS trades,
+  (SELECT SUM(CASE WHEN pnl > 0 THEN 1 ELSE 0 END) FROM trades WHERE ts >= :start AND ts < :end) AS wins,
+  (
+    SELECT AVG(json_extract(payload, '$.rr'))
+    FROM trade_events
+    WHERE event_type='trade_opened' AND ts >= :start AND ts < :end
+      AND json_valid(payload) AND json_type(payload, '$.rr') IN ('integer', 'real')
+  ) AS avg_rr
+"""
 
-        event_rows = conn.execute(
-            "SELECT payload FROM trade_events WHERE event_type='trade_opened' AND ts >= ? AND ts < ?",
-            (start_utc, end_utc),
-        ).fetchall()
 
-    trades = int((trades_row or [0, 0])[0] or 0)
-    wins = int((trades_row or [0, 0])[1] or 0)
-    win_rate = (wins / trades * 100.0) if trades > 0 else 0.0
+def _avg_rr_from_payloads(conn, start_utc, end_utc):
+    event_rows = conn.execute(
+        "SELECT payload FROM trade_events WHERE event_type='trade_opened' AND ts >= ? AND ts < ?",
+        (start_utc, end_utc),
+    ).fetchall()
 
     rr_values = []
     for payload_raw, in event_rows:
@@ -188,8 +306,32 @@ def _trade_stats_for_day(day_text):
             continue
         rr_values.append(rr_val)
 
-    avg_rr = (sum(rr_values) / len(rr_values)) if rr_values else 0.0
-    return trades, win_rate, avg_rr
+    return (sum(rr_values) / len(rr_values)) if rr_values else 0.0
+
+
+def _trade_stats_for_day(day_text):
+    start_utc, end_utc = _utc_naive_bounds_for_local_day(day_text)
+    conn = _read_conn("trades.db")
+    try:
+        trades, wins, avg_rr = conn.execute(_TRADE_STATS_SQL, {"start": start_utc, "end": end_utc}).fetchone()
+    except sqlite3.OperationalError:
+        # SQLite built without JSON1: aggregate the counts in SQL and decode payloads here.
+        trades, wins = conn.execute(
+            """
+            SELECT
+              COUNT(*) AS trades,
+              SUM(CASE WHEN pnl > 0 THEN 1 ELSE 0 END) AS wins
+            FROM trades
+            WHERE ts >= ? AND ts < ?
+            """,
+            (start_utc, end_utc),
+        ).fetchone()
+        avg_rr = _avg_rr_from_payloads(conn, start_utc, end_utc)
+
+    trades = int(trades or 0)
+    wins = int(wins or 0)
+    win_rate = (wins / trades * 100.0) if trades > 0 else 0.0
+    return trades, win_rate, float(avg_rr or 0.0)
 
 
 def _health_score():
@@ -245,6 +387,18 @@ def append_daily_score(day_text):
     with open(csv_path, "a", newline="", encoding="utf-8") as handle:
         writer = csv.writer(handle)
         writer.writerow(row)
+    try:
+        with open(_index_path(csv_path), "a", encoding="utf-8") as handle:
+            handle.write(f"{day_text}\n")
+    except OSError as exc:
+        cfg.logger.debug("Daily score index append failed for %s: %s", day_text, exc)
+
+    cache = _csv_cache
+    if cache["dates"] is written_dates:
+        cache["key"] = _csv_key(csv_path)
+        written_dates.add(day_text)
+        if cache["recent"] is not None:
+            cache["recent"] = (cache["recent"] + [float(row[3])])[-RECENT_RETURNS_DAYS:]
 
     cfg.state["daily_score_last_written_day"] = day_text
     _refresh_recent_returns_from_csv()
@@ -254,6 +408,9 @@ def append_daily_score(day_text):
 
 async def daily_score_loop():
     _refresh_recent_returns_from_csv()
+    # Yesterday's row only needs settling once per day (written now or found already present);
+    # a failed append leaves this unset so the next tick retries.
+    settled_day = None
     while True:
         cfg.reload_hot_config()
 
@@ -265,19 +422,14 @@ async def daily_score_loop():
         now_day_text = _to_date_text(now_day)
         yesterday_text = _to_date_text(now_day - timedelta(days=1))
 
-        if cfg.state.get("daily_score_last_seen_day") is None:
-            cfg.state["daily_score_last_seen_day"] = now_day_text
-
-        try:
-            append_daily_score(yesterday_text)
-        except Exception as exc:
-            cfg.logger.error("Daily score append failed for %s: %s", yesterday_text, exc)
-
-        if cfg.state.get("daily_score_last_seen_day") != now_day_text:
+        if settled_day != yesterday_text:
             try:
                 append_daily_score(yesterday_text)
+                settled_day = yesterday_text
             except Exception as exc:
-                cfg.logger.error("Daily rollover append failed for %s: %s", yesterday_text, exc)
+                cfg.logger.error("Daily score append failed for %s: %s", yesterday_text, exc)
+
+        if cfg.state.get("daily_score_last_seen_day") != now_day_text:
             cfg.state["daily_score_last_seen_day"] = now_day_text
 
         await asyncio.sleep(max(10, int(cfg.DAILY_SCORE_CHECK_SEC)))
@@ -1,22 +1,59 @@
-from datetime import datetime
+import time
+from itertools import compress, islice
 
 from . import config as cfg
 
 
-def _seconds_since(ts_text):
-    if not ts_text:
+def _seconds_since(ts, now=None):
+    # price_ts holds epoch seconds (time.time()) per asset.
+    if not ts:
         return None
+    return max(0.0, (now or time.time()) - ts)
+
+
+def _is_valid_price(raw_price):
     try:
-        when = datetime.fromisoformat(str(ts_text).replace("Z", "+00:00")).replace(tzinfo=None)
-    except ValueError:
-        return None
-    return max(0.0, (datetime.utcnow() - when).total_seconds())
+        return float(raw_price) > 0
+    except (TypeError, ValueError):
+        return False
+
+
+def _sample_failed(assets, flags, limit=5):
+    return list(islice(compress(assets, (not ok for ok in flags)), limit))
+
+
+def _has_atr(atr_bundle):
+    return bool(atr_bundle) and (atr_bundle.get("atr_1h") is not None or atr_bundle.get("atr_6h") is not None)
+
+
+# Last result, keyed on what it was computed from. Freshness also ages with the clock,
+# so a hit is only served until the first fresh price would cross max_age.
+_dq_cache = {"key": None, "expires": 0.0, "result": None}
 
 
 def evaluate_pre_grok_data_quality():
     cfg.reload_hot_config()
 
-    basket = list(cfg.state.get("basket", []))
+    st = cfg.state
+    ts_map = st.get("price_ts", {})
+    key = (
+        st.get("basket_ver"),
+        len(st.get("basket", [])),
+        max(filter(None, ts_map.values()), default=None),
+        len(st.get("vol_cache", {})),
+        cfg.CONFIG_REV,
+    )
+    now_mono = time.monotonic()
+    if _dq_cache["key"] == key and now_mono < _dq_cache["expires"]:
+        return _dq_cache["result"]
+
+    result, ttl = _evaluate(st)
+    _dq_cache.update(key=key, expires=now_mono + ttl, result=result)
+    return result
+
+
+def _evaluate(st):
+    basket = list(st.get("basket", []))
     basket_size = len(basket)
     min_basket_size = int(cfg.DATAQ_MIN_BASKET_SIZE)
 
@@ -28,44 +65,34 @@ def evaluate_pre_grok_data_quality():
                 "basket_size": basket_size,
                 "required_min": min_basket_size,
             },
-        }
+        }, float("inf")
 
     checked = basket[: max(1, min(40, basket_size))]
     max_age = int(cfg.DATAQ_MAX_PRICE_AGE_SEC)
 
-    fresh_prices = 0
-    valid_prices = 0
-    atr_coverage = 0
-    stale_assets = []
-    invalid_assets = []
-    atr_missing_assets = []
-
-    for asset in checked:
-        raw_price = cfg.state.get("price", {}).get(asset)
-        try:
-            price = float(raw_price)
-            is_valid = price > 0
-        except (TypeError, ValueError):
-            is_valid = False
-
-        if is_valid:
-            valid_prices += 1
-        else:
-            invalid_assets.append(asset)
-
-        age_sec = _seconds_since(cfg.state.get("price_ts", {}).get(asset))
-        if age_sec is not None and age_sec <= max_age and is_valid:
-            fresh_prices += 1
-        else:
-            stale_assets.append(asset)
-
-        atr_bundle = (cfg.state.get("vol_cache", {}).get(asset) or {})
-        atr_1h = atr_bundle.get("atr_1h")
-        atr_6h = atr_bundle.get("atr_6h")
-        if atr_1h is not None or atr_6h is not None:
-            atr_coverage += 1
-        else:
-            atr_missing_assets.append(asset)
+    price_map = st.get("price", {})
+    ts_map = st.get("price_ts", {})
+    vol_cache = st.get("vol_cache", {})
+    now = time.time()
+
+    # One flag column per check over the checked assets. Counts are sums over the columns;
+    # sample assets are only collected for the check that fails.
+    valid = [_is_valid_price(price_map.get(asset)) for asset in checked]
+    fresh = []
+    oldest_fresh_age = None
+    for asset, is_valid in zip(checked, valid):
+        age_sec = _seconds_since(ts_map.get(asset), now) if is_valid else None
+        is_fresh = age_sec is not None and age_sec <= max_age
+        fresh.append(is_fresh)
+        if is_fresh and (oldest_fresh_age is None or age_sec > oldest_fresh_age):
+            oldest_fresh_age = age_sec
+    # Stale prices only get older until price_ts moves, which changes the cache key.
+    ttl = float("inf") if oldest_fresh_age is None else max(0.0, max_age - oldest_fresh_age)
+    atr_present = [_has_atr(vol_cache.get(asset)) for asset in checked]
+
+    valid_prices = sum(valid)
+    fresh_prices = sum(fresh)
+    atr_coverage = sum(atr_present)
 
     total = len(checked)
     fresh_ratio = (fresh_prices / total) if total > 0 else 0.0
@@ -81,9 +108,9 @@ def evaluate_pre_grok_data_quality():
             "details": {
                 "valid_prices": valid_prices,
                 "total_assets": total,
-                "sample_assets": invalid_assets[:5],
+                "sample_assets": _sample_failed(checked, valid),
             },
-        }
+        }, ttl
 
     if fresh_ratio < min_fresh_ratio:
         return {
@@ -93,9 +120,9 @@ def evaluate_pre_grok_data_quality():
                 "fresh_ratio": round(fresh_ratio, 4),
                 "required_min_ratio": min_fresh_ratio,
                 "max_age_sec": max_age,
-                "sample_assets": stale_assets[:5],
+                "sample_assets": _sample_failed(checked, fresh),
             },
-        }
+        }, ttl
 
     if atr_ratio < min_atr_ratio:
         return {
@@ -104,9 +131,9 @@ def evaluate_pre_grok_data_quality():
             "details": {
                 "atr_ratio": round(atr_ratio, 4),
                 "required_min_ratio": min_atr_ratio,
-                "sample_assets": atr_missing_assets[:5],
+                "sample_assets": _sample_failed(checked, atr_present),
             },
-        }
+        }, ttl
 
     return {
         "ok": True,
@@ -118,4 +145,4 @@ def evaluate_pre_grok_data_quality():
             "atr_ratio": round(atr_ratio, 4),
             "max_price_age_sec": max_age,
         },
-    }
+    }, ttl
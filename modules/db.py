@@ -1,131 +1,422 @@
+import atexit
 import sqlite3
 import json
-from datetime import datetime
+import queue
+import time
+from datetime import datetime, timezone
+from threading import Lock, Thread
 
-from .config import state
+from .config import logger, state
 
 try:
-	from dateutil import parser as dt_parser
+	import orjson
 except ImportError:
-	dt_parser = None
+	orjson = None
+
+
+def _dumps(obj):
+	# Payload columns are TEXT, so orjson's bytes are decoded back to str.
+	if orjson is not None:
+		return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+	return json.dumps(obj, separators=(",", ":"), default=str)
+
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+# journal_mode sticks to the database file; the rest are per connection.
+_PRAGMAS = (
+	"PRAGMA journal_mode=WAL",
+	"PRAGMA synchronous=NORMAL",
+	"PRAGMA temp_store=MEMORY",
+	"PRAGMA cache_size=-20000",
+	"PRAGMA mmap_size=268435456",
+	# The writer thread checkpoints on a timer, so no COMMIT pays for one (see _writer_loop).
+	"PRAGMA wal_autocheckpoint=0",
+)
+
+
+def _apply_pragmas(conn):
+	for pragma in _PRAGMAS:
+		conn.execute(pragma)
+
+
+# One long-lived autocommit connection per database file, shared by every caller.
+# Statements that write hold _WRITE_LOCK so they never interleave across threads.
+_conns = {}
+_CONN_LOCK = Lock()
+_WRITE_LOCK = Lock()
+
+# sqlite3 keeps compiled statements per connection, keyed by SQL text, so every queued write
+# uses one of these fixed strings and only binds + steps after its first run on the pooled connection.
+_STATEMENT_CACHE_SIZE = 256
+# ts_ms (epoch milliseconds) sits next to the ISO text ts. When the caller has no epoch at
+# hand it is derived from the ts parameter inside SQLite, so no row is written without one.
+_TS_MS_SQL = "CAST(ROUND((julianday({}) - 2440587.5) * 86400000) AS INTEGER)"
+_INSERT_EQUITY_POINT = (
+	"INSERT INTO equity_history (ts, equity, ts_ms) VALUES (?1, ?2, COALESCE(?3, " + _TS_MS_SQL.format("?1") + "))"
+)
+_UPSERT_TRADE_JOURNAL = (
+	"INSERT OR REPLACE INTO trades (id, ts, asset, side, size, entry, exit, pnl, pnl_gross, fee_cost, funding_cost, reason, ts_ms) "
+	"VALUES (?1, ?2, ?3, ?4, ?5, ?6, ?7, ?8, ?9, ?10, ?11, ?12, " + _TS_MS_SQL.format("?2") + ")"
+)
+_UPSERT_LIVE_TRADE = "INSERT OR REPLACE INTO live_trades (id, updated_ts, payload) VALUES (?,?,?)"
+_DELETE_LIVE_TRADE = "DELETE FROM live_trades WHERE id = ?"
+_INSERT_STATE = "INSERT INTO state (ts, total, mode, aggr, safe, reason) VALUES (?,?,?,?,?,?)"
+_INSERT_TRADE_EVENT = (
+	"INSERT INTO trade_events (event_id, ts, event_type, decision_id, trade_id, asset, payload, ts_ms) "
+	"VALUES (?1, ?2, ?3, ?4, ?5, ?6, ?7, " + _TS_MS_SQL.format("?2") + ")"
+)
+
+
+def _get_conn(path):
+	conn = _conns.get(path)
+	if conn is None:
+		with _CONN_LOCK:
+			conn = _conns.get(path)
+			if conn is None:
+				conn = sqlite3.connect(
+					path,
+					check_same_thread=False,
+					isolation_level=None,
+					cached_statements=_STATEMENT_CACHE_SIZE,
+				)
+				_apply_pragmas(conn)
+				_conns[path] = conn
+	return conn
+
+
+# Reads use a second, query_only connection per file. They never run inside the writer
+# thread's open transaction, so they only see committed rows. _READ_LOCK keeps the event loop
+# and worker threads from interleaving on the shared read connection.
+_read_conns = {}
+_READ_LOCK = Lock()
+
+
+def _read_conn(path):
+	conn = _read_conns.get(path)
+	if conn is None:
+		conn = sqlite3.connect(
+			path,
+			check_same_thread=False,
+			isolation_level=None,
+			cached_statements=_STATEMENT_CACHE_SIZE,
+		)
+		_apply_pragmas(conn)
+		conn.execute("PRAGMA query_only=1")
+		_read_conns[path] = conn
+	return conn
+
+
+def _read(path, sql, params=()):
+	with _READ_LOCK:
+		return _read_conn(path).execute(sql, params).fetchall()
+
+
+_schema_ready = False
+
+# Columns added after the first release, per database file. A file whose PRAGMA user_version
+# is already _SCHEMA_VERSION has all of them; bump it when appending here.
+_SCHEMA_VERSION = 1
+_MIGRATIONS = {
+	"trades.db": [
+		("trades", "pnl_gross", "REAL"),
+		("trades", "fee_cost", "REAL"),
+		("trades", "funding_cost", "REAL"),
+		("trades", "ts_ms", "INTEGER"),
+		("trade_events", "ts_ms", "INTEGER"),
+	],
+	"portfolio.db": [
+		("equity_history", "ts_ms", "INTEGER"),
+	],
+}
 
 
 def init_db():
+	global _schema_ready
+
 	for db, sql in [
 		(
 			"trades.db",
-			"CREATE TABLE IF NOT EXISTS trades (id TEXT PRIMARY KEY, ts TEXT, asset TEXT, side TEXT, size REAL, entry REAL, exit REAL, pnl REAL, pnl_gross REAL, fee_cost REAL, funding_cost REAL, reason TEXT)",
+			"CREATE TABLE IF NOT EXISTS trades (id TEXT PRIMARY KEY, ts TEXT, asset TEXT, side TEXT, size REAL, entry REAL, exit REAL, pnl REAL, pnl_gross REAL, fee_cost REAL, funding_cost REAL, reason TEXT, ts_ms INTEGER)",
 		),
 		(
 			"trades.db",
-			"CREATE TABLE IF NOT EXISTS trade_events (event_id TEXT PRIMARY KEY, ts TEXT NOT NULL, event_type TEXT NOT NULL, decision_id TEXT, trade_id TEXT, asset TEXT, payload TEXT NOT NULL)",
+			"CREATE TABLE IF NOT EXISTS trade_events (event_id TEXT PRIMARY KEY, ts TEXT NOT NULL, event_type TEXT NOT NULL, decision_id TEXT, trade_id TEXT, asset TEXT, payload TEXT NOT NULL, ts_ms INTEGER)",
 		),
 		("trades.db", "CREATE TABLE IF NOT EXISTS live_trades (id TEXT PRIMARY KEY, updated_ts TEXT, payload TEXT NOT NULL)"),
 		("rumors.db", "CREATE TABLE IF NOT EXISTS rumors (id INTEGER PRIMARY KEY AUTOINCREMENT, ts TEXT, asset TEXT, rumor TEXT, sent REAL, pump INTEGER, whale TEXT)"),
 		("portfolio.db", "CREATE TABLE IF NOT EXISTS state (id INTEGER PRIMARY KEY AUTOINCREMENT, ts TEXT, total REAL, mode TEXT, aggr REAL, safe REAL, reason TEXT)"),
-		("portfolio.db", "CREATE TABLE IF NOT EXISTS equity_history (id INTEGER PRIMARY KEY AUTOINCREMENT, ts TEXT NOT NULL, equity REAL NOT NULL)")
+		("portfolio.db", "CREATE TABLE IF NOT EXISTS equity_history (id INTEGER PRIMARY KEY AUTOINCREMENT, ts TEXT NOT NULL, equity REAL NOT NULL, ts_ms INTEGER)"),
+		("portfolio.db", "CREATE INDEX IF NOT EXISTS idx_equity_history_ts ON equity_history (ts)"),
+		("trades.db", "CREATE INDEX IF NOT EXISTS idx_trades_ts ON trades (ts)"),
+		("trades.db", "CREATE INDEX IF NOT EXISTS idx_trade_events_type_ts ON trade_events (event_type, ts)"),
+		("trades.db", "CREATE INDEX IF NOT EXISTS idx_trade_events_ts ON trade_events (ts)"),
+		("trades.db", "DROP INDEX IF EXISTS idx_trades_asset_ts"),
 	]:
-		with sqlite3.connect(db) as conn:
-			conn.execute(sql)
-
-	with sqlite3.connect("trades.db") as conn:
-		columns = {
-			str(row[1]).strip().lower()
-			for row in conn.execute("PRAGMA table_info(trades)").fetchall()
-			if len(row) > 1
-		}
-		if "pnl_gross" not in columns:
-			conn.execute("ALTER TABLE trades ADD COLUMN pnl_gross REAL")
-		if "fee_cost" not in columns:
-			conn.execute("ALTER TABLE trades ADD COLUMN fee_cost REAL")
-		if "funding_cost" not in columns:
-			conn.execute("ALTER TABLE trades ADD COLUMN funding_cost REAL")
+		with _WRITE_LOCK:
+			_get_conn(db).execute(sql)
+
+	for db, migrations in _MIGRATIONS.items():
+		conn = _get_conn(db)
+		with _WRITE_LOCK:
+			if conn.execute("PRAGMA user_version").fetchone()[0] >= _SCHEMA_VERSION:
+				continue
+			# Files from before user_version was kept may already have some of these columns.
+			for table, column, decl in migrations:
+				if column not in _table_columns(conn, table):
+					conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {decl}")
+					if column == "ts_ms":
+						conn.execute(f"UPDATE {table} SET ts_ms = {_TS_MS_SQL.format('ts')} WHERE ts_ms IS NULL")
+			conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+	with _WRITE_LOCK:
+		_get_conn("trades.db").execute("CREATE INDEX IF NOT EXISTS idx_trades_asset_ts_ms ON trades (asset, ts_ms DESC)")
+	_schema_ready = True
+
+
+def _table_columns(conn, table):
+	return {str(row[1]).strip().lower() for row in conn.execute(f"PRAGMA table_info({table})").fetchall() if len(row) > 1}
+
+
+# Row writes are queued and applied by one writer thread, so a slow COMMIT or WAL checkpoint
+# never stalls the event loop. Whatever is queued when the thread wakes up is written in one
+# transaction per database file, and files written to are checkpointed every _CHECKPOINT_SEC.
+_write_q = queue.Queue()
+_writer = None
+_WRITE_BATCH = 256
+_CHECKPOINT_SEC = 30.0
+# Longest the interpreter-exit flush waits for the writer before giving up on the queue.
+_EXIT_FLUSH_SEC = 10.0
+
+
+def _enqueue_write(path, sql, params, many=False):
+	global _writer
+	if _writer is None or not _writer.is_alive():
+		with _CONN_LOCK:
+			if _writer is None or not _writer.is_alive():
+				_writer = Thread(target=_writer_loop, name="db-writer", daemon=True)
+				_writer.start()
+	_write_q.put((path, sql, params, many))
+
+
+def _write_batch(path, statements):
+	conn = _get_conn(path)
+	with _WRITE_LOCK:
+		try:
+			conn.execute("BEGIN")
+			for sql, params, many in statements:
+				# Each queued call is its own savepoint: a failing bulk insert is undone as a whole,
+				# while the other writes in the batch still commit.
+				conn.execute("SAVEPOINT queued_write")
+				try:
+					if many:
+						conn.executemany(sql, params)
+					else:
+						conn.execute(sql, params)
+				except sqlite3.Error as exc:
+					conn.execute("ROLLBACK TO queued_write")
+					logger.warning("DB write to %s failed: %s", path, exc)
+				conn.execute("RELEASE queued_write")
+			conn.execute("COMMIT")
+		except sqlite3.Error as exc:
+			logger.warning("DB commit to %s failed: %s", path, exc)
+			if conn.in_transaction:
+				conn.execute("ROLLBACK")
+
+
+def _checkpoint(paths):
+	for path in paths:
+		with _WRITE_LOCK:
+			try:
+				_get_conn(path).execute("PRAGMA wal_checkpoint(PASSIVE)")
+			except Exception as exc:
+				logger.debug("WAL checkpoint of %s failed: %s", path, exc)
+
+
+def _writer_loop():
+	dirty = set()
+	last_checkpoint = time.monotonic()
+	while True:
+		try:
+			batch = [_write_q.get(timeout=_CHECKPOINT_SEC)]
+		except queue.Empty:
+			batch = []
+		while batch and len(batch) < _WRITE_BATCH:
+			try:
+				batch.append(_write_q.get_nowait())
+			except queue.Empty:
+				break
+
+		try:
+			by_path = {}
+			for path, sql, params, many in batch:
+				by_path.setdefault(path, []).append((sql, params, many))
+			for path, statements in by_path.items():
+				try:
+					_write_batch(path, statements)
+				except Exception as exc:
+					# The thread must outlive any one batch, or every later write would sit in the queue.
+					logger.error("DB writer dropped %d writes to %s: %s", len(statements), path, exc)
+			dirty.update(by_path)
+
+			now = time.monotonic()
+			if dirty and now - last_checkpoint >= _CHECKPOINT_SEC:
+				_checkpoint(dirty)
+				dirty.clear()
+				last_checkpoint = now
+		except Exception as exc:
+			logger.error("DB writer error: %s", exc)
+		finally:
+			for _ in batch:
+				_write_q.task_done()
+
+
+def flush_writes(timeout=None):
+	# Blocks until every queued write is committed, or until timeout seconds pass.
+	# Returns whether the queue was drained.
+	deadline = None if timeout is None else time.monotonic() + timeout
+	with _write_q.all_tasks_done:
+		while _write_q.unfinished_tasks:
+			if deadline is None:
+				_write_q.all_tasks_done.wait()
+				continue
+			remaining = deadline - time.monotonic()
+			if remaining <= 0:
+				return False
+			_write_q.all_tasks_done.wait(remaining)
+	return True
+
+
+def _flush_at_exit():
+	if _writer is None or not _writer.is_alive():
+		if _write_q.unfinished_tasks:
+			logger.error("DB writer is not running; %d queued writes were not saved", _write_q.unfinished_tasks)
+		return
+	if not flush_writes(_EXIT_FLUSH_SEC):
+		logger.error("DB writer did not drain within %.0fs at exit; %d writes pending", _EXIT_FLUSH_SEC, _write_q.unfinished_tasks)
+
+
+atexit.register(_flush_at_exit)
+
+
+def _ensure_schema():
+	# Tables and migrations are set up once by init_db; this only covers callers that
+	# write before main() ran it (scripts, tests).
+	if not _schema_ready:
+		init_db()
 
 
 def load_state():
-	with sqlite3.connect("portfolio.db") as conn:
-		row = conn.execute("SELECT * FROM state ORDER BY id DESC LIMIT 1").fetchone()
-	if row:
-		if row[1]:
-			if dt_parser is not None:
-				parsed_ts = dt_parser.parse(row[1])
-			else:
-				parsed_ts = datetime.fromisoformat(row[1].replace("Z", "+00:00"))
+	# id is the rowid, so the latest snapshot is one b-tree seek however long the history gets.
+	rows = _read("portfolio.db", "SELECT ts, mode, aggr, safe FROM state ORDER BY id DESC LIMIT 1")
+	if rows:
+		ts_text, mode, aggr, safe = rows[0]
+		if ts_text:
+			# save_state writes utcnow_iso() text, a format the stdlib parser reads directly.
+			parsed_ts = datetime.fromisoformat(ts_text.replace("Z", "+00:00"))
 		else:
 			parsed_ts = None
 		state.update(
-			mode=row[3],
-			aggr_target=row[4] or 0,
-			safe_target=row[5] or 0,
+			mode=mode,
+			aggr_target=aggr or 0,
+			safe_target=safe or 0,
 			last_rebal=parsed_ts,
 		)
 
 
+# Timestamps are naive UTC ISO text, the same as datetime.utcnow().isoformat(). The
+# seconds part only changes once a second, so it is formatted once and reused. The
+# (second, prefix) pair is swapped in one assignment so other threads never see it half updated.
+_iso_cache = (None, "")
+
+
+def utcnow_iso(now=None):
+	global _iso_cache
+	if now is None:
+		now = time.time()
+	second = int(now)
+	cached_second, prefix = _iso_cache
+	if second != cached_second:
+		prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+		_iso_cache = (second, prefix)
+	micros = int((now - second) * 1_000_000)
+	return f"{prefix}.{micros:06d}" if micros else prefix
+
+
 def save_state(total, mode, aggr, safe, reason=""):
-	with sqlite3.connect("portfolio.db") as conn:
-		conn.execute(
-			"INSERT INTO state (ts, total, mode, aggr, safe, reason) VALUES (?,?,?,?,?,?)",
-			(datetime.utcnow().isoformat(), total, mode, aggr, safe, reason),
-		)
+	_enqueue_write("portfolio.db", _INSERT_STATE, (utcnow_iso(), total, mode, aggr, safe, reason))
 
 
-def save_equity_history_point(ts_text, equity):
-	with sqlite3.connect("portfolio.db") as conn:
-		conn.execute(
-			"CREATE TABLE IF NOT EXISTS equity_history (id INTEGER PRIMARY KEY AUTOINCREMENT, ts TEXT NOT NULL, equity REAL NOT NULL)"
-		)
-		conn.execute(
-			"INSERT INTO equity_history (ts, equity) VALUES (?,?)",
-			(ts_text, float(equity)),
-		)
+def save_equity_history_point(ts_text, equity, ts_ms=None):
+	_ensure_schema()
+	_enqueue_write("portfolio.db", _INSERT_EQUITY_POINT, (ts_text, float(equity), ts_ms))
+
+
+def save_equity_history_points_bulk(points):
+	_ensure_schema()
+	rows = [(ts_text, float(equity), None) for ts_text, equity in points]
+	if rows:
+		_enqueue_write("portfolio.db", _INSERT_EQUITY_POINT, rows, many=True)
 
 
 def load_equity_history_points(limit=3000):
 	limit = max(1, int(limit))
-	with sqlite3.connect("portfolio.db") as conn:
-		conn.execute(
-			"CREATE TABLE IF NOT EXISTS equity_history (id INTEGER PRIMARY KEY AUTOINCREMENT, ts TEXT NOT NULL, equity REAL NOT NULL)"
-		)
-		rows = conn.execute(
-			"SELECT ts, equity FROM equity_history ORDER BY id DESC LIMIT ?",
-			(limit,),
-		).fetchall()
+	_ensure_schema()
+	rows = _read(
+		"portfolio.db",
+		"SELECT ts_ms, ts, equity FROM equity_history ORDER BY id DESC LIMIT ?",
+		(limit,),
+	)
 
-	rows.reverse()
+	# ts_ms is the epoch already; the naive UTC ISO text is only parsed for rows without one.
+	# equity is written as a float, so it is passed through as sqlite3 returns it.
 	result = []
-	for ts_text, equity in rows:
+	for ts_ms, ts_text, equity in reversed(rows):
+		if ts_ms is not None:
+			result.append({"ts_epoch": ts_ms / 1000.0, "equity": equity})
+			continue
 		try:
-			result.append({"ts": str(ts_text), "equity": float(equity)})
-		except (TypeError, ValueError):
+			when = datetime.fromisoformat(ts_text.replace("Z", "+00:00"))
+		except (AttributeError, ValueError):
 			continue
+		result.append({"ts_epoch": when.replace(tzinfo=timezone.utc).timestamp(), "equity": equity})
 	return result
 
 
+def get_equity_peaks(weekly_cutoff_ms):
+	_ensure_schema()
+	((weekly_peak, ath_peak),) = _read(
+		"portfolio.db",
+		"SELECT MAX(CASE WHEN ts_ms >= ? THEN equity END), MAX(equity) FROM equity_history",
+		(int(weekly_cutoff_ms),),
+	)
+	return float(weekly_peak or 0.0), float(ath_peak or 0.0)
+
+
 def save_live_trade(trade_id, trade_payload):
-	with sqlite3.connect("trades.db") as conn:
-		conn.execute(
-			"INSERT OR REPLACE INTO live_trades (id, updated_ts, payload) VALUES (?,?,?)",
-			(
-				trade_id,
-				datetime.utcnow().isoformat(),
-				json.dumps(trade_payload, separators=(",", ":"), default=str),
-			),
-		)
+	# The payload is serialised now; the trade dict keeps changing after this call.
+	_enqueue_write(
+		"trades.db",
+		_UPSERT_LIVE_TRADE,
+		(
+			trade_id,
+			utcnow_iso(),
+			_dumps(trade_payload),
+		),
+	)
 
 
 def delete_live_trade(trade_id):
-	with sqlite3.connect("trades.db") as conn:
-		conn.execute("DELETE FROM live_trades WHERE id = ?", (trade_id,))
+	_enqueue_write("trades.db", _DELETE_LIVE_TRADE, (trade_id,))
 
 
 def load_live_trades():
 	result = {}
-	with sqlite3.connect("trades.db") as conn:
-		rows = conn.execute("SELECT id, payload FROM live_trades").fetchall()
+	rows = _read("trades.db", "SELECT id, payload FROM live_trades")
 
 	for trade_id, payload in rows:
 		try:
-			result[trade_id] = json.loads(payload)
+			result[trade_id] = _loads(payload)
 		except (TypeError, ValueError):
 			continue
 	return result
@@ -145,66 +436,71 @@ def save_trade_journal(
 	fee_cost=None,
 	funding_cost=None,
 ):
-	with sqlite3.connect("trades.db") as conn:
-		conn.execute(
-			"CREATE TABLE IF NOT EXISTS trades (id TEXT PRIMARY KEY, ts TEXT, asset TEXT, side TEXT, size REAL, entry REAL, exit REAL, pnl REAL, pnl_gross REAL, fee_cost REAL, funding_cost REAL, reason TEXT)"
-		)
-		columns = {
-			str(row[1]).strip().lower()
-			for row in conn.execute("PRAGMA table_info(trades)").fetchall()
-			if len(row) > 1
-		}
-		if "pnl_gross" not in columns:
-			conn.execute("ALTER TABLE trades ADD COLUMN pnl_gross REAL")
-		if "fee_cost" not in columns:
-			conn.execute("ALTER TABLE trades ADD COLUMN fee_cost REAL")
-		if "funding_cost" not in columns:
-			conn.execute("ALTER TABLE trades ADD COLUMN funding_cost REAL")
-
-		conn.execute(
-			"""
-			INSERT OR REPLACE INTO trades (id, ts, asset, side, size, entry, exit, pnl, pnl_gross, fee_cost, funding_cost, reason)
-			VALUES (?,?,?,?,?,?,?,?,?,?,?,?)
-			""",
-			(
-				trade_id,
-				ts,
-				asset,
-				side,
-				size,
-				entry,
-				exit_price,
-				pnl,
-				pnl_gross,
-				fee_cost,
-				funding_cost,
-				reason,
-			),
-		)
+	_ensure_schema()
+	_enqueue_write(
+		"trades.db",
+		_UPSERT_TRADE_JOURNAL,
+		(
+			trade_id,
+			ts,
+			asset,
+			side,
+			size,
+			entry,
+			exit_price,
+			pnl,
+			pnl_gross,
+			fee_cost,
+			funding_cost,
+			reason,
+		),
+	)
 
 
-def save_trade_event(event_id, ts, event_type, decision_id=None, trade_id=None, asset=None, payload=None):
+def _trade_event_row(event_id, ts, event_type, decision_id=None, trade_id=None, asset=None, payload=None):
 	if payload is None:
 		payload = {}
-	with sqlite3.connect("trades.db") as conn:
-		conn.execute(
-			"CREATE TABLE IF NOT EXISTS trade_events (event_id TEXT PRIMARY KEY, ts TEXT NOT NULL, event_type TEXT NOT NULL, decision_id TEXT, trade_id TEXT, asset TEXT, payload TEXT NOT NULL)"
-		)
-		conn.execute(
-			"""
-			INSERT INTO trade_events (event_id, ts, event_type, decision_id, trade_id, asset, payload)
-			VALUES (?,?,?,?,?,?,?)
-			""",
-			(
-				str(event_id),
-				str(ts),
-				str(event_type),
-				None if decision_id is None else str(decision_id),
-				None if trade_id is None else str(trade_id),
-				None if asset is None else str(asset),
-				json.dumps(payload, separators=(",", ":"), default=str),
-			),
-		)
+	return (
+		str(event_id),
+		str(ts),
+		str(event_type),
+		None if decision_id is None else str(decision_id),
+		None if trade_id is None else str(trade_id),
+		None if asset is None else str(asset),
+		_dumps(payload),
+	)
+
+
+def save_trade_event(event_id, ts, event_type, decision_id=None, trade_id=None, asset=None, payload=None):
+	row = _trade_event_row(event_id, ts, event_type, decision_id, trade_id, asset, payload)
+	_ensure_schema()
+	_enqueue_write("trades.db", _INSERT_TRADE_EVENT, row)
+
+
+def save_trade_events_bulk(events):
+	# events: mappings with save_trade_event's keyword arguments.
+	_ensure_schema()
+	rows = [_trade_event_row(**event) for event in events]
+	if rows:
+		_enqueue_write("trades.db", _INSERT_TRADE_EVENT, rows, many=True)
+
+
+_RECENT_TRADE_COLUMNS = "ts, asset, side, size, entry, exit, pnl, reason"
+
+
+def _recent_trade(row):
+	# Columns are declared REAL/TEXT, so sqlite3 already hands back float/str/None.
+	ts, row_asset, side, size, entry, exit_price, pnl, reason = row
+	return {
+		"ts": ts,
+		"asset": row_asset,
+		"side": side,
+		"size": size or 0.0,
+		"entry": entry or 0.0,
+		"exit": exit_price or 0.0,
+		"pnl": pnl or 0.0,
+		"reason": reason or "",
+	}
 
 
 def get_recent_trades_for_asset(asset, limit=12):
@@ -212,34 +508,43 @@ def get_recent_trades_for_asset(asset, limit=12):
 	if not asset:
 		return []
 
-	with sqlite3.connect("trades.db") as conn:
-		rows = conn.execute(
-			"""
-			SELECT ts, asset, side, size, entry, exit, pnl, reason
-			FROM trades
-			WHERE asset = ?
-			ORDER BY ts DESC
-			LIMIT ?
-			""",
-			(str(asset), limit),
-		).fetchall()
+	rows = _read(
+		"trades.db",
+		f"""
+		SELECT {_RECENT_TRADE_COLUMNS}
+		FROM trades
+		WHERE asset = ?
+		ORDER BY ts_ms DESC
+		LIMIT ?
+		""",
+		(str(asset), limit),
+	)
+	return [_recent_trade(row) for row in rows]
 
-	result = []
-	for ts, row_asset, side, size, entry, exit_price, pnl, reason in rows:
-		try:
-			result.append(
-				{
-					"ts": str(ts),
-					"asset": str(row_asset),
-					"side": str(side),
-					"size": float(size or 0.0),
-					"entry": float(entry or 0.0),
-					"exit": float(exit_price or 0.0),
-					"pnl": float(pnl or 0.0),
-					"reason": str(reason or ""),
-				}
-			)
-		except (TypeError, ValueError):
-			continue
 
+def get_recent_trades_for_assets(assets, limit_per_asset=12):
+	# One query for several assets: newest limit_per_asset trades of each, keyed by asset.
+	limit = max(1, int(limit_per_asset))
+	assets = [str(asset) for asset in dict.fromkeys(assets) if asset]
+	result = {asset: [] for asset in assets}
+	if not assets:
+		return result
+
+	rows = _read(
+		"trades.db",
+		f"""
+		SELECT {_RECENT_TRADE_COLUMNS}
+		FROM (
+			SELECT {_RECENT_TRADE_COLUMNS},
+				ROW_NUMBER() OVER (PARTITION BY asset ORDER BY ts_ms DESC) AS rn
+			FROM trades
+			WHERE asset IN ({",".join("?" * len(assets))})
+		)
+		WHERE rn <= ?
+		ORDER BY asset, rn
+		""",
+		(*assets, limit),
+	)
+	for row in rows:
+		result[row[1]].append(_recent_trade(row))
 	return result
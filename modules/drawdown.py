@@ -1,19 +1,10 @@
 import asyncio
-from datetime import datetime, timedelta
+import time
+from collections import deque
+from datetime import datetime
 
 from . import config as cfg
-from .db import load_equity_history_points, save_equity_history_point
-
-
-def _utcnow_iso():
-    return datetime.utcnow().isoformat()
-
-
-def _to_dt(ts_text):
-    try:
-        return datetime.fromisoformat(str(ts_text).replace("Z", "+00:00")).replace(tzinfo=None)
-    except ValueError:
-        return None
+from .db import get_equity_peaks, load_equity_history_points, save_equity_history_point, utcnow_iso
 
 
 def _pct_drawdown(current, peak):
@@ -31,26 +22,61 @@ def drawdown_entries_blocked():
     return bool(cfg.state.get("drawdown_paused", False))
 
 
+EQUITY_HISTORY_MAX_POINTS = 5000
+EQUITY_HISTORY_KEEP_SEC = 8 * 86400
+WEEK_SEC = 7 * 86400
+# With equity unchanged the drawdowns can only shrink (peaks age out, the daily peak resets),
+# so the guard re-evaluates and records a point at least this often, not every tick.
+DD_REFRESH_SEC = 300
+
+# Points of equity_history with strictly decreasing equity (a sliding-window max queue), so the
+# weekly peak is the head once expired points are dropped. Rebuilt whenever the history deque
+# it mirrors is replaced.
+_weekly_peaks = deque()
+_weekly_source = None
+
+
+def _push_weekly(point):
+    while _weekly_peaks and _weekly_peaks[-1][1] <= point[1]:
+        _weekly_peaks.pop()
+    _weekly_peaks.append(point)
+
+
 def _ensure_equity_history_loaded():
-    if cfg.state.get("equity_history"):
+    global _weekly_source
+    history = cfg.state.get("equity_history")
+    if not history:
+        # In memory the history is (epoch seconds, equity) tuples in time order; the DB keeps ISO text.
+        history = cfg.state["equity_history"] = deque(
+            ((item["ts_epoch"], item["equity"]) for item in load_equity_history_points(limit=EQUITY_HISTORY_MAX_POINTS)),
+            maxlen=EQUITY_HISTORY_MAX_POINTS,
+        )
+    if history is _weekly_source:
         return
-    cfg.state["equity_history"] = load_equity_history_points(limit=5000)
+
+    _weekly_peaks.clear()
+    for point in history:
+        _push_weekly(point)
+    # The in-memory history only covers the last EQUITY_HISTORY_KEEP_SEC, so the ATH is seeded
+    # from the whole table in SQLite; from here on it only needs the new point each tick.
+    if _weekly_peaks:
+        ath_peak = float(cfg.state.get("drawdown_ath_peak", 0.0) or 0.0)
+        _, stored_ath = get_equity_peaks((history[-1][0] - WEEK_SEC) * 1000)
+        cfg.state["drawdown_ath_peak"] = max(ath_peak, stored_ath, _weekly_peaks[0][1])
+    _weekly_source = history
 
 
 def _append_equity_point(equity):
-    ts_text = _utcnow_iso()
-    point = {"ts": ts_text, "equity": float(equity)}
-    history = cfg.state.setdefault("equity_history", [])
+    now = time.time()
+    history = cfg.state["equity_history"]
+    point = (now, float(equity))
     history.append(point)
+    _push_weekly(point)
 
-    cutoff = datetime.utcnow() - timedelta(days=8)
-    filtered = []
-    for item in history:
-        dt_value = _to_dt(item.get("ts"))
-        if dt_value is None or dt_value >= cutoff:
-            filtered.append(item)
-    cfg.state["equity_history"] = filtered[-5000:]
-    save_equity_history_point(ts_text, equity)
+    cutoff = history[-1][0] - EQUITY_HISTORY_KEEP_SEC
+    while history[0][0] < cutoff:
+        history.popleft()
+    save_equity_history_point(utcnow_iso(now), equity, int(now * 1000))
 
 
 def evaluate_drawdown_status(equity):
@@ -66,21 +92,15 @@ def evaluate_drawdown_status(equity):
     else:
         daily_peak = max(daily_peak, float(equity))
 
-    history = cfg.state.get("equity_history", [])
-    weekly_cutoff = now - timedelta(days=7)
-    weekly_peak = float(equity)
+    history = cfg.state["equity_history"]
+    # The window also ends at the oldest retained point, as points can leave via maxlen.
+    weekly_cutoff = max(history[-1][0] - WEEK_SEC, history[0][0])
+    while _weekly_peaks[0][0] < weekly_cutoff:
+        _weekly_peaks.popleft()
+    weekly_peak = _weekly_peaks[0][1]
     ath_peak = float(cfg.state.get("drawdown_ath_peak", 0.0) or 0.0)
     ath_peak = max(ath_peak, float(equity))
 
-    for item in history:
-        dt_value = _to_dt(item.get("ts"))
-        if dt_value is None:
-            continue
-        eq = float(item.get("equity", 0.0) or 0.0)
-        if dt_value >= weekly_cutoff:
-            weekly_peak = max(weekly_peak, eq)
-        ath_peak = max(ath_peak, eq)
-
     daily_dd = _pct_drawdown(equity, daily_peak)
     weekly_dd = _pct_drawdown(equity, weekly_peak)
     ath_dd = _pct_drawdown(equity, ath_peak)
@@ -120,7 +140,7 @@ async def _enforce_drawdown_pause(status):
 
     reason = str(status.get("reason") or "unknown")
     cfg.state["drawdown_paused"] = True
-    cfg.state["drawdown_pause_ts"] = _utcnow_iso()
+    cfg.state["drawdown_pause_ts"] = utcnow_iso()
     cfg.state["drawdown_pause_reason"] = (
         f"{reason}: daily={status.get('daily_dd_pct', 0.0):.2f}% "
         f"weekly={status.get('weekly_dd_pct', 0.0):.2f}% ath={status.get('ath_dd_pct', 0.0):.2f}%"
@@ -145,11 +165,19 @@ async def _enforce_drawdown_pause(status):
 
 
 async def drawdown_guard_loop():
+    status = None
+    last_equity = None
+    last_day = None
+    last_eval = 0.0
     while True:
         cfg.reload_hot_config()
         try:
             equity = float(cfg.state.get("equity", 0.0) or 0.0)
-            status = evaluate_drawdown_status(equity)
+            day = int(time.time() // 86400)
+            now = time.monotonic()
+            if status is None or equity != last_equity or day != last_day or now - last_eval >= DD_REFRESH_SEC:
+                status = evaluate_drawdown_status(equity)
+                last_equity, last_day, last_eval = equity, day, now
             if status.get("breached"):
                 await _enforce_drawdown_pause(status)
         except Exception as exc:
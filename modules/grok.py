@@ -1,28 +1,51 @@
 import asyncio
 import json
+import re
 import uuid
 from pathlib import Path
 import os
-from datetime import datetime
+import random
+import time
+from functools import lru_cache
+from threading import local
 import requests
+from requests.adapters import HTTPAdapter
 
 from . import config as cfg
 from .data_quality import evaluate_pre_grok_data_quality
-from .db import get_recent_trades_for_asset, save_trade_event
+from .db import get_recent_trades_for_asset, get_recent_trades_for_assets, save_trade_event, utcnow_iso
 from .drawdown import drawdown_entries_blocked
 from .rest import rest_in_usdc
 from .trade import execute
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _dumps(obj):
+    # Compact JSON text for prompts and state fields.
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), default=str)
+
 
 FEAR_GREED_URL = "https://api.alternative.me/fng/"
 BTC_DOM_URL = "https://api.coingecko.com/api/v3/global"
 COINBASE_TICKER_URL = "https://api.coinbase.com/api/v3/brokerage/products/{product_id}/ticker"
 COINBASE_PRODUCT_URL = "https://api.coinbase.com/api/v3/brokerage/products/{product_id}"
+# How long a fetched signal is reused: FGI is daily, dominance drifts slowly, funding moves.
+FEAR_GREED_TTL_SEC = 300
+BTC_DOM_TTL_SEC = 120
+FUNDING_TTL_SEC = 20
 
 
-def _load_system_prompt():
+def _load_system_prompt(path):
     try:
-        return Path(cfg.SYSTEM_PROMPT_PATH).read_text(encoding="utf-8")
+        return Path(path).read_text(encoding="utf-8")
     except OSError:
         return (
             "You are GrokTrader. Respond only with JSON: "
@@ -30,25 +53,48 @@ def _load_system_prompt():
         )
 
 
-def _build_prompt():
-    template = _load_system_prompt()
-    spikes = cfg.state.get("spike_list") or []
-    rumors_summary = cfg.state.get("rumors_summary") or "none"
-    replacements = {
-        "${total_equity:.2f}": f"${float(cfg.state.get('equity', 0)):.2f}",
-        "{mode}": str(cfg.state.get("mode", "nuclear")),
-        "{aggressive_sleeve:.2f}": f"{float(cfg.state.get('aggr_target', 0)):.2f}",
-        "{aggressive_pct:.0f}": "10",
-        "{safe_sleeve:.2f}": f"{float(cfg.state.get('safe_target', 0)):.2f}",
-        "{last_rebalance or \"never\"}": str(cfg.state.get("last_rebal") or "never"),
-        "{json.dumps(positions_summary, indent=None)}": json.dumps(cfg.state.get("positions", {}), separators=(",", ":")),
-        "{json.dumps(price_cache_summary, indent=None)}": json.dumps(cfg.state.get("price", {}), separators=(",", ":")),
-        "{spike_list or \"none\"}": json.dumps(spikes, separators=(",", ":")) if spikes else "none",
-        "{rumors_summary or \"none\"}": rumors_summary,
+def _compact_prices(prices):
+    # Six significant digits keep sub-cent alts exact enough while trimming long float tails.
+    return {asset: float(f"{price:.6g}") for asset, price in prices.items() if isinstance(price, (int, float))}
+
+
+def _compact_positions(positions):
+    return {
+        asset: {key: value for key, value in position.items() if value} if isinstance(position, dict) else position
+        for asset, position in positions.items()
     }
-    for token, value in replacements.items():
-        template = template.replace(token, value)
-    return template
+
+
+# Placeholders the system prompt file may contain, and how each is filled from state.
+_PROMPT_FIELDS = {
+    "${total_equity:.2f}": lambda st: f"${float(st.get('equity', 0)):.2f}",
+    "{mode}": lambda st: str(st.get("mode", "nuclear")),
+    "{aggressive_sleeve:.2f}": lambda st: f"{float(st.get('aggr_target', 0)):.2f}",
+    "{aggressive_pct:.0f}": lambda st: "10",
+    "{safe_sleeve:.2f}": lambda st: f"{float(st.get('safe_target', 0)):.2f}",
+    "{last_rebalance or \"never\"}": lambda st: str(st.get("last_rebal") or "never"),
+    "{json.dumps(positions_summary, indent=None)}": lambda st: _dumps(_compact_positions(st.get("positions") or {})),
+    "{json.dumps(price_cache_summary, indent=None)}": lambda st: _dumps(_compact_prices(st.get("price") or {})),
+    "{spike_list or \"none\"}": lambda st: _dumps(st.get("spike_list")) if st.get("spike_list") else "none",
+    "{rumors_summary or \"none\"}": lambda st: st.get("rumors_summary") or "none",
+}
+_PROMPT_TOKEN_RE = re.compile("(" + "|".join(map(re.escape, _PROMPT_FIELDS)) + ")")
+
+
+@lru_cache(maxsize=4)
+def _prompt_parts(path, mtime_ns):
+    # Alternating literal text and placeholders; the file is only re-read when its mtime moves.
+    return tuple(_PROMPT_TOKEN_RE.split(_load_system_prompt(path)))
+
+
+def _build_prompt():
+    try:
+        mtime_ns = os.stat(cfg.SYSTEM_PROMPT_PATH).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    parts = _prompt_parts(cfg.SYSTEM_PROMPT_PATH, mtime_ns)
+    st = cfg.state
+    return "".join(part if index % 2 == 0 else _PROMPT_FIELDS[part](st) for index, part in enumerate(parts))
 
 
 def _safe_float(value, default=0.0):
@@ -58,36 +104,34 @@ def _safe_float(value, default=0.0):
         return float(default)
 
 
+_FUNDING_KEYS = ("funding_rate", "current_funding_rate")
+_FUNDING_NESTED_PATHS = (
+    ("product", "future_product_details", "perpetual_details", "funding_rate"),
+    ("product", "future_product_details", "current_funding_rate"),
+    ("future_product_details", "perpetual_details", "funding_rate"),
+    ("future_product_details", "current_funding_rate"),
+)
+
+
 def _funding_rate_from_product_payload(payload):
     if not isinstance(payload, dict):
         return None
 
-    for key in (
-        "funding_rate",
-        "current_funding_rate",
-    ):
-        try:
-            val = payload.get(key)
-            if val is not None:
+    for key in _FUNDING_KEYS:
+        val = payload.get(key)
+        if val is not None:
+            try:
                 return float(val)
-        except (TypeError, ValueError):
-            pass
+            except (TypeError, ValueError):
+                pass
 
-    nested_paths = [
-        ("product", "future_product_details", "perpetual_details", "funding_rate"),
-        ("product", "future_product_details", "current_funding_rate"),
-        ("future_product_details", "perpetual_details", "funding_rate"),
-        ("future_product_details", "current_funding_rate"),
-    ]
-    for path in nested_paths:
+    for path in _FUNDING_NESTED_PATHS:
         node = payload
-        ok = True
         for step in path:
-            if not isinstance(node, dict) or step not in node:
-                ok = False
+            node = node.get(step) if isinstance(node, dict) else None
+            if node is None:
                 break
-            node = node.get(step)
-        if not ok:
+        if node is None:
             continue
         try:
             return float(node)
@@ -108,8 +152,23 @@ def _funding_rate_from_ticker_payload(payload):
     return None
 
 
+# A pooled session per to_thread worker for the free-signal endpoints, so repeat fetches
+# reuse keep-alive TLS connections. requests does not promise a Session is thread-safe, and
+# the regime fetches run concurrently, so workers never share one.
+_http_local = local()
+
+
+def _http_session():
+    session = getattr(_http_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=8))
+        _http_local.session = session
+    return session
+
+
 def _http_get_json(url, timeout_sec):
-    response = requests.get(url, timeout=timeout_sec)
+    response = _http_session().get(url, timeout=timeout_sec)
     response.raise_for_status()
     return response.json()
 
@@ -118,55 +177,87 @@ async def _fetch_json_url(url, timeout_sec):
     return await asyncio.to_thread(_http_get_json, url, timeout_sec)
 
 
-async def fetch_free_regime_signals(asset=None):
-    timeout_sec = int(cfg.GROK_FREE_SIGNALS_TIMEOUT_SEC or 6)
-    signals = {
-        "fear_greed": 50,
-        "fear_greed_class": "neutral",
-        "btc_dominance": 55.0,
-        "funding_rate": None,
-        "funding_rate_pct": None,
-        "funding_source": "unavailable",
+# url -> (monotonic fetch time, payload). Only successful fetches are stored.
+_json_cache = {}
+_json_locks = {}
+
+
+async def _fetch_json_cached(url, ttl_sec, timeout_sec):
+    cached = _json_cache.get(url)
+    if cached is not None and time.monotonic() - cached[0] < ttl_sec:
+        return cached[1]
+    # Callers waiting on an expired entry share the one fetch instead of each starting their own.
+    async with _json_locks.setdefault(url, asyncio.Lock()):
+        cached = _json_cache.get(url)
+        if cached is not None and time.monotonic() - cached[0] < ttl_sec:
+            return cached[1]
+        data = await _fetch_json_url(url, timeout_sec)
+        _json_cache[url] = (time.monotonic(), data)
+        return data
+
+
+async def _fetch_fear_greed(timeout_sec):
+    data = await _fetch_json_cached(FEAR_GREED_URL, FEAR_GREED_TTL_SEC, timeout_sec)
+    row = ((data or {}).get("data") or [])[0]
+    return {
+        "fear_greed": int(row.get("value", 50)),
+        "fear_greed_class": str(row.get("value_classification", "neutral")).lower(),
     }
 
-    try:
-        data = await _fetch_json_url(FEAR_GREED_URL, timeout_sec)
-        row = ((data or {}).get("data") or [])[0]
-        signals["fear_greed"] = int(row.get("value", 50))
-        signals["fear_greed_class"] = str(row.get("value_classification", "neutral")).lower()
-    except Exception:
-        pass
 
+async def _fetch_btc_dominance(timeout_sec):
+    data = await _fetch_json_cached(BTC_DOM_URL, BTC_DOM_TTL_SEC, timeout_sec)
+    dominance = (((data or {}).get("data") or {}).get("market_cap_percentage") or {}).get("btc")
+    if dominance is None:
+        return {}
+    return {"btc_dominance": round(float(dominance), 2)}
+
+
+async def _fetch_funding(asset, timeout_sec):
+    funding_rate = None
+    source = None
     try:
-        data = await _fetch_json_url(BTC_DOM_URL, timeout_sec)
-        dominance = (((data or {}).get("data") or {}).get("market_cap_percentage") or {}).get("btc")
-        if dominance is not None:
-            signals["btc_dominance"] = round(float(dominance), 2)
+        data = await _fetch_json_cached(COINBASE_TICKER_URL.format(product_id=asset), FUNDING_TTL_SEC, timeout_sec)
+        funding_rate = _funding_rate_from_ticker_payload(data or {})
+        source = "coinbase_ticker"
     except Exception:
         pass
 
-    if asset:
-        funding_rate = None
+    if funding_rate is None:
         try:
-            data = await _fetch_json_url(COINBASE_TICKER_URL.format(product_id=asset), timeout_sec)
-            funding_rate = _funding_rate_from_ticker_payload(data or {})
-            if funding_rate is not None:
-                signals["funding_source"] = "coinbase_ticker"
+            data = await _fetch_json_cached(COINBASE_PRODUCT_URL.format(product_id=asset), FUNDING_TTL_SEC, timeout_sec)
+            funding_rate = _funding_rate_from_product_payload(data or {})
+            source = "coinbase_product"
         except Exception:
             pass
 
-        if funding_rate is None:
-            try:
-                data = await _fetch_json_url(COINBASE_PRODUCT_URL.format(product_id=asset), timeout_sec)
-                funding_rate = _funding_rate_from_product_payload(data or {})
-                if funding_rate is not None:
-                    signals["funding_source"] = "coinbase_product"
-            except Exception:
-                pass
+    if funding_rate is None:
+        return {}
+    return {
+        "funding_rate": funding_rate,
+        "funding_rate_pct": float(funding_rate) * 100.0,
+        "funding_source": source,
+    }
 
-        if funding_rate is not None:
-            signals["funding_rate"] = funding_rate
-            signals["funding_rate_pct"] = float(funding_rate) * 100.0
+
+async def fetch_free_regime_signals(asset=None):
+    timeout_sec = int(cfg.GROK_FREE_SIGNALS_TIMEOUT_SEC or 6)
+    signals = {
+        "fear_greed": 50,
+        "fear_greed_class": "neutral",
+        "btc_dominance": 55.0,
+        "funding_rate": None,
+        "funding_rate_pct": None,
+        "funding_source": "unavailable",
+    }
+
+    # The sources are independent, so they are fetched concurrently; a failed one keeps its defaults.
+    fetches = [_fetch_fear_greed(timeout_sec), _fetch_btc_dominance(timeout_sec)]
+    if asset:
+        fetches.append(_fetch_funding(asset, timeout_sec))
+    for updates in await asyncio.gather(*fetches, return_exceptions=True):
+        if isinstance(updates, dict):
+            signals.update(updates)
 
     return signals
 
@@ -194,17 +285,26 @@ def _funding_filter_block_reason(decision, signals):
 
 
 def _extract_json_payload(raw_text):
+    # Usually the reply is a bare JSON object, which parses as-is (surrounding whitespace included).
+    try:
+        payload = _loads(raw_text or "")
+    except (TypeError, ValueError):
+        payload = None
+    if isinstance(payload, dict):
+        return payload
+
     text = (raw_text or "").strip()
     if not text:
         raise json.JSONDecodeError("Empty response", text, 0)
-    if text.startswith("{") and text.endswith("}"):
-        return json.loads(text)
 
     start = text.find("{")
     end = text.rfind("}")
     if start == -1 or end == -1 or end <= start:
         raise json.JSONDecodeError("No JSON object found", text, 0)
-    return json.loads(text[start : end + 1])
+    return _loads(text[start : end + 1])
+
+
+_SLEEVES = {"aggressive": "aggressive", "safe": "safe", "any": "any"}
 
 
 def _normalize_decision(payload):
@@ -219,11 +319,9 @@ def _normalize_decision(payload):
         "trailing_pct": payload.get("trailing_pct"),
         "expected_hold_min": payload.get("expected_hold_min"),
         "pump_score": payload.get("pump_score", 0),
-        "sleeve": str(payload.get("sleeve", "any")).strip().lower(),
+        "sleeve": _SLEEVES.get(str(payload.get("sleeve", "any")).strip().lower(), "any"),
         "reason": str(payload.get("reason", "")).strip()[:240],
     }
-    if decision["sleeve"] not in {"aggressive", "safe", "any"}:
-        decision["sleeve"] = "any"
     return decision
 
 
@@ -332,10 +430,12 @@ def _whale_flow_for_asset(asset):
     }
 
 
-def _recent_trade_memory(assets, limit_per_asset):
+def _recent_trade_memory(assets, limit_per_asset, trade_rows):
+    # trade_rows collects the raw rows per asset so later steps of the same cycle can reuse them.
     memory = {}
+    trade_rows.update(get_recent_trades_for_assets(assets, limit_per_asset))
     for asset in assets:
-        rows = get_recent_trades_for_asset(asset, limit=limit_per_asset)
+        rows = trade_rows.get(asset)
         if not rows:
             continue
         compact = []
@@ -363,12 +463,6 @@ async def _grok_json_call(prompt, temperature=0.2):
 
 
 async def grok_decision():
-    cfg.reload_hot_config()
-    cfg.state["parked"] = os.path.exists(cfg.PARK_FLAG)
-    if cfg.state["parked"]:
-        cfg.logger.info("Decision cycle skipped: bot is parked")
-        return
-
     if drawdown_entries_blocked():
         cfg.logger.warning(
             "Decision cycle skipped: drawdown pause active (%s)",
@@ -378,7 +472,8 @@ async def grok_decision():
         return
 
     gate = evaluate_pre_grok_data_quality()
-    cfg.state["data_quality_last_check_ts"] = datetime.utcnow().isoformat()
+    checked_ts = utcnow_iso()
+    cfg.state["data_quality_last_check_ts"] = checked_ts
     if not gate.get("ok", False):
         payload = {
             "reason": gate.get("reason"),
@@ -386,12 +481,12 @@ async def grok_decision():
             "action": "hold_rest_usdc",
         }
         cfg.state["data_quality_last_ok"] = False
-        cfg.state["data_quality_last_reason"] = json.dumps(payload, separators=(",", ":"))[:240]
+        cfg.state["data_quality_last_reason"] = _dumps(payload)[:240]
         cfg.state["last_decision"] = "hold"
         cfg.state["last_decision_asset"] = None
         cfg.state["last_decision_reason"] = f"data_quality_gate:{gate.get('reason')}"[:180]
-        cfg.state["last_decision_ts"] = datetime.utcnow().isoformat()
-        cfg.logger.warning("Data-quality gate rejected decision cycle: %s", json.dumps(payload, separators=(",", ":")))
+        cfg.state["last_decision_ts"] = checked_ts
+        cfg.logger.warning("Data-quality gate rejected decision cycle: %s", _dumps(payload))
         await rest_in_usdc()
         return
 
@@ -408,7 +503,9 @@ async def grok_decision():
     try:
         momentum = _equity_momentum_profile()
         focus_assets = list(cfg.state.get("basket", []))[:8]
-        recent_memory = _recent_trade_memory(focus_assets, int(cfg.GROK_CONTEXT_RECENT_TRADES or 12))
+        recent_limit = int(cfg.GROK_CONTEXT_RECENT_TRADES or 12)
+        trade_rows = {}
+        recent_memory = _recent_trade_memory(focus_assets, recent_limit, trade_rows)
         proposal_signals = await fetch_free_regime_signals(None)
         mtf_focus = {asset: (cfg.state.get("mtf_cache", {}).get(asset) or {}) for asset in focus_assets}
         micro_focus = {asset: (cfg.state.get("micro_cache", {}).get(asset) or {}) for asset in focus_assets}
@@ -417,27 +514,34 @@ async def grok_decision():
             f"{prompt_base}\n\n"
             "Use the context below and output STRICT JSON only (no markdown).\n"
             "Schema: {\"decision\":\"open_long|open_short|close|hold\",\"asset\":string|null,\"leverage\":int,\"contracts\":number|null,\"stop\":number|null,\"take_profit\":number|null,\"trailing_activation_pct\":number|null,\"trailing_pct\":number|null,\"expected_hold_min\":int|null,\"pump_score\":int,\"sleeve\":\"aggressive|safe|any\",\"reason\":string}.\n"
-            f"Regime signals: {json.dumps(proposal_signals, separators=(',', ':'))}\n"
-            f"Equity curve momentum (last 14 days): {json.dumps(momentum.get('recent_returns', []), separators=(',', ':'))}\n"
+            f"Regime signals: {_dumps(proposal_signals)}\n"
+            f"Equity curve momentum (last 14 days): {_dumps(momentum.get('recent_returns', []))}\n"
             "Momentum rules:\n"
             "- If 7-day return < -8%, force max risk 4% and only highest conviction (>=85).\n"
             "- If 7-day return > +15%, allow up to 15% risk only on exceptional setups.\n"
             "- Otherwise keep normal risk rules.\n"
-            f"Current momentum profile: {json.dumps(momentum, separators=(',', ':'))}\n"
+            f"Current momentum profile: {_dumps(momentum)}\n"
             f"Whale flow last 4h: {str(cfg.state.get('whale_summary') or 'none')[:700]}\n"
             "Whale rules: if whale accumulation on chosen asset, conviction +20. If distribution/large sell, conviction -30 or reject.\n"
             "Pyramiding policy: you may allow pyramiding up to 2 adds only if price reaches >=1.5R, conviction remains >=80, and total exposure after add stays <=18% equity.\n"
-            f"Multi-timeframe (1h/4h) EMA20 alignment for top assets: {json.dumps(mtf_focus, separators=(',', ':'))}\n"
-            f"Order book + tape microstructure (top assets): {json.dumps(micro_focus, separators=(',', ':'))}\n"
+            f"Multi-timeframe (1h/4h) EMA20 alignment for top assets: {_dumps(mtf_focus)}\n"
+            f"Order book + tape microstructure (top assets): {_dumps(micro_focus)}\n"
             "Microstructure rules: if microstructure fields are null/missing, treat as unavailable (do NOT reject solely for missing micro data). If microstructure strongly conflicts with direction, lower conviction heavily or choose hold.\n"
             "MTF tolerance: if 1h is above EMA20 but 4h is within ~0.25% below EMA20 (see ema20_4h_dist_pct), you may proceed only with reduced conviction and leverage <= 3.\n"
-            f"Recent trade memory (top assets): {json.dumps(recent_memory, separators=(',', ':'))}\n"
-            f"Live prices: {json.dumps(cfg.state.get('price', {}), separators=(',', ':'))}\n"
+            f"Recent trade memory (top assets): {_dumps(recent_memory)}\n"
+            f"Live prices: {_dumps(_compact_prices(cfg.state.get('price') or {}))}\n"
         )
 
         decision = _normalize_decision(await _grok_json_call(proposal_prompt, temperature=0.25))
         asset = decision.get("asset")
-        asset_signals = await fetch_free_regime_signals(asset)
+        if bool(cfg.GROK_SELF_CRITIQUE_ENABLED) and asset and asset not in trade_rows:
+            # The critique also needs this asset's trades; read them while the signals are in flight.
+            asset_signals, trade_rows[asset] = await asyncio.gather(
+                fetch_free_regime_signals(asset),
+                asyncio.to_thread(get_recent_trades_for_asset, asset, recent_limit),
+            )
+        else:
+            asset_signals = await fetch_free_regime_signals(asset)
         cfg.state["last_regime_signals"] = asset_signals
 
         critique = {
@@ -449,7 +553,7 @@ async def grok_decision():
         }
 
         if bool(cfg.GROK_SELF_CRITIQUE_ENABLED):
-            exact_memory = get_recent_trades_for_asset(asset, limit=int(cfg.GROK_CONTEXT_RECENT_TRADES or 12)) if asset else []
+            exact_memory = trade_rows.get(asset, []) if asset else []
             asset_ctx = _asset_context(asset)
 
             critique_prompt = (
@@ -458,7 +562,7 @@ async def grok_decision():
                 "Schema: {\"approve\":bool,\"conviction\":0-100,\"major_flaws\":[string],\"notes\":string,\"revised_decision\":object|null}.\n"
                 "Set approve=true only if edge is clear, risk is justified, and no major flaws remain.\n"
                 f"Minimum required conviction: {int(momentum.get('min_conviction', cfg.GROK_MIN_CRITIQUE_CONVICTION or 78))}\n"
-                f"Momentum profile: {json.dumps(momentum, separators=(',', ':'))}\n"
+                f"Momentum profile: {_dumps(momentum)}\n"
                 f"Funding rate for {asset or 'asset'}: {asset_signals.get('funding_rate_pct')}%\n"
                 f"Funding rules: never open long if funding > +{float(cfg.GROK_FUNDING_BLOCK_LONG_PCT or 0.08):.4f}%; never open short if funding < {float(cfg.GROK_FUNDING_BLOCK_SHORT_PCT or -0.08):.4f}%; strong bias against fighting funding direction.\n"
                 f"Whale flow last 4h: {str(cfg.state.get('whale_summary') or 'none')[:700]}\n"
@@ -466,10 +570,10 @@ async def grok_decision():
                 "Pyramiding policy check: adds are valid only if >=1.5R, conviction>=80, max 2 adds, and exposure after add <=18% equity.\n"
                 "Microstructure rules: if microstructure fields are null/missing, treat as unavailable (do NOT reject solely for missing micro data). Conflicting microstructure should reduce conviction materially.\n"
                 "MTF tolerance: allow only limited exceptions when 4h is within ~0.25% below EMA20, and require leverage <= 3.\n"
-                f"Proposal: {json.dumps(decision, separators=(',', ':'))}\n"
-                f"Asset context: {json.dumps(asset_ctx, separators=(',', ':'))}\n"
-                f"Exact recent trades on this asset: {json.dumps(exact_memory, separators=(',', ':'))}\n"
-                f"Regime signals: {json.dumps(asset_signals, separators=(',', ':'))}\n"
+                f"Proposal: {_dumps(decision)}\n"
+                f"Asset context: {_dumps(asset_ctx)}\n"
+                f"Exact recent trades on this asset: {_dumps(exact_memory)}\n"
+                f"Regime signals: {_dumps(asset_signals)}\n"
                 f"Rumors summary: {str(cfg.state.get('rumors_summary') or 'none')[:600]}\n"
             )
             critique = _normalize_critique(await _grok_json_call(critique_prompt, temperature=0.15))
@@ -502,7 +606,7 @@ async def grok_decision():
                 cfg.state["last_decision_reason"] = (
                     f"critique_reject:{int(critique.get('conviction', 0))}:{';'.join(critique.get('major_flaws', []))}"
                 )[:180]
-                cfg.state["last_decision_ts"] = datetime.utcnow().isoformat()
+                cfg.state["last_decision_ts"] = utcnow_iso()
                 return
             if whale_reject:
                 cfg.logger.warning("Decision rejected by whale flow: distribution bias on %s", decision.get("asset"))
@@ -510,7 +614,7 @@ async def grok_decision():
                 cfg.state["last_decision"] = "hold"
                 cfg.state["last_decision_asset"] = decision.get("asset")
                 cfg.state["last_decision_reason"] = "whale_flow_distribution_reject"
-                cfg.state["last_decision_ts"] = datetime.utcnow().isoformat()
+                cfg.state["last_decision_ts"] = utcnow_iso()
                 return
 
             revised = critique.get("revised_decision")
@@ -533,7 +637,7 @@ async def grok_decision():
             cfg.state["last_decision"] = "hold"
             cfg.state["last_decision_asset"] = asset
             cfg.state["last_decision_reason"] = f"funding_filter:{funding_block}"[:180]
-            cfg.state["last_decision_ts"] = datetime.utcnow().isoformat()
+            cfg.state["last_decision_ts"] = utcnow_iso()
             save_trade_event(
                 event_id=str(uuid.uuid4()),
                 ts=cfg.state["last_decision_ts"],
@@ -556,7 +660,7 @@ async def grok_decision():
         cfg.state["last_decision_reason"] = (
             f"{str(decision.get('reason') or '')[:120]} | conv={int(critique.get('conviction', 100))}"
         )[:180]
-        cfg.state["last_decision_ts"] = datetime.utcnow().isoformat()
+        cfg.state["last_decision_ts"] = utcnow_iso()
         cfg.logger.info(
             "Decision received: decision=%s asset=%s sleeve=%s pump_score=%s",
             decision.get("decision"),
@@ -597,15 +701,27 @@ async def grok_decision():
         cfg.state["last_decision"] = "error"
         cfg.state["last_decision_asset"] = None
         cfg.state["last_decision_reason"] = str(exc)[:180]
-        cfg.state["last_decision_ts"] = datetime.utcnow().isoformat()
+        cfg.state["last_decision_ts"] = utcnow_iso()
         cfg.logger.error("Grok error: %s", exc)
         await rest_in_usdc()
 
 
 async def decision_loop():
     while True:
-        await grok_decision()
-        await asyncio.sleep(cfg.DECISION_INTERVAL_SEC if not cfg.state["parked"] else cfg.PARKED_DECISION_INTERVAL_SEC)
+        # The reload is mtime-cached, so a parked tick costs two stats and picks up a moved
+        # PARK_FLAG without relying on other loops. The decision gates wait for unpark.
+        cfg.reload_hot_config()
+        cfg.state["parked"] = os.path.exists(cfg.PARK_FLAG)
+        if cfg.state["parked"]:
+            cfg.logger.info("Decision cycle skipped: bot is parked")
+        else:
+            try:
+                await grok_decision()
+            except Exception as exc:
+                cfg.logger.error("Decision cycle error: %s", exc)
+        interval = cfg.PARKED_DECISION_INTERVAL_SEC if cfg.state["parked"] else cfg.DECISION_INTERVAL_SEC
+        # Jitter keeps several bot instances from hitting the same APIs in lockstep.
+        await asyncio.sleep(interval * random.uniform(0.9, 1.1))
 
 
 async def grok_loop():
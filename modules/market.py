@@ -1,5 +1,7 @@
 import asyncio
+import sys
 import time
+from collections import deque
 from datetime import datetime, timedelta, timezone
 import requests
 
@@ -165,7 +167,7 @@ async def update_basket():
         previous = set(cfg.state["basket"])
         current = set(new_basket)
         if new_basket != cfg.state["basket"]:
-            cfg.state["basket"] = new_basket
+            cfg.state["basket"] = list(map(sys.intern, new_basket))
             cfg.state["basket_ver"] += 1
             cfg.state["new_alts"] = sorted(current - previous)
             cfg.logger.info(
@@ -254,7 +256,9 @@ async def update_basket():
     current = set(new_basket)
 
     if new_basket != cfg.state["basket"]:
-        cfg.state["basket"] = new_basket
+        # Basket symbols key price/price_ts/vol_cache/... for the rest of the run; interning
+        # them once here makes every later lookup an identity hit.
+        cfg.state["basket"] = list(map(sys.intern, new_basket))
         cfg.state["basket_ver"] += 1
         cfg.state["new_alts"] = sorted(current - previous)
         if universe in {"spot", "all"} and spot_ccxt_enabled:
@@ -627,11 +631,12 @@ async def start_websockets():
                 if price_raw is not None:
                     price_value = float(price_raw)
                     cfg.state["price"][product_id] = price_value
-                    cfg.state["price_ts"][product_id] = datetime.now(timezone.utc).isoformat()
-                    history = cfg.state["price_history"].setdefault(product_id, [])
+                    cfg.state["price_ts"][product_id] = time.time()
+                    histories = cfg.state["price_history"]
+                    history = histories.get(product_id)
+                    if history is None:
+                        history = histories[product_id] = deque(maxlen=240)
                     history.append(price_value)
-                    if len(history) > 240:
-                        del history[:-240]
 
                     pricebook = _read_attr(product, "pricebook", {})
                     best_bid = _to_float(_read_attr(product, "best_bid"))
@@ -1,4 +1,5 @@
 from datetime import datetime
+from itertools import islice
 
 from . import config as cfg
 
@@ -22,7 +23,8 @@ def _select_asset():
 
 def classify_regime():
     asset = _select_asset()
-    history = (cfg.state.get("price_history", {}).get(asset) or [])[-int(cfg.REGIME_LOOKBACK_POINTS):]
+    points = cfg.state.get("price_history", {}).get(asset) or ()
+    history = list(islice(points, max(0, len(points) - int(cfg.REGIME_LOOKBACK_POINTS)), None))
 
     if len(history) < 20:
         cfg.state["regime"] = "chop"
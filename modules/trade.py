@@ -523,14 +523,7 @@ def _evaluate_entry_gate(decision, asset, sleeve, pump_score, entry, stop, take_
 
 
 def _hours_since_started():
-    started_at = state.get("started_at")
-    if not started_at:
-        return 0.0
-    try:
-        started = datetime.fromisoformat(str(started_at).replace("Z", "+00:00")).replace(tzinfo=None)
-    except ValueError:
-        return 0.0
-    return max(0.0, (datetime.utcnow() - started).total_seconds() / 3600.0)
+    return max(0.0, (datetime.utcnow() - cfg.started_at_dt).total_seconds() / 3600.0)
 
 
 def _readiness_ready():
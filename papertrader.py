@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 import argparse
 import asyncio
-import json
 import os
 import sqlite3
 import sys
@@ -11,6 +10,7 @@ from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Set
 
 import websockets
+from modules.console_wire import MAX_FRAME_BYTES, SnapshotStream
 from modules.single_instance import SingleInstanceError, SingleInstanceLock
 
 
@@ -46,6 +46,7 @@ class PaperTraderLogger:
         self.last_decision_key: str = ""
         self.last_heartbeat: Optional[datetime] = None
         self._ws = None
+        self._stream = SnapshotStream()
         self._ws_fail_streak: int = 0
         self._ws_connected_once: bool = False
 
@@ -78,6 +79,7 @@ class PaperTraderLogger:
         except Exception:
             pass
         self._ws = None
+        self._stream = SnapshotStream()
 
     def _warn_ws_issue(self, message: str) -> None:
         if self._ws_fail_streak == 1 or self._ws_fail_streak % 12 == 0:
@@ -87,7 +89,9 @@ class PaperTraderLogger:
         if self._ws is not None:
             return True
         try:
-            self._ws = await websockets.connect(self.ws_url, open_timeout=2.0, ping_interval=None)
+            self._ws = await websockets.connect(
+                self.ws_url, open_timeout=2.0, ping_interval=None, max_size=MAX_FRAME_BYTES
+            )
             if not self._ws_connected_once:
                 self._write_line(f"WS_CONNECTED url={self.ws_url}")
                 self._ws_connected_once = True
@@ -103,17 +107,21 @@ class PaperTraderLogger:
         if not await self._ensure_ws():
             return None
         try:
-            raw = await asyncio.wait_for(self._ws.recv(), timeout=max(3.0, self.interval_sec * 3.0))
-            data = json.loads(raw)
-            if isinstance(data, dict):
-                self._ws_fail_streak = 0
-                return data
+            timeout = max(3.0, self.interval_sec * 3.0)
+            while True:
+                raw = await asyncio.wait_for(self._ws.recv(), timeout=timeout)
+                if self._stream.feed(raw):
+                    break
+                if self._stream.request_resync:
+                    self._stream.request_resync = False
+                    await self._ws.send("resync")
+            self._ws_fail_streak = 0
+            return dict(self._stream.snapshot)
         except Exception:
             await self._close_ws()
             self._ws_fail_streak += 1
             self._warn_ws_issue("snapshot unavailable")
             return None
-        return None
 
     def _existing_closed_trade_ids(self) -> Set[str]:
         if not os.path.exists("trades.db"):
@@ -25,10 +25,13 @@ def _load_events(db_path, decision_id=None, trade_id=None, limit=200):
     params.append(max(1, int(limit)))
 
     with sqlite3.connect(db_path) as conn:
-        conn.execute(
-            "CREATE TABLE IF NOT EXISTS trade_events (event_id TEXT PRIMARY KEY, ts TEXT NOT NULL, event_type TEXT NOT NULL, decision_id TEXT, trade_id TEXT, asset TEXT, payload TEXT NOT NULL)"
-        )
-        rows = conn.execute(sql, tuple(params)).fetchall()
+        try:
+            rows = conn.execute(sql, tuple(params)).fetchall()
+        except sqlite3.OperationalError as exc:
+            # A bot that never ran has no trade_events table yet; that is just an empty replay.
+            if "no such table" not in str(exc):
+                raise
+            rows = []
 
     events = []
     for row in rows:
@@ -62,11 +62,11 @@ def main() -> int:
         if args.wipe_history:
             _exec(
                 "trades.db",
-                "CREATE TABLE IF NOT EXISTS trades (id TEXT PRIMARY KEY, ts TEXT, asset TEXT, side TEXT, size REAL, entry REAL, exit REAL, pnl REAL, pnl_gross REAL, fee_cost REAL, funding_cost REAL, reason TEXT)",
+                "CREATE TABLE IF NOT EXISTS trades (id TEXT PRIMARY KEY, ts TEXT, asset TEXT, side TEXT, size REAL, entry REAL, exit REAL, pnl REAL, pnl_gross REAL, fee_cost REAL, funding_cost REAL, reason TEXT, ts_ms INTEGER)",
             )
             _exec(
                 "trades.db",
-                "CREATE TABLE IF NOT EXISTS trade_events (event_id TEXT PRIMARY KEY, ts TEXT NOT NULL, event_type TEXT NOT NULL, decision_id TEXT, trade_id TEXT, asset TEXT, payload TEXT NOT NULL)",
+                "CREATE TABLE IF NOT EXISTS trade_events (event_id TEXT PRIMARY KEY, ts TEXT NOT NULL, event_type TEXT NOT NULL, decision_id TEXT, trade_id TEXT, asset TEXT, payload TEXT NOT NULL, ts_ms INTEGER)",
             )
             _exec("trades.db", "DELETE FROM trades")
             _exec("trades.db", "DELETE FROM trade_events")
@@ -75,7 +75,7 @@ def main() -> int:
         # Reset equity curve for a clean simulation run; keep portfolio 'state' by default.
         _exec(
             "portfolio.db",
-            "CREATE TABLE IF NOT EXISTS equity_history (id INTEGER PRIMARY KEY AUTOINCREMENT, ts TEXT NOT NULL, equity REAL NOT NULL)",
+            "CREATE TABLE IF NOT EXISTS equity_history (id INTEGER PRIMARY KEY AUTOINCREMENT, ts TEXT NOT NULL, equity REAL NOT NULL, ts_ms INTEGER)",
         )
         _exec("portfolio.db", "DELETE FROM equity_history")
 
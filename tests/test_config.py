@@ -0,0 +1,37 @@
+import ast
+
+from conftest import ROOT
+from modules import config as cfg
+
+
+def _config_names_used():
+    # Every cfg.<name> read and every `from .config import <name>` across the app.
+    used = set()
+    for path in [*ROOT.glob("*.py"), *(ROOT / "modules").glob("*.py")]:
+        if path.name == "config.py":
+            continue
+        for node in ast.walk(ast.parse(path.read_text(encoding="utf-8"))):
+            if isinstance(node, ast.ImportFrom) and (node.module or "").split(".")[-1] == "config":
+                used.update((path.name, alias.name) for alias in node.names)
+            elif (
+                isinstance(node, ast.Attribute)
+                and isinstance(node.ctx, ast.Load)
+                and isinstance(node.value, ast.Name)
+                and node.value.id == "cfg"
+            ):
+                used.add((path.name, node.attr))
+    return used
+
+
+def test_init_publishes_every_name_the_modules_read():
+    cfg._init_module_config()
+    used = _config_names_used()
+    assert ("trade.py", "started_at_dt") in used
+    missing = sorted((path, name) for path, name in used if not hasattr(cfg, name))
+    assert missing == []
+
+
+def test_config_names_are_assigned_by_init():
+    cfg._init_module_config()
+    for name in cfg._CONFIG_NAMES:
+        assert name in vars(cfg), name
@@ -0,0 +1,22 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+
+from modules import grok
+
+
+def test_http_session_is_reused_within_a_thread():
+    assert grok._http_session() is grok._http_session()
+
+
+def test_concurrent_workers_never_share_a_session():
+    barrier = Barrier(3)
+
+    def worker():
+        # Hold all three threads alive together, as the gathered regime fetches do.
+        session = grok._http_session()
+        barrier.wait(timeout=5)
+        return session
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        sessions = [future.result() for future in [pool.submit(worker) for _ in range(3)]]
+    assert len({id(session) for session in sessions}) == 3
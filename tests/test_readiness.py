@@ -0,0 +1,37 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from modules import config as cfg
+from modules import console_ws, trade
+
+
+@pytest.fixture(autouse=True)
+def _config(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    cfg._init_module_config()
+
+
+def test_snapshot_builds_against_initialised_config():
+    snapshot = console_ws._snapshot()
+    assert snapshot["started_at"] == cfg.state["started_at"]
+    assert snapshot["readiness_hours"] == cfg.READINESS_HOURS
+    assert isinstance(snapshot["ready_to_trade"], bool)
+
+
+def test_readiness_waits_for_readiness_hours(monkeypatch):
+    monkeypatch.setattr(cfg, "READINESS_HOURS", 2.0)
+    monkeypatch.setattr(cfg, "started_at_dt", datetime.utcnow() - timedelta(hours=1))
+    assert trade._readiness_ready() is False
+    assert cfg.state["ready_to_trade"] is False
+    assert console_ws._snapshot()["ready_to_trade"] is False
+
+    monkeypatch.setattr(cfg, "started_at_dt", datetime.utcnow() - timedelta(hours=3))
+    assert trade._readiness_ready() is True
+    assert cfg.state["ready_to_trade"] is True
+    assert console_ws._snapshot()["ready_to_trade"] is True
+
+
+def test_readiness_disabled_is_always_ready(monkeypatch):
+    monkeypatch.setattr(cfg, "READINESS_HOURS", 0)
+    assert trade._readiness_ready() is True